@@ -0,0 +1,95 @@
+"""
+Micro-benchmark for the transcript normalizer.
+
+Compares the original join + multi-pass regex cleaner with the translate-based
+segment normalizer and with TranscriptSegments.from_raw_segments, which the
+transcript node uses, on synthetic 1h, 5h and 10h transcripts, and checks that
+all three produce identical text. Transcripts are generated both as pure ASCII
+and with non-ASCII characters mixed in, since the normalizer has a separate
+path for each.
+
+Run from the repository root:
+
+    python -m benchmarks.transcript_normalizer_benchmark
+"""
+import argparse
+import random
+import re
+import timeit
+from typing import Dict, List
+from src.youtube_assistant.transcript import TranscriptSegments, normalize_segments
+
+
+WORDS = [
+    "the", "model", "attention", "gradient", "we're", "so", "basically", "transformer",
+    "layer", "you", "know", "token", "embedding", "it's", "right", "loss", "training",
+    "data", "café", "naïve", "100%", "$5", "e.g.", "state-of-the-art", "Q&A", "—"
+]
+NOISE = ["[Music]", "[Applause]", "♪", ">>", "(laughs)", "\n", "  "]
+
+
+def legacy_clean(segments: List[Dict]) -> str:
+    """The cleaner as it was before the single-pass normalizer."""
+    text = "\n".join(subtitle.get('text', '').strip()
+                     for subtitle in segments
+                     if subtitle.get('text'))
+    if not text:
+        return ""
+
+    text = re.sub(r'\n\s*\n', '\n', text)
+    text = re.sub(r'[^\w\s.,!?-]', '', text)
+    text = ' '.join(text.split())
+    return text
+
+
+def synthetic_transcript(hours: float, ascii_only: bool = False, seed: int = 42) -> List[Dict]:
+    """Build auto-caption style segments of roughly two seconds each."""
+    rng = random.Random(seed)
+    vocabulary = [word for word in WORDS if word.isascii()] if ascii_only else WORDS
+    noise = [item for item in NOISE if item.isascii()] if ascii_only else NOISE
+    segments = []
+    start = 0.0
+
+    while start < hours * 3600:
+        words = rng.choices(vocabulary, k=rng.randint(4, 12))
+        if rng.random() < 0.1:
+            words.insert(rng.randrange(len(words)), rng.choice(noise))
+        duration = rng.uniform(1.0, 3.0)
+        segments.append({'text': ' '.join(words) + rng.choice(["", ".", ",", "?", "!"]),
+                         'start': round(start, 3),
+                         'duration': round(duration, 3)})
+        start += duration
+
+    return segments
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best one is reported")
+    args = parser.parse_args()
+
+    print(f"{'length':>7} {'charset':>8} {'segments':>9} {'legacy ms':>10} {'normalizer ms':>14} {'speedup':>8} "
+          f"{'segment store ms':>17} {'speedup':>8}")
+
+    for hours in (1, 5, 10):
+        for ascii_only in (True, False):
+            segments = synthetic_transcript(hours, ascii_only=ascii_only)
+            charset = "ascii" if ascii_only else "mixed"
+
+            if legacy_clean(segments) != normalize_segments(segments):
+                raise AssertionError(f"Normalizer output differs from the legacy cleaner for {hours}h {charset} transcript")
+            if legacy_clean(segments) != TranscriptSegments.from_raw_segments(segments).text:
+                raise AssertionError(f"Segment store text differs from the legacy cleaner for {hours}h {charset} transcript")
+
+            legacy = min(timeit.repeat(lambda: legacy_clean(segments), number=1, repeat=args.repeat))
+            normalized = min(timeit.repeat(lambda: normalize_segments(segments), number=1, repeat=args.repeat))
+            stored = min(timeit.repeat(lambda: TranscriptSegments.from_raw_segments(segments),
+                                       number=1, repeat=args.repeat))
+
+            print(f"{hours:>6}h {charset:>8} {len(segments):>9} {legacy * 1000:>10.1f} "
+                  f"{normalized * 1000:>14.1f} {legacy / normalized:>7.2f}x "
+                  f"{stored * 1000:>17.1f} {legacy / stored:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,4 @@
-from src.youtube_assistant.graph.graph_builder import GraphBuilder
\ No newline at end of file
+from src.youtube_assistant.graph.graph_builder import GraphBuilder
+from src.youtube_assistant.graph.checkpointing import get_checkpointer, thread_id_for
+from src.youtube_assistant.graph.profiler import NodeProfiler, NodeSpan, RunProfile, get_node_profiler
+from src.youtube_assistant.graph.graph_cache import CompiledGraphCache, get_graph_cache
\ No newline at end of file
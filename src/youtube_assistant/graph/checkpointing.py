@@ -0,0 +1,95 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Dict, Hashable, Optional
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from src.youtube_assistant.retriever.transcript_digest import TranscriptDigest
+from src.youtube_assistant.runtime.event_loop import get_event_loop
+from src.youtube_assistant.transcript import TranscriptSegments
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+try:
+    import aiosqlite
+    from langgraph.checkpoint.sqlite import SqliteSaver
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+except ImportError:
+    # langgraph-checkpoint-sqlite is optional; checkpoints are then kept in memory
+    aiosqlite = None
+    SqliteSaver = None
+    AsyncSqliteSaver = None
+
+
+def _serializer() -> JsonPlusSerializer:
+    # The state holds plain data only; its two custom types are the only ones revived
+    return JsonPlusSerializer(allowed_msgpack_modules=[TranscriptSegments, TranscriptDigest])
+
+
+def _sqlite_checkpointer(db_path: str, async_enabled: bool) -> BaseCheckpointSaver:
+    db_dir = os.path.dirname(db_path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+
+    if not async_enabled:
+        return SqliteSaver(sqlite3.connect(db_path, check_same_thread=False), serde=_serializer())
+
+    async def open_saver() -> BaseCheckpointSaver:
+        # The async saver is bound to the loop it is created on, the shared background loop
+        connection = await aiosqlite.connect(db_path)
+        return AsyncSqliteSaver(connection, serde=_serializer())
+
+    return get_event_loop().run(open_saver())
+
+
+_checkpointers: Dict[bool, Optional[BaseCheckpointSaver]] = {}
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer(async_enabled: bool) -> Optional[BaseCheckpointSaver]:
+    """
+    Return the process-wide graph checkpointer configured in uiconfigfile.ini.
+
+    Checkpoints are stored in SQLite when langgraph-checkpoint-sqlite is installed,
+    and in memory otherwise, in which case failed runs can only be resumed until the
+    app restarts.
+
+    Args:
+        async_enabled (bool): Whether graphs run through ainvoke/astream.
+
+    Returns:
+        Optional[BaseCheckpointSaver]: The shared checkpointer, or None if checkpointing is disabled.
+    """
+    with _checkpointer_lock:
+        if async_enabled not in _checkpointers:
+            settings = Config().get_checkpoint_settings()
+            if not settings['enabled']:
+                checkpointer = None
+            elif SqliteSaver is not None:
+                checkpointer = _sqlite_checkpointer(settings['db_path'], async_enabled)
+            else:
+                checkpointer = InMemorySaver(serde=_serializer())
+            _checkpointers[async_enabled] = checkpointer
+
+        return _checkpointers[async_enabled]
+
+
+def thread_id_for(run_key: Optional[Hashable]) -> str:
+    """
+    Derive the checkpoint thread id of a run.
+
+    Runs on the same video, use case, model, API key and prompt version share a
+    thread, so a failed run can be resumed by a later submit with the same
+    credentials. Without a key the run gets a thread of its own.
+
+    Args:
+        run_key (Optional[Hashable]): Identifies identical runs, e.g. the single-flight key.
+
+    Returns:
+        str: The thread id.
+    """
+    if run_key is None:
+        return uuid.uuid4().hex
+    return hashlib.sha256(repr(run_key).encode("utf-8")).hexdigest()[:32]
@@ -1,20 +1,60 @@
 
 import streamlit as st
 import traceback
-from typing import Dict
+from typing import Any, Awaitable, Callable, Dict
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import START, END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from src.youtube_assistant.graph.checkpointing import get_checkpointer
+from src.youtube_assistant.graph.profiler import get_node_profiler
 from src.youtube_assistant.state import BlogState
+from src.youtube_assistant.ui.uiconfigfile import Config
 from src.youtube_assistant.nodes import (
     TranscriptNode,
     GenerateBlogTitleNode,
     GenerateBlogContentNode,
+    GenerateBlogNode,
     BlogAggregatorNode,
+    ArtifactsJoinNode,
+    TranscriptDigestNode,
     YouTubeSummarizerNode,
     YouTubeNotesNode
 )
 
 
+ALL_ARTIFACTS_USECASE = "YouTube Video All Artifacts"
+
+
+def _tolerate_failure(node_name: str,
+                      func: Callable[[BlogState], Dict[str, Any]],
+                      afunc: Callable[[BlogState], Awaitable[Dict[str, Any]]]) -> RunnableLambda:
+    """
+    Wrap a branch node so that its failure is recorded in the state instead of
+    failing the whole graph. The node has already reported the error on the UI.
+
+    Args:
+        node_name (str): The graph node name the error is recorded under.
+        func (Callable): The sync node function.
+        afunc (Callable): The async node function.
+
+    Returns:
+        RunnableLambda: The wrapped node.
+    """
+    def run(state: BlogState) -> Dict[str, Any]:
+        try:
+            return func(state)
+        except Exception as e:
+            return {'artifact_errors': {node_name: str(e)}}
+
+    async def arun(state: BlogState) -> Dict[str, Any]:
+        try:
+            return await afunc(state)
+        except Exception as e:
+            return {'artifact_errors': {node_name: str(e)}}
+
+    return RunnableLambda(run, afunc=arun)
+
+
 class GraphBuilder:
     """
     Builder class for creating workflow graphs for different YouTube video processing use cases.
@@ -30,6 +70,9 @@ class GraphBuilder:
         self.user_input = user_input
         self.workflow = StateGraph(BlogState)
         self.nodes_initialized = False
+        self.single_call_blog = Config().get_blog_settings()['mode'] == 'single_call'
+        self.async_enabled = Config().get_execution_settings()['async_enabled']
+        self.node_profiler = get_node_profiler()
         
         # Validate user input
         self._validate_user_input()
@@ -56,7 +99,8 @@ class GraphBuilder:
             valid_usecases = [
                 "YouTube Video Blog Generation",
                 "YouTube Video Summarization",
-                "YouTube Video Notes"
+                "YouTube Video Notes",
+                ALL_ARTIFACTS_USECASE
             ]
             
             if selected_usecase not in valid_usecases:
@@ -73,23 +117,52 @@ class GraphBuilder:
     def initialize_nodes(self) -> None:
         """
         Initialize all node objects based on the selected use case.
+
+        Each node pairs its sync method with its async variant, so the compiled graph
+        runs the same nodes through invoke/stream and ainvoke/astream.
         """
         try:
 
             # Initialize common nodes
-            self.get_transcript_node = TranscriptNode().get_transcript_node
+            transcript_node = TranscriptNode()
+            self.get_transcript_node = RunnableLambda(transcript_node.get_transcript_node,
+                                                      afunc=transcript_node.aget_transcript_node)
+            digest_node = TranscriptDigestNode(self.user_input)
+            self.transcript_digest_node = RunnableLambda(digest_node.build_transcript_digest_node,
+                                                         afunc=digest_node.abuild_transcript_digest_node)
             
-            if self.user_input['selected_usecase'] == 'YouTube Video Blog Generation':
+            selected_usecase = self.user_input['selected_usecase']
+
+            if selected_usecase == ALL_ARTIFACTS_USECASE:
+                self._initialize_all_artifacts_nodes()
+
+            if selected_usecase == 'YouTube Video Blog Generation':
 
-                self.generate_blog_title_node = GenerateBlogTitleNode(self.user_input).generate_blog_title_node
-                self.generate_blog_content_node = GenerateBlogContentNode(self.user_input).generate_blog_content_node
-                self.blog_aggregator_node = BlogAggregatorNode().aggregate_blog_node
+                if self.single_call_blog:
+                    blog_node = GenerateBlogNode(self.user_input)
+                    self.generate_blog_node = RunnableLambda(blog_node.generate_blog_node,
+                                                             afunc=blog_node.agenerate_blog_node)
+                else:
+                    title_node = GenerateBlogTitleNode(self.user_input)
+                    content_node = GenerateBlogContentNode(self.user_input)
+                    self.generate_blog_title_node = RunnableLambda(title_node.generate_blog_title_node,
+                                                                   afunc=title_node.agenerate_blog_title_node)
+                    self.generate_blog_content_node = RunnableLambda(content_node.generate_blog_content_node,
+                                                                     afunc=content_node.agenerate_blog_content_node)
+
+                aggregator_node = BlogAggregatorNode()
+                self.blog_aggregator_node = RunnableLambda(aggregator_node.aggregate_blog_node,
+                                                           afunc=aggregator_node.aaggregate_blog_node)
             
-            if self.user_input['selected_usecase'] == 'YouTube Video Summarization':
-                self.youtube_summarizer_node = YouTubeSummarizerNode(self.user_input).generate_youtube_summary_node
+            if selected_usecase == 'YouTube Video Summarization':
+                summarizer_node = YouTubeSummarizerNode(self.user_input)
+                self.youtube_summarizer_node = RunnableLambda(summarizer_node.generate_youtube_summary_node,
+                                                              afunc=summarizer_node.agenerate_youtube_summary_node)
             
-            if self.user_input['selected_usecase'] == 'YouTube Video Notes':
-                self.youtube_notes_node = YouTubeNotesNode(self.user_input).generate_youtube_notes_node
+            if selected_usecase == 'YouTube Video Notes':
+                notes_node = YouTubeNotesNode(self.user_input)
+                self.youtube_notes_node = RunnableLambda(notes_node.generate_youtube_notes_node,
+                                                         afunc=notes_node.agenerate_youtube_notes_node)
             
             self.nodes_initialized = True
             
@@ -99,6 +172,62 @@ class GraphBuilder:
             st.code(traceback.format_exc(), language="python")
             raise RuntimeError(error_msg)
     
+    def _add_node(self, name: str, node: RunnableLambda) -> None:
+        """
+        Add a node to the workflow, wrapped by the node profiler when profiling is enabled.
+
+        Args:
+            name (str): The graph node name.
+            node (RunnableLambda): The node.
+        """
+        if self.node_profiler:
+            node = self.node_profiler.wrap(name, node)
+        self.workflow.add_node(name, node)
+
+    def _add_transcript_nodes(self) -> None:
+        """
+        Add the transcript and transcript digest nodes every graph starts with. The
+        generation nodes follow transcript_digest_node, which only digests long transcripts.
+        """
+        self._add_node("get_transcript_node", self.get_transcript_node)
+        self._add_node("transcript_digest_node", self.transcript_digest_node)
+
+        self.workflow.add_edge(START, "get_transcript_node")
+        self.workflow.add_edge("get_transcript_node", "transcript_digest_node")
+
+    def _initialize_all_artifacts_nodes(self) -> None:
+        """
+        Initialize the branch nodes of the all-artifacts graph. Each branch records its
+        failure in the state, so the other artifacts are still returned.
+        """
+        if self.single_call_blog:
+            blog_node = GenerateBlogNode(self.user_input)
+            self.generate_blog_node = _tolerate_failure("generate_blog_node",
+                                                        blog_node.generate_blog_node,
+                                                        blog_node.agenerate_blog_node)
+        else:
+            title_node = GenerateBlogTitleNode(self.user_input)
+            content_node = GenerateBlogContentNode(self.user_input)
+            self.generate_blog_title_node = _tolerate_failure("generate_blog_title_node",
+                                                              title_node.generate_blog_title_node,
+                                                              title_node.agenerate_blog_title_node)
+            self.generate_blog_content_node = _tolerate_failure("generate_blog_content_node",
+                                                                content_node.generate_blog_content_node,
+                                                                content_node.agenerate_blog_content_node)
+
+        summarizer_node = YouTubeSummarizerNode(self.user_input)
+        notes_node = YouTubeNotesNode(self.user_input)
+        self.youtube_summarizer_node = _tolerate_failure("youtube_summarizer_node",
+                                                         summarizer_node.generate_youtube_summary_node,
+                                                         summarizer_node.agenerate_youtube_summary_node)
+        self.youtube_notes_node = _tolerate_failure("youtube_notes_node",
+                                                    notes_node.generate_youtube_notes_node,
+                                                    notes_node.agenerate_youtube_notes_node)
+
+        join_node = ArtifactsJoinNode()
+        self.artifacts_join_node = RunnableLambda(join_node.join_artifacts_node,
+                                                  afunc=join_node.ajoin_artifacts_node)
+
     def _build_yt_blog_generator_graph(self) -> None:
         """
         Build the workflow graph for YouTube Video Blog Generation use case.
@@ -108,21 +237,32 @@ class GraphBuilder:
         2. Generates a blog title from the transcript
         3. Generates blog content from the transcript
         4. Aggregates the title and content into a final blog
+
+        In single-call mode, steps 2 and 3 are one LLM call returning both.
         """
         try:
             if not self.nodes_initialized:
                 self.initialize_nodes()
+
+            if self.single_call_blog:
+                self._add_transcript_nodes()
+                self._add_node("generate_blog_node", self.generate_blog_node)
+                self._add_node("blog_aggregator_node", self.blog_aggregator_node)
+
+                self.workflow.add_edge("transcript_digest_node", "generate_blog_node")
+                self.workflow.add_edge("generate_blog_node", "blog_aggregator_node")
+                self.workflow.add_edge("blog_aggregator_node", END)
+                return
                 
             # Add nodes to workflow
-            self.workflow.add_node("get_transcript_node", self.get_transcript_node)
-            self.workflow.add_node("generate_blog_title_node", self.generate_blog_title_node)
-            self.workflow.add_node("generate_blog_content_node", self.generate_blog_content_node)
-            self.workflow.add_node("blog_aggregator_node", self.blog_aggregator_node)
+            self._add_transcript_nodes()
+            self._add_node("generate_blog_title_node", self.generate_blog_title_node)
+            self._add_node("generate_blog_content_node", self.generate_blog_content_node)
+            self._add_node("blog_aggregator_node", self.blog_aggregator_node)
             
             # Define workflow connections
-            self.workflow.add_edge(START, "get_transcript_node")
-            self.workflow.add_edge("get_transcript_node", "generate_blog_title_node")
-            self.workflow.add_edge("get_transcript_node", "generate_blog_content_node")
+            self.workflow.add_edge("transcript_digest_node", "generate_blog_title_node")
+            self.workflow.add_edge("transcript_digest_node", "generate_blog_content_node")
             self.workflow.add_edge("generate_blog_title_node", "blog_aggregator_node")
             self.workflow.add_edge("generate_blog_content_node", "blog_aggregator_node")
             self.workflow.add_edge("blog_aggregator_node", END)
@@ -141,11 +281,10 @@ class GraphBuilder:
             if not self.nodes_initialized:
                 self.initialize_nodes()
 
-            self.workflow.add_node("get_transcript_node", self.get_transcript_node)
-            self.workflow.add_node("youtube_notes_node", self.youtube_notes_node)
+            self._add_transcript_nodes()
+            self._add_node("youtube_notes_node", self.youtube_notes_node)
             
-            self.workflow.add_edge(START, "get_transcript_node")
-            self.workflow.add_edge("get_transcript_node", "youtube_notes_node")
+            self.workflow.add_edge("transcript_digest_node", "youtube_notes_node")
             self.workflow.add_edge("youtube_notes_node", END)
             
         except Exception as e:
@@ -162,11 +301,10 @@ class GraphBuilder:
             if not self.nodes_initialized:
                 self.initialize_nodes()
 
-            self.workflow.add_node("get_transcript_node", self.get_transcript_node)
-            self.workflow.add_node("youtube_summarizer_node", self.youtube_summarizer_node)
+            self._add_transcript_nodes()
+            self._add_node("youtube_summarizer_node", self.youtube_summarizer_node)
             
-            self.workflow.add_edge(START, "get_transcript_node")
-            self.workflow.add_edge("get_transcript_node", "youtube_summarizer_node")
+            self.workflow.add_edge("transcript_digest_node", "youtube_summarizer_node")
             self.workflow.add_edge("youtube_summarizer_node", END)
             
         except Exception as e:
@@ -175,6 +313,46 @@ class GraphBuilder:
             st.code(traceback.format_exc(), language="python")
             raise RuntimeError(error_msg)
     
+    def _build_yt_all_artifacts_graph(self) -> None:
+        """
+        Build the workflow graph for the YouTube Video All Artifacts use case.
+
+        This creates a graph that:
+        1. Extracts the transcript from a YouTube video once
+        2. Generates the blog title, blog content, summary and notes in parallel
+        3. Joins the results, keeping the artifacts of the branches that succeeded
+
+        In single-call blog mode, the title and content branches are one LLM call.
+        """
+        try:
+            if not self.nodes_initialized:
+                self.initialize_nodes()
+
+            if self.single_call_blog:
+                branches = {"generate_blog_node": self.generate_blog_node}
+            else:
+                branches = {"generate_blog_title_node": self.generate_blog_title_node,
+                            "generate_blog_content_node": self.generate_blog_content_node}
+            branches["youtube_summarizer_node"] = self.youtube_summarizer_node
+            branches["youtube_notes_node"] = self.youtube_notes_node
+
+            self._add_transcript_nodes()
+            for name, node in branches.items():
+                self._add_node(name, node)
+            self._add_node("artifacts_join_node", self.artifacts_join_node)
+
+            for name in branches:
+                self.workflow.add_edge("transcript_digest_node", name)
+            # The join waits for every branch
+            self.workflow.add_edge(list(branches), "artifacts_join_node")
+            self.workflow.add_edge("artifacts_join_node", END)
+
+        except Exception as e:
+            error_msg = f"Failed to build all artifacts graph: {str(e)}"
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise RuntimeError(error_msg)
+
     def setup_graph(self) -> CompiledStateGraph:
         """
         Set up and build the appropriate graph based on the selected use case.
@@ -189,7 +367,8 @@ class GraphBuilder:
             usecase_mapping = {
                 "YouTube Video Blog Generation": self._build_yt_blog_generator_graph,
                 "YouTube Video Summarization": self._build_yt_summarization_graph,
-                "YouTube Video Notes": self._build_yt_notes_generation_graph
+                "YouTube Video Notes": self._build_yt_notes_generation_graph,
+                ALL_ARTIFACTS_USECASE: self._build_yt_all_artifacts_graph
             }
             
             selected_usecase = self.user_input['selected_usecase']
@@ -203,7 +382,8 @@ class GraphBuilder:
             
             build_graph()
 
-            return self.workflow.compile()
+            # Checkpoints after every step let a failed run resume from its last completed node
+            return self.workflow.compile(checkpointer=get_checkpointer(self.async_enabled))
             
         except NotImplementedError as e:
             st.warning(f"{str(e)}")
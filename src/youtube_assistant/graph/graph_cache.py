@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from langgraph.graph.state import CompiledStateGraph
+from src.youtube_assistant.graph.graph_builder import GraphBuilder
+from src.youtube_assistant.ui.uiconfigfile import CONFIG_FILE_PATH, Config
+
+
+def _config_version(config_file_path: str) -> int:
+    # Nanosecond mtime of the config file, so an edit invalidates the cached graphs
+    try:
+        return os.stat(config_file_path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _fingerprint(user_input: Dict[str, str]) -> str:
+    # API keys are part of user_input, so only a digest of the settings is kept around
+    payload = json.dumps(user_input, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompiledGraphCache:
+    """
+    Process-wide cache of compiled workflow graphs.
+
+    Graphs are keyed by (use case, provider, model, settings fingerprint), where the
+    fingerprint covers the whole user input including a digest of the API key. A
+    compiled graph holds no per-run state (nodes keep only their LLM clients and
+    parsers), so sessions with the same settings share one. Graphs are built outside
+    the cache lock; concurrent requests for a graph being built wait for that build.
+    The cache is dropped whenever uiconfigfile.ini changes, and the least recently used
+    graph is evicted beyond max_graphs. Evicted LLM clients stay usable by the graphs
+    holding them.
+    """
+
+    def __init__(self, max_graphs: int = 32, config_file_path: str = CONFIG_FILE_PATH):
+        """
+        Initialize the compiled-graph cache.
+
+        Args:
+            max_graphs (int): Maximum number of compiled graphs kept.
+            config_file_path (str): Config file whose changes invalidate the cache.
+        """
+        self.max_graphs = max(1, max_graphs)
+        self.config_file_path = config_file_path
+        self._graphs: "OrderedDict[Tuple, CompiledStateGraph]" = OrderedDict()
+        self._config_version = _config_version(config_file_path)
+        self._building: Dict[Tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(user_input: Dict[str, str]) -> Tuple:
+        provider = user_input.get('selected_llm', '')
+        model = user_input.get(f"selected_{provider.lower()}_model", '')
+        return user_input.get('selected_usecase', ''), provider, model, _fingerprint(user_input)
+
+    def get_or_build(self, user_input: Dict[str, str]) -> Optional[CompiledStateGraph]:
+        """
+        Return the compiled graph for the given settings, building it on first use.
+
+        Args:
+            user_input (Dict[str, str]): User configuration including selected use case and LLM settings.
+
+        Returns:
+            Optional[CompiledStateGraph]: The shared compiled graph, or None if setup failed.
+        """
+        key = self._key(user_input)
+
+        while True:
+            with self._lock:
+                version = _config_version(self.config_file_path)
+                if version != self._config_version:
+                    self._graphs.clear()
+                    self._config_version = version
+                    self.invalidations += 1
+
+                graph = self._graphs.get(key)
+                if graph is not None:
+                    self._graphs.move_to_end(key)
+                    self.hits += 1
+                    return graph
+
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    break
+
+            # Another session is building this graph; use it once done, or build if it failed
+            building.wait()
+
+        graph = None
+        try:
+            # Built outside the lock, so cache hits of other sessions are never blocked
+            graph = GraphBuilder(user_input).setup_graph()
+            return graph
+        finally:
+            with self._lock:
+                del self._building[key]
+                # A graph built from a config that changed meanwhile is used once, not cached
+                if graph is not None and version == self._config_version:
+                    self.misses += 1
+                    self._graphs[key] = graph
+                    while len(self._graphs) > self.max_graphs:
+                        self._graphs.popitem(last=False)
+            building.set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, int]: Cached graph count, hits, misses and config invalidations.
+        """
+        with self._lock:
+            return {
+                'graphs': len(self._graphs),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations
+            }
+
+    def clear(self) -> None:
+        """Drop every cached graph."""
+        with self._lock:
+            self._graphs.clear()
+
+
+_graph_cache: Optional[CompiledGraphCache] = None
+_graph_cache_lock = threading.Lock()
+
+
+def get_graph_cache() -> Optional[CompiledGraphCache]:
+    """
+    Return the process-wide compiled-graph cache configured in uiconfigfile.ini.
+
+    Returns:
+        Optional[CompiledGraphCache]: The shared cache, or None if it is disabled.
+    """
+    global _graph_cache
+
+    settings = Config().get_graph_cache_settings()
+    if not settings['enabled']:
+        return None
+
+    with _graph_cache_lock:
+        if _graph_cache is None:
+            _graph_cache = CompiledGraphCache(max_graphs=settings['max_graphs'])
+
+        return _graph_cache
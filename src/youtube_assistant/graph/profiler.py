@@ -0,0 +1,303 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+# Key of the profiled run's id in the graph config's configurable values
+PROFILE_RUN_KEY = "profile_run_id"
+
+
+@dataclass
+class NodeSpan:
+    """Timing, payload sizes and memory of one node execution."""
+
+    node: str
+    start_seconds: float
+    wall_seconds: float
+    cpu_seconds: float
+    input_bytes: int
+    output_bytes: int
+    peak_memory_bytes: Optional[int]
+    thread: str
+    error: Optional[str] = None
+
+
+def _payload_bytes(value: Any) -> int:
+    # Approximate size of a state or update: UTF-8 length of text, shallow size of anything else
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, dict):
+        return sum(_payload_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class RunProfile:
+    """
+    Node spans of one graph run, exportable as a Chrome trace.
+
+    Spans of parallel nodes are added from several threads, so adding is locked.
+    """
+
+    def __init__(self, usecase: str):
+        """
+        Initialize an empty run profile.
+
+        Args:
+            usecase (str): The use case the graph runs.
+        """
+        self.run_id = uuid.uuid4().hex
+        self.usecase = usecase
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self._spans: List[NodeSpan] = []
+        self._threads: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, span: NodeSpan) -> None:
+        """Record the span of a finished node."""
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self) -> List[NodeSpan]:
+        """Return the recorded spans in start order."""
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.start_seconds)
+
+    def timeline(self) -> List[Dict[str, Any]]:
+        """
+        Return the spans as table rows, with start and end relative to the run start.
+
+        Returns:
+            List[Dict[str, Any]]: One row per node execution.
+        """
+        rows = []
+        for span in self.spans():
+            row = asdict(span)
+            row['start_seconds'] = round(span.start_seconds, 4)
+            row['end_seconds'] = round(span.start_seconds + span.wall_seconds, 4)
+            row['wall_seconds'] = round(span.wall_seconds, 4)
+            row['cpu_seconds'] = round(span.cpu_seconds, 4)
+            rows.append(row)
+        return rows
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Return the run in the Chrome trace event format, which Perfetto and
+        chrome://tracing open. Each node is a complete event on its thread's track.
+
+        Returns:
+            Dict[str, Any]: The trace document.
+        """
+        threads: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": f"{self.usecase} {self.run_id}"}}
+        ]
+        for span in self.spans():
+            tid = threads.setdefault(span.thread, len(threads) + 1)
+            events.append({
+                "name": span.node,
+                "cat": "node",
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round(span.start_seconds * 1e6),
+                "dur": round(span.wall_seconds * 1e6),
+                "args": {
+                    "cpu_ms": round(span.cpu_seconds * 1e3, 3),
+                    "input_bytes": span.input_bytes,
+                    "output_bytes": span.output_bytes,
+                    "peak_memory_bytes": span.peak_memory_bytes,
+                    "error": span.error
+                }
+            })
+        for thread, tid in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread}})
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"run_id": self.run_id, "usecase": self.usecase, "started_at": self.started_at}
+        }
+
+    def export(self, trace_dir: str) -> str:
+        """
+        Write the Chrome trace of the run to a JSON file.
+
+        Args:
+            trace_dir (str): Directory of the trace files.
+
+        Returns:
+            str: Path of the written file.
+        """
+        os.makedirs(trace_dir, exist_ok=True)
+        path = os.path.join(trace_dir, f"{self.run_id}.json")
+        with open(path, mode="w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+class NodeProfiler:
+    """
+    Wraps graph nodes to record their execution into the profile of the current run.
+
+    Compiled graphs are shared across sessions, so the wrappers hold no run state:
+    each run registers a RunProfile and passes its id in the graph config under
+    PROFILE_RUN_KEY. Nodes of runs without one execute unprofiled. CPU time is that of
+    the node's own thread, so it misses work the node hands to other threads and, for
+    async nodes, includes other coroutines interleaved on the event loop. With memory
+    tracing, the peak is the process-wide traced peak above the traced memory at the
+    node's start, which parallel nodes share.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Initialize the node profiler.
+
+        Args:
+            trace_memory (bool): Record peak memory with tracemalloc, which slows down allocation.
+        """
+        self.trace_memory = trace_memory
+        self._runs: Dict[str, RunProfile] = {}
+        self._lock = threading.Lock()
+
+    def start_run(self, usecase: str) -> RunProfile:
+        """
+        Register the profile of a new run.
+
+        Args:
+            usecase (str): The use case the graph runs.
+
+        Returns:
+            RunProfile: The profile, whose run_id goes into the graph config.
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        profile = RunProfile(usecase)
+        with self._lock:
+            self._runs[profile.run_id] = profile
+        return profile
+
+    def finish_run(self, profile: RunProfile) -> None:
+        """Stop recording into a run's profile."""
+        with self._lock:
+            self._runs.pop(profile.run_id, None)
+
+    def _profile_for(self, config: Optional[RunnableConfig]) -> Optional[RunProfile]:
+        run_id = ((config or {}).get('configurable') or {}).get(PROFILE_RUN_KEY)
+        if run_id is None:
+            return None
+        with self._lock:
+            return self._runs.get(run_id)
+
+    def _begin(self) -> Dict[str, Any]:
+        marks = {'wall': time.perf_counter(), 'cpu': time.thread_time(), 'memory': None}
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            marks['memory'] = tracemalloc.get_traced_memory()[0]
+        return marks
+
+    def _end(self,
+             profile: RunProfile,
+             node: str,
+             marks: Dict[str, Any],
+             state: Any,
+             update: Any,
+             error: Optional[BaseException]) -> None:
+        wall_end, cpu_end = time.perf_counter(), time.thread_time()
+        peak_memory = None
+        if marks['memory'] is not None and tracemalloc.is_tracing():
+            peak_memory = max(0, tracemalloc.get_traced_memory()[1] - marks['memory'])
+
+        profile.add(NodeSpan(
+            node=node,
+            start_seconds=marks['wall'] - profile.started,
+            wall_seconds=wall_end - marks['wall'],
+            cpu_seconds=cpu_end - marks['cpu'],
+            input_bytes=_payload_bytes(state),
+            output_bytes=_payload_bytes(update),
+            peak_memory_bytes=peak_memory,
+            thread=threading.current_thread().name,
+            error=str(error) if error else None
+        ))
+
+    def wrap(self, node_name: str, node: Runnable) -> RunnableLambda:
+        """
+        Wrap a graph node so that its executions are profiled.
+
+        Args:
+            node_name (str): The graph node name recorded in the spans.
+            node (Runnable): The node.
+
+        Returns:
+            RunnableLambda: The wrapped node, running the original sync or async path.
+        """
+        def run(state: Any, config: RunnableConfig) -> Any:
+            profile = self._profile_for(config)
+            if profile is None:
+                return node.invoke(state, config)
+
+            marks = self._begin()
+            update, error = None, None
+            try:
+                update = node.invoke(state, config)
+                return update
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._end(profile, node_name, marks, state, update, error)
+
+        async def arun(state: Any, config: RunnableConfig) -> Any:
+            profile = self._profile_for(config)
+            if profile is None:
+                return await node.ainvoke(state, config)
+
+            marks = self._begin()
+            update, error = None, None
+            try:
+                update = await node.ainvoke(state, config)
+                return update
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._end(profile, node_name, marks, state, update, error)
+
+        return RunnableLambda(run, afunc=arun, name=node_name)
+
+
+_node_profiler: Optional[NodeProfiler] = None
+_node_profiler_loaded = False
+_node_profiler_lock = threading.Lock()
+
+
+def get_node_profiler() -> Optional[NodeProfiler]:
+    """
+    Return the process-wide node profiler configured in uiconfigfile.ini.
+
+    Returns:
+        Optional[NodeProfiler]: The shared profiler, or None if profiling is disabled.
+    """
+    global _node_profiler, _node_profiler_loaded
+
+    with _node_profiler_lock:
+        if not _node_profiler_loaded:
+            settings = Config().get_profiler_settings()
+            if settings['enabled']:
+                _node_profiler = NodeProfiler(trace_memory=settings['trace_memory'])
+            _node_profiler_loaded = True
+
+        return _node_profiler
@@ -1 +1,11 @@
-from src.youtube_assistant.llm.llm import get_llm
\ No newline at end of file
+from src.youtube_assistant.llm.llm import api_key_fingerprint, get_llm
+from src.youtube_assistant.llm.rate_limited_llm import RateLimitedChatModel
+from src.youtube_assistant.llm.client_registry import LLMClientRegistry, get_llm_registry
+from src.youtube_assistant.llm.response_cache import LLMResponseCache, get_response_cache
+from src.youtube_assistant.llm.cached_llm import CachedChatModel
+from src.youtube_assistant.llm.map_reduce import MapReducePipeline, get_map_reduce_pipeline
+from src.youtube_assistant.llm.hedged_llm import HedgedChatModel
+from src.youtube_assistant.llm.telemetry import LLMCallRecord, LLMTelemetryHandler, TelemetryStore, get_telemetry_store
+from src.youtube_assistant.llm.prompt_cache import PROMPT_VERSION, PromptCachingChatModel, transcript_prefix_message
+from src.youtube_assistant.llm.structured_output import ainvoke_with_parse_retry, invoke_with_parse_retry
+from src.youtube_assistant.llm.replay_llm import LLMRecordingStore, RecordingChatModel, ReplayChatModel, ReplayLLM, get_recording_store
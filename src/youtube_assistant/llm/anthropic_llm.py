@@ -2,6 +2,7 @@ from typing import Optional
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_anthropic import ChatAnthropic
 from src.youtube_assistant.llm.base_llm import BaseLLMProvider
+from src.youtube_assistant.llm.client_registry import get_llm_registry
 
 
 class AnthropicLLM(BaseLLMProvider):
@@ -19,7 +20,9 @@ class AnthropicLLM(BaseLLMProvider):
                                            api_key_name="ANTHROPIC_API_KEY",
                                            model_name="Anthropic"):
 
-                self.llm = ChatAnthropic(
+                self.llm = get_llm_registry().get_or_create(
+                    provider="Anthropic",
+                    model_class=ChatAnthropic,
                     api_key=anthropic_api_key,
                     model=anthropic_selected_model,
                     max_tokens=8000,
@@ -0,0 +1,150 @@
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    message_chunk_to_message,
+    message_to_dict,
+    messages_from_dict
+)
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from src.youtube_assistant.llm.hedged_llm import HEDGE_FALLBACK_KEY
+from src.youtube_assistant.llm.response_cache import LLMResponseCache
+from src.youtube_assistant.llm.wrapped_llm import ChatModelWrapper
+
+
+def _as_cached(message: BaseMessage) -> BaseMessage:
+    # A cache hit spends no provider tokens, so drop the original usage and flag the hit
+    if isinstance(message, AIMessage):
+        message = message.model_copy(update={'usage_metadata': None,
+                                             'response_metadata': {**message.response_metadata, 'cached': True}})
+    return message
+
+
+def _as_chunk(message: AIMessage) -> AIMessageChunk:
+    return AIMessageChunk(
+        content=message.content,
+        additional_kwargs=message.additional_kwargs,
+        response_metadata=message.response_metadata,
+        id=message.id,
+        tool_call_chunks=[
+            tool_call_chunk(name=call['name'], args=json.dumps(call['args']), id=call['id'], index=index)
+            for index, call in enumerate(message.tool_calls)
+        ]
+    )
+
+
+class CachedChatModel(ChatModelWrapper):
+    """
+    Chat model that serves repeated requests from an LLMResponseCache.
+
+    Requests are keyed by a SHA-256 hash of the provider, the inner model's identity
+    (model name, temperature, max_tokens and identifying params), the full message list,
+    stop sequences and call kwargs such as bound tools. Streams are cached once they complete and
+    replayed as a single chunk. Answers a hedge fallback model gave are not cached.
+    """
+
+    response_cache: LLMResponseCache
+    provider: str
+
+    def _model_identity(self) -> Dict[str, Any]:
+        # Some provider models (ChatGroq) report no identifying params, so the model name
+        # and sampling settings come from the LangSmith params every chat model provides
+        ls_params = self.inner._get_ls_params()
+        return {
+            'provider': ls_params.get('ls_provider'),
+            'model': ls_params.get('ls_model_name'),
+            'temperature': ls_params.get('ls_temperature'),
+            'max_tokens': ls_params.get('ls_max_tokens'),
+            'params': self.inner._identifying_params
+        }
+
+    def _cache_key(self, messages: List[BaseMessage], stop: Optional[List[str]], kwargs: Dict[str, Any]) -> str:
+        request = {
+            'provider': self.provider,
+            'model': self._model_identity(),
+            'messages': [message_to_dict(message) for message in messages],
+            'stop': stop,
+            'kwargs': kwargs
+        }
+        serialized = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[ChatResult]:
+        cached = self.response_cache.get(key)
+        if cached is None:
+            return None
+        return ChatResult(generations=[ChatGeneration(message=_as_cached(message))
+                                       for message in messages_from_dict(cached)])
+
+    def _store(self, key: str, result: ChatResult) -> None:
+        # A hedge fallback's answer is not what the model in the key would have said
+        if any(generation.message.response_metadata.get(HEDGE_FALLBACK_KEY) for generation in result.generations):
+            return
+        self.response_cache.put(key, [message_to_dict(generation.message) for generation in result.generations])
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any) -> ChatResult:
+        key = self._cache_key(messages, stop, kwargs)
+        result = self._lookup(key)
+        if result is None:
+            result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            self._store(key, result)
+        return result
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        key = self._cache_key(messages, stop, kwargs)
+        result = self._lookup(key)
+        if result is None:
+            result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            self._store(key, result)
+        return result
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        key = self._cache_key(messages, stop, kwargs)
+        result = self._lookup(key)
+        if result is not None:
+            yield ChatGenerationChunk(message=_as_chunk(result.generations[0].message))
+            return
+
+        full = None
+        for chunk in self.inner._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            full = chunk.message if full is None else full + chunk.message
+            yield chunk
+
+        if full is not None:
+            self._store(key, ChatResult(generations=[ChatGeneration(message=message_chunk_to_message(full))]))
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        key = self._cache_key(messages, stop, kwargs)
+        result = self._lookup(key)
+        if result is not None:
+            yield ChatGenerationChunk(message=_as_chunk(result.generations[0].message))
+            return
+
+        full = None
+        async for chunk in self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            full = chunk.message if full is None else full + chunk.message
+            yield chunk
+
+        if full is not None:
+            self._store(key, ChatResult(generations=[ChatGeneration(message=message_chunk_to_message(full))]))
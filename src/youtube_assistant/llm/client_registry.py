@@ -0,0 +1,153 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Type
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from src.youtube_assistant.runtime.event_loop import get_event_loop
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+class _RegistryEntry(NamedTuple):
+    model: BaseChatModel
+    http_client: Optional[httpx.Client]
+    http_async_client: Optional[httpx.AsyncClient]
+
+
+def _close_async_client(client: httpx.AsyncClient) -> None:
+    # Async clients are only ever used on the shared event loop, so close them there
+    get_event_loop().submit(client.aclose())
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of chat-model clients.
+
+    Clients are shared per (provider, model, hashed API key, constructor params), so
+    nodes and Streamlit sessions with the same settings reuse one client and its
+    connection pools instead of building new ones on every submit. Clients whose
+    model class accepts http_client get their own httpx pools. Beyond max_clients the
+    least recently used client is only dropped from the registry, not closed: nodes
+    and cached graphs may still hold it, and its pools are reclaimed once the last
+    holder lets go. Model classes without http_client (ChatAnthropic) share one
+    process-wide pool. The provider SDK clients are thread-safe. Their built-in retries
+    are turned off, since RateLimitedChatModel already retries with backoff.
+    """
+
+    def __init__(self, max_clients: int = 16):
+        """
+        Initialize the client registry.
+
+        Args:
+            max_clients (int): Maximum number of clients kept alive.
+        """
+        self.max_clients = max(1, max_clients)
+        self._entries: "OrderedDict[Tuple, _RegistryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(provider: str, model: str, api_key: str, params: Dict[str, Any]) -> Tuple:
+        # Only a digest of the API key is kept around in the key
+        api_key_hash = hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()
+        return provider, model, api_key_hash, tuple(sorted(params.items()))
+
+    def get_or_create(self,
+                      provider: str,
+                      model_class: Type[BaseChatModel],
+                      api_key: str,
+                      model: str,
+                      **params: Any) -> BaseChatModel:
+        """
+        Return the shared client for the given settings, constructing it on first use.
+
+        Args:
+            provider (str): The provider name, e.g. 'Groq'.
+            model_class (Type[BaseChatModel]): The LangChain chat model class.
+            api_key (str): The provider API key.
+            model (str): The model name.
+            **params: Further constructor arguments such as temperature or max_tokens.
+
+        Returns:
+            BaseChatModel: The shared chat model client.
+        """
+        if "max_retries" in model_class.model_fields:
+            # SDK retries would multiply the RetryPolicy attempts and bypass the rate limiter
+            params = {'max_retries': 0, **params}
+
+        key = self._key(provider, model, api_key, params)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.model
+
+            entry = _RegistryEntry(None, None, None)
+            if "http_client" in model_class.model_fields:
+                entry = _RegistryEntry(None, httpx.Client(), httpx.AsyncClient())
+                params = {**params, 'http_client': entry.http_client, 'http_async_client': entry.http_async_client}
+
+            try:
+                chat_model = model_class(api_key=api_key, model=model, **params)
+            except Exception:
+                self._close_entry(entry)
+                raise
+
+            self.misses += 1
+            self._entries[key] = entry._replace(model=chat_model)
+
+            # Evicted clients stay usable by whoever still holds them
+            while len(self._entries) > self.max_clients:
+                self._entries.popitem(last=False)
+
+        return chat_model
+
+    @staticmethod
+    def _close_entry(entry: _RegistryEntry) -> None:
+        if entry.http_client is not None:
+            entry.http_client.close()
+        if entry.http_async_client is not None:
+            _close_async_client(entry.http_async_client)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return registry statistics.
+
+        Returns:
+            Dict[str, int]: Live client count, hits and misses.
+        """
+        with self._lock:
+            return {'clients': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        """Close and drop every client, for shutdown when no holder uses them anymore."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+
+        for entry in entries:
+            self._close_entry(entry)
+
+
+_llm_registry: Optional[LLMClientRegistry] = None
+_llm_registry_lock = threading.Lock()
+
+
+def get_llm_registry() -> LLMClientRegistry:
+    """
+    Return the process-wide LLM client registry configured in uiconfigfile.ini.
+
+    Returns:
+        LLMClientRegistry: The shared client registry.
+    """
+    global _llm_registry
+
+    with _llm_registry_lock:
+        if _llm_registry is None:
+            settings = Config().get_llm_client_settings()
+            _llm_registry = LLMClientRegistry(max_clients=settings['max_clients'])
+
+        return _llm_registry
@@ -4,6 +4,7 @@ from typing import Dict, Optional
 from langchain_groq import ChatGroq
 from langchain_core.language_models.chat_models import BaseChatModel
 from src.youtube_assistant.llm.base_llm import BaseLLMProvider
+from src.youtube_assistant.llm.client_registry import get_llm_registry
 
 
 
@@ -21,7 +22,9 @@ class GroqLLM(BaseLLMProvider):
                                            api_key_name="GROQ_API_KEY",
                                            model_name="Groq"):
                 
-                self.llm = ChatGroq(
+                self.llm = get_llm_registry().get_or_create(
+                    provider="Groq",
+                    model_class=ChatGroq,
                     api_key=groq_api_key,
                     model=groq_selected_model,
                     max_tokens=10_000,
@@ -0,0 +1,365 @@
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from langchain_core.callbacks import (AsyncCallbackManager, AsyncCallbackManagerForLLMRun, CallbackManager,
+                                      CallbackManagerForLLMRun)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult, LLMResult
+from langchain_core.runnables import Runnable
+from langgraph.constants import TAG_NOSTREAM
+from src.youtube_assistant.llm.rate_limited_llm import RateLimitedChatModel
+from src.youtube_assistant.llm.wrapped_llm import ChatModelWrapper
+
+
+_DONE = object()
+_ADMITTED = object()
+
+# Response metadata flag of answers from the fallback model, which are not cached
+HEDGE_FALLBACK_KEY = "hedge_fallback"
+
+
+def _from_fallback(message: BaseMessage) -> BaseMessage:
+    return message.model_copy(update={'response_metadata': {**message.response_metadata, HEDGE_FALLBACK_KEY: True}})
+
+
+def _chat_result(result: LLMResult) -> ChatResult:
+    return ChatResult(generations=result.generations[0], llm_output=result.llm_output)
+
+
+def _fallback_result(result: ChatResult) -> ChatResult:
+    return ChatResult(generations=[ChatGeneration(message=_from_fallback(generation.message),
+                                                  generation_info=generation.generation_info)
+                                   for generation in result.generations],
+                      llm_output=result.llm_output)
+
+
+class HedgedChatModel(ChatModelWrapper):
+    """
+    Chat model that hedges a slow or failing primary model with a fallback model.
+
+    If the primary has not answered (or, when streaming, produced its first chunk)
+    within hedge_after_seconds of being admitted by its rate limiter, the same request
+    is sent to the fallback and the first good answer wins. Time spent queueing for an
+    admission slot or a rate limit does not count. A primary error sends the request to
+    the fallback right away. Losing async calls and streams are cancelled. A losing
+    blocking call cannot be interrupted, so its result is discarded when it returns.
+    Answers of the fallback are flagged in their response metadata under
+    HEDGE_FALLBACK_KEY.
+
+    Each contender runs in a copy of the caller's context, so the graph config and stream
+    writer reach it, and as a child run of the hedged call, so callbacks and telemetry
+    see it like a direct call. Contender runs are tagged nostream, since the graph
+    streams the winner's tokens through the hedged call itself.
+    """
+
+    fallback: BaseChatModel
+    hedge_after_seconds: float
+
+    def bind_tools(self, tools, **kwargs: Any) -> Runnable:
+        # Providers format tools differently, so bind them to each model separately
+        contender_kwargs = []
+        for model in (self.inner, self.fallback):
+            bound_kwargs = dict(model.bind_tools(tools, **kwargs).kwargs)
+            bound_kwargs.pop('ls_structured_output_format', None)
+            contender_kwargs.append(bound_kwargs)
+
+        tracing_kwargs = {key: kwargs[key] for key in ('ls_structured_output_format',) if key in kwargs}
+        return self.bind(contender_kwargs=contender_kwargs, **tracing_kwargs)
+
+    def _contenders(self,
+                    kwargs: Dict[str, Any],
+                    on_admitted: Callable[[], None]) -> List[Tuple[BaseChatModel, Dict[str, Any]]]:
+        contender_kwargs = kwargs.pop('contender_kwargs', None) or [{}, {}]
+        contenders = [(model, {**kwargs, **model_kwargs})
+                      for model, model_kwargs in zip((self.inner, self.fallback), contender_kwargs)]
+
+        if isinstance(self.inner, RateLimitedChatModel):
+            # The hedge timer starts once the primary's request is actually sent
+            contenders[0][1]['on_admitted'] = on_admitted
+        else:
+            on_admitted()
+        return contenders
+
+    def _contender_config(self,
+                          run_manager: Union[CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun, None]
+                          ) -> Dict[str, Any]:
+        if run_manager is None:
+            # Implicit streaming calls _stream without a run manager and reports the hedged
+            # call's tokens itself, so contenders must not fall back to the caller's callbacks
+            return {'callbacks': []}
+        # LLM run managers have no get_child, so the child manager is built like ParentRunManager.get_child
+        manager_class = AsyncCallbackManager if isinstance(run_manager, AsyncCallbackManagerForLLMRun) else CallbackManager
+        callbacks = manager_class(handlers=[], parent_run_id=run_manager.run_id)
+        callbacks.set_handlers(run_manager.inheritable_handlers)
+        callbacks.add_tags(run_manager.inheritable_tags)
+        callbacks.add_metadata(run_manager.inheritable_metadata)
+        # Hidden from the graph's message stream, which gets the winner's tokens from the hedged call
+        callbacks.add_tags([TAG_NOSTREAM], inherit=False)
+        return {'callbacks': callbacks}
+
+    def _hedge_timeout(self, hedge_at: Optional[float], started: int, contenders: int) -> Optional[float]:
+        # Wait without a timeout until the primary is admitted, or once every contender runs
+        if hedge_at is None or started >= contenders:
+            return None
+        return max(0.0, hedge_at - time.monotonic())
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any) -> ChatResult:
+        events: "queue.Queue" = queue.Queue()
+        contenders = self._contenders(kwargs, lambda: events.put((0, _ADMITTED, None)))
+        config = self._contender_config(run_manager)
+        executor = ThreadPoolExecutor(max_workers=len(contenders), thread_name_prefix="hedged-llm")
+
+        def run(index: int) -> None:
+            model, call_kwargs = contenders[index]
+            try:
+                result = model.generate([messages], stop=stop, **config, **call_kwargs)
+                events.put((index, _chat_result(result), None))
+            except Exception as e:
+                events.put((index, None, e))
+
+        def start(index: int) -> None:
+            # A fresh context copy per contender keeps the graph config and stream writer
+            executor.submit(contextvars.copy_context().run, run, index)
+
+        start(0)
+        started = 1
+        hedge_at = None
+        errors = []
+        try:
+            while True:
+                try:
+                    index, result, error = events.get(timeout=self._hedge_timeout(hedge_at, started, len(contenders)))
+                except queue.Empty:
+                    # The primary is slow, hedge with the fallback
+                    start(started)
+                    started += 1
+                    continue
+
+                if result is _ADMITTED:
+                    hedge_at = hedge_at or time.monotonic() + self.hedge_after_seconds
+                    continue
+
+                if error is None:
+                    return result if index == 0 else _fallback_result(result)
+
+                errors.append(error)
+                if len(errors) < started:
+                    continue
+                if started < len(contenders):
+                    start(started)
+                    started += 1
+                    continue
+                raise errors[0]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        events: asyncio.Queue = asyncio.Queue()
+        contenders = self._contenders(kwargs, lambda: events.put_nowait((0, _ADMITTED, None)))
+        config = self._contender_config(run_manager)
+        tasks: List[asyncio.Task] = []
+
+        async def run(index: int) -> None:
+            model, call_kwargs = contenders[index]
+            try:
+                result = await model.agenerate([messages], stop=stop, **config, **call_kwargs)
+                await events.put((index, _chat_result(result), None))
+            except Exception as e:
+                await events.put((index, None, e))
+
+        def start(index: int) -> None:
+            # Tasks run in their own copy of the caller's context
+            tasks.append(asyncio.ensure_future(run(index)))
+
+        start(0)
+        hedge_at = None
+        errors = []
+        try:
+            while True:
+                timeout = self._hedge_timeout(hedge_at, len(tasks), len(contenders))
+                try:
+                    index, result, error = await asyncio.wait_for(events.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    start(len(tasks))
+                    continue
+
+                if result is _ADMITTED:
+                    hedge_at = hedge_at or time.monotonic() + self.hedge_after_seconds
+                    continue
+
+                if error is None:
+                    return result if index == 0 else _fallback_result(result)
+
+                errors.append(error)
+                if len(errors) < len(tasks):
+                    continue
+                if len(tasks) < len(contenders):
+                    start(len(tasks))
+                    continue
+                raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        events: "queue.Queue" = queue.Queue()
+        contenders = self._contenders(kwargs, lambda: events.put((0, _ADMITTED, None)))
+        config = self._contender_config(run_manager)
+        cancelled = [threading.Event() for _ in contenders]
+
+        def pump(index: int) -> None:
+            model, call_kwargs = contenders[index]
+            try:
+                for chunk in model.stream(messages, config, stop=stop, **call_kwargs):
+                    if cancelled[index].is_set():
+                        # Returning closes the generator and its HTTP response
+                        return
+                    events.put((index, ChatGenerationChunk(message=chunk), None))
+            except Exception as e:
+                events.put((index, None, e))
+            else:
+                events.put((index, _DONE, None))
+
+        def start(index: int) -> None:
+            # A fresh context copy per contender keeps the graph config and stream writer
+            threading.Thread(target=contextvars.copy_context().run, args=(pump, index),
+                             name="hedged-llm-stream", daemon=True).start()
+
+        start(0)
+        started = 1
+        hedge_at = None
+        failed = 0
+        winner = None
+        try:
+            while True:
+                timeout = self._hedge_timeout(hedge_at, started, len(contenders)) if winner is None else None
+                try:
+                    index, chunk, error = events.get(timeout=timeout)
+                except queue.Empty:
+                    # No first chunk from the primary yet, hedge with the fallback
+                    start(started)
+                    started += 1
+                    continue
+
+                if chunk is _ADMITTED:
+                    hedge_at = hedge_at or time.monotonic() + self.hedge_after_seconds
+                    continue
+
+                if winner is not None and index != winner:
+                    continue
+
+                if error is not None:
+                    if winner is not None:
+                        raise error
+                    failed += 1
+                    if failed < started:
+                        continue
+                    if started < len(contenders):
+                        start(started)
+                        started += 1
+                        continue
+                    raise error
+
+                if winner is None:
+                    winner = index
+                    for other, event in enumerate(cancelled):
+                        if other != winner:
+                            event.set()
+                    if chunk is not _DONE and winner > 0:
+                        chunk = ChatGenerationChunk(message=_from_fallback(chunk.message),
+                                                    generation_info=chunk.generation_info)
+
+                if chunk is _DONE:
+                    return
+                yield chunk
+        finally:
+            for event in cancelled:
+                event.set()
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        events: asyncio.Queue = asyncio.Queue()
+        contenders = self._contenders(kwargs, lambda: events.put_nowait((0, _ADMITTED, None)))
+        config = self._contender_config(run_manager)
+        tasks: List[asyncio.Task] = []
+
+        async def pump(index: int) -> None:
+            model, call_kwargs = contenders[index]
+            try:
+                async for chunk in model.astream(messages, config, stop=stop, **call_kwargs):
+                    await events.put((index, ChatGenerationChunk(message=chunk), None))
+            except Exception as e:
+                await events.put((index, None, e))
+            else:
+                await events.put((index, _DONE, None))
+
+        def start(index: int) -> None:
+            # Tasks run in their own copy of the caller's context
+            tasks.append(asyncio.ensure_future(pump(index)))
+
+        start(0)
+        hedge_at = None
+        failed = 0
+        winner = None
+        try:
+            while True:
+                timeout = self._hedge_timeout(hedge_at, len(tasks), len(contenders)) if winner is None else None
+                try:
+                    index, chunk, error = await asyncio.wait_for(events.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    start(len(tasks))
+                    continue
+
+                if chunk is _ADMITTED:
+                    hedge_at = hedge_at or time.monotonic() + self.hedge_after_seconds
+                    continue
+
+                if winner is not None and index != winner:
+                    continue
+
+                if error is not None:
+                    if winner is not None:
+                        raise error
+                    failed += 1
+                    if failed < len(tasks):
+                        continue
+                    if len(tasks) < len(contenders):
+                        start(len(tasks))
+                        continue
+                    raise error
+
+                if winner is None:
+                    winner = index
+                    for other, task in enumerate(tasks):
+                        if other != winner:
+                            task.cancel()
+                    if chunk is not _DONE and winner > 0:
+                        chunk = ChatGenerationChunk(message=_from_fallback(chunk.message),
+                                                    generation_info=chunk.generation_info)
+
+                if chunk is _DONE:
+                    return
+                yield chunk
+        finally:
+            for task in tasks:
+                task.cancel()
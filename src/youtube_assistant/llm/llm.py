@@ -1,10 +1,103 @@
+import hashlib
+import os
 import streamlit as st
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Tuple, Type
 from langchain_core.language_models.chat_models import BaseChatModel
 from src.youtube_assistant.llm.base_llm import BaseLLMProvider
 from src.youtube_assistant.llm.groq_llm import GroqLLM
 from src.youtube_assistant.llm.openai_llm import OpenAILLM
 from src.youtube_assistant.llm.anthropic_llm import AnthropicLLM
+from src.youtube_assistant.llm.rate_limited_llm import RateLimitedChatModel
+from src.youtube_assistant.llm.cached_llm import CachedChatModel
+from src.youtube_assistant.llm.hedged_llm import HedgedChatModel
+from src.youtube_assistant.llm.prompt_cache import PromptCachingChatModel
+from src.youtube_assistant.llm.replay_llm import RecordingChatModel, ReplayLLM, get_recording_store
+from src.youtube_assistant.llm.response_cache import get_response_cache
+from src.youtube_assistant.runtime.admission import get_admission_controller
+from src.youtube_assistant.runtime.rate_limiter import get_rate_limiter, get_retry_policy
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+LLM_PROVIDERS: Dict[str, Type[BaseLLMProvider]] = {
+    "Groq": GroqLLM,
+    "OpenAI": OpenAILLM,
+    "Anthropic": AnthropicLLM,
+    "Replay": ReplayLLM
+}
+
+# API key and model selection keys of each provider in user_input
+PROVIDER_INPUT_KEYS: Dict[str, Tuple[str, str]] = {
+    "Groq": ("GROQ_API_KEY", "selected_groq_model"),
+    "OpenAI": ("OPENAI_API_KEY", "selected_openai_model"),
+    "Anthropic": ("ANTHROPIC_API_KEY", "selected_anthropic_model")
+}
+
+
+def api_key_fingerprint(user_input: Dict[str, str]) -> str:
+    """
+    Return a digest of the API key the selected provider resolves to, so runs made with
+    different credentials are never shared. The key is resolved like BaseLLMProvider does.
+
+    Args:
+        user_input: Dictionary containing user configuration settings
+
+    Returns:
+        The hex digest of the API key, or an empty string for providers without one
+    """
+    api_key_name = PROVIDER_INPUT_KEYS.get(user_input['selected_llm'], ("", ""))[0]
+    if not api_key_name:
+        return ""
+
+    api_key = user_input.get(api_key_name) or os.getenv(api_key_name) or st.session_state.get(api_key_name) or ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _wrap_provider_model(llm_model: BaseChatModel, provider: str) -> BaseChatModel:
+    # Anthropic caches the shared transcript prefix only when it is marked
+    if provider == "Anthropic" and Config().get_prompt_cache_settings()['enabled']:
+        llm_model = PromptCachingChatModel(inner=llm_model)
+
+    # Record network responses for offline replay, keyed by the node's messages
+    if provider != "Replay" and Config().get_replay_settings()['record']:
+        llm_model = RecordingChatModel(inner=llm_model, recording_store=get_recording_store())
+
+    # Admit and pace every call through the provider's shared slots and budgets
+    return RateLimitedChatModel(inner=llm_model,
+                                provider_rate_limiter=get_rate_limiter(provider),
+                                retry_policy=get_retry_policy(),
+                                admission_controller=get_admission_controller(provider))
+
+
+def _get_fallback_llm(user_input: Dict[str, str]) -> Optional[BaseChatModel]:
+    """
+    Build the first configured fallback model that differs from the selected one and
+    has an API key the user entered, for hedging.
+
+    Args:
+        user_input: Dictionary containing user configuration settings
+
+    Returns:
+        The rate-limited fallback model, or None if no fallback is usable
+    """
+    selected_llm = user_input['selected_llm']
+    selected_model = user_input.get(PROVIDER_INPUT_KEYS.get(selected_llm, ("", ""))[1])
+
+    for provider, model in Config().get_hedging_settings()['fallbacks']:
+        if provider not in PROVIDER_INPUT_KEYS or (provider, model) == (selected_llm, selected_model):
+            continue
+
+        api_key_name, model_key = PROVIDER_INPUT_KEYS[provider]
+        # Only keys the user entered, since the environment may hold keys of other sessions
+        api_key = user_input.get(api_key_name) or st.session_state.get(api_key_name)
+        if not api_key:
+            continue
+
+        fallback_input = {**user_input, 'selected_llm': provider, api_key_name: api_key, model_key: model}
+        llm_model = LLM_PROVIDERS[provider](fallback_input).get_llm_model()
+        if llm_model:
+            return _wrap_provider_model(llm_model, provider)
+
+    return None
 
 
 def get_llm(user_input: Dict[str, str]) -> Optional[BaseChatModel]:
@@ -18,14 +111,9 @@ def get_llm(user_input: Dict[str, str]) -> Optional[BaseChatModel]:
         Configured LLM model instance or None if initialization fails
     """
 
-    llm_providers: Dict[str, Type[BaseLLMProvider]] = {
-        "Groq": GroqLLM,
-        "OpenAI": OpenAILLM,
-        "Anthropic": AnthropicLLM
-    }
     selected_llm = user_input['selected_llm']
     # Get the appropriate LLM class
-    llm_class = llm_providers.get(selected_llm)
+    llm_class = LLM_PROVIDERS.get(selected_llm)
     
     if llm_class:
         try:
@@ -34,6 +122,26 @@ def get_llm(user_input: Dict[str, str]) -> Optional[BaseChatModel]:
             llm_model = llm_provider.get_llm_model()
             
             if llm_model:
+                llm_model = _wrap_provider_model(llm_model, selected_llm)
+
+                # Hedge slow or failing calls with a model from another provider,
+                # keeping offline replay runs off the network
+                hedging = Config().get_hedging_settings()
+                hedge = hedging['enabled'] and selected_llm != "Replay"
+                fallback_model = _get_fallback_llm(user_input) if hedge else None
+                if fallback_model:
+                    llm_model = HedgedChatModel(inner=llm_model,
+                                                fallback=fallback_model,
+                                                hedge_after_seconds=hedging['hedge_after_seconds'])
+
+                # Serve repeated requests locally unless the use case opted out
+                response_cache = get_response_cache()
+                disabled_usecases = Config().get_llm_cache_settings()['disabled_usecases']
+                if response_cache and user_input.get('selected_usecase') not in disabled_usecases:
+                    llm_model = CachedChatModel(inner=llm_model,
+                                                response_cache=response_cache,
+                                                provider=selected_llm)
+
                 return llm_model
             else:
                 return None
@@ -43,9 +151,9 @@ def get_llm(user_input: Dict[str, str]) -> Optional[BaseChatModel]:
             st.error(error_msg)
             return None
     else:
-        supported_providers = ', '.join(llm_providers.keys())
+        supported_providers = ', '.join(LLM_PROVIDERS.keys())
         error_msg = f"Unsupported LLM provider: {selected_llm}"
         
         st.error(error_msg)
         st.info(f"Supported providers: {supported_providers}")
-        return None
\ No newline at end of file
+        return None
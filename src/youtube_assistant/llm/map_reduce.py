@@ -0,0 +1,178 @@
+from typing import List, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langgraph.constants import TAG_NOSTREAM
+from src.youtube_assistant.llm.tokens import estimate_tokens, split_by_tokens
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+class MapReducePipeline:
+    """
+    Condenses transcripts too long for a single LLM call.
+
+    The transcript is split into token-bounded, overlapping chunks that are summarized
+    in parallel (map). The partial summaries are then merged in groups that fit the
+    chunk budget, level by level, until the result fits in one chunk (reduce). The
+    caller runs its usual prompt on the condensed text.
+    """
+
+    def __init__(self,
+                 llm: BaseChatModel,
+                 token_threshold: int = 6000,
+                 chunk_tokens: int = 4000,
+                 overlap_tokens: int = 200,
+                 max_concurrency: int = 4):
+        """
+        Initialize the map-reduce pipeline.
+
+        Args:
+            llm (BaseChatModel): The chat model used for the map and reduce calls.
+            token_threshold (int): Estimated transcript tokens above which map-reduce is used.
+            chunk_tokens (int): Upper bound on the estimated tokens of a chunk.
+            overlap_tokens (int): Estimated tokens shared by consecutive chunks.
+            max_concurrency (int): Maximum number of LLM calls in flight at once.
+        """
+        self.llm = llm
+        self.token_threshold = token_threshold
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.max_concurrency = max_concurrency
+
+    def applies_to(self, transcript: str) -> bool:
+        """
+        Check whether a transcript is long enough to need map-reduce.
+
+        Args:
+            transcript (str): The transcript text.
+
+        Returns:
+            bool: True if the transcript exceeds the token threshold.
+        """
+        return estimate_tokens(transcript) > self.token_threshold
+
+    def _map_messages(self, chunk: str, index: int, total: int, focus: str) -> List[BaseMessage]:
+        system_msg = SystemMessage(
+            content=(
+                "You are an expert content analyst condensing one part of a long YouTube video transcript. "
+                "Your output will be merged with the condensed versions of the other parts, so keep it "
+                "self-contained and faithful to the source.\n\n"
+                f"Focus on: {focus}"
+            )
+        )
+        human_msg = HumanMessage(
+            content=(
+                f"This is part {index} of {total} of the transcript. Consecutive parts overlap slightly.\n\n"
+                f"{chunk}\n\n"
+                "Condense this part into concise markdown bullet points, preserving key points, facts, "
+                "figures, definitions, examples and notable quotes in their original order."
+            )
+        )
+        return [system_msg, human_msg]
+
+    def _reduce_messages(self, partials: List[str], focus: str) -> List[BaseMessage]:
+        system_msg = SystemMessage(
+            content=(
+                "You are an expert content analyst merging condensed parts of a long YouTube video transcript "
+                "into one condensed version.\n\n"
+                f"Focus on: {focus}"
+            )
+        )
+        parts = "\n\n".join(f"### Part {index}\n{partial}" for index, partial in enumerate(partials, start=1))
+        human_msg = HumanMessage(
+            content=(
+                f"Merge these consecutive condensed parts into one set of markdown bullet points:\n\n{parts}\n\n"
+                "Remove repetition caused by overlapping parts, keep the original order, and preserve "
+                "key points, facts, figures, definitions, examples and notable quotes."
+            )
+        )
+        return [system_msg, human_msg]
+
+    def _group(self, partials: List[str]) -> List[List[str]]:
+        # Greedily pack partials into groups that fit one call, with at least two per
+        # group so every reduce level shrinks the number of partials
+        groups: List[List[str]] = []
+        group: List[str] = []
+        group_tokens = 0
+
+        for partial in partials:
+            tokens = estimate_tokens(partial)
+            if len(group) >= 2 and group_tokens + tokens > self.chunk_tokens:
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(partial)
+            group_tokens += tokens
+
+        if len(group) == 1 and groups:
+            groups[-1].append(group[0])
+        elif group:
+            groups.append(group)
+        return groups
+
+    def _invoke_all(self, message_lists: List[List[BaseMessage]]) -> List[str]:
+        # Intermediate chunk summaries are not streamed to the UI
+        responses = self.llm.batch(message_lists, config={'max_concurrency': self.max_concurrency,
+                                                          'tags': [TAG_NOSTREAM]})
+        return [response.content for response in responses]
+
+    async def _ainvoke_all(self, message_lists: List[List[BaseMessage]]) -> List[str]:
+        responses = await self.llm.abatch(message_lists, config={'max_concurrency': self.max_concurrency,
+                                                                 'tags': [TAG_NOSTREAM]})
+        return [response.content for response in responses]
+
+    def condense(self, transcript: str, focus: str) -> str:
+        """
+        Condense a long transcript with a parallel map phase and a hierarchical reduce.
+
+        Args:
+            transcript (str): The transcript text.
+            focus (str): What the condensed text should preserve for the final prompt.
+
+        Returns:
+            str: The condensed transcript, within the chunk token budget where possible.
+        """
+        chunks = split_by_tokens(transcript, self.chunk_tokens, self.overlap_tokens)
+        partials = self._invoke_all([
+            self._map_messages(chunk, index, len(chunks), focus)
+            for index, chunk in enumerate(chunks, start=1)
+        ])
+
+        while len(partials) > 1 and estimate_tokens("\n\n".join(partials)) > self.chunk_tokens:
+            partials = self._invoke_all([self._reduce_messages(group, focus) for group in self._group(partials)])
+
+        return "\n\n".join(partials)
+
+    async def acondense(self, transcript: str, focus: str) -> str:
+        """Async variant of condense."""
+        chunks = split_by_tokens(transcript, self.chunk_tokens, self.overlap_tokens)
+        partials = await self._ainvoke_all([
+            self._map_messages(chunk, index, len(chunks), focus)
+            for index, chunk in enumerate(chunks, start=1)
+        ])
+
+        while len(partials) > 1 and estimate_tokens("\n\n".join(partials)) > self.chunk_tokens:
+            partials = await self._ainvoke_all([self._reduce_messages(group, focus) for group in self._group(partials)])
+
+        return "\n\n".join(partials)
+
+
+def get_map_reduce_pipeline(llm: BaseChatModel) -> Optional[MapReducePipeline]:
+    """
+    Build a map-reduce pipeline for a chat model, configured in uiconfigfile.ini.
+
+    Args:
+        llm (BaseChatModel): The chat model used for the map and reduce calls.
+
+    Returns:
+        Optional[MapReducePipeline]: The pipeline, or None if map-reduce is disabled.
+    """
+    settings = Config().get_map_reduce_settings()
+    if not settings['enabled']:
+        return None
+
+    return MapReducePipeline(
+        llm=llm,
+        token_threshold=settings['token_threshold'],
+        chunk_tokens=settings['chunk_tokens'],
+        overlap_tokens=settings['overlap_tokens'],
+        max_concurrency=settings['max_concurrency']
+    )
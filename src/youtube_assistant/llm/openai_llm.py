@@ -2,6 +2,7 @@ from typing import Optional
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 from src.youtube_assistant.llm.base_llm import BaseLLMProvider
+from src.youtube_assistant.llm.client_registry import get_llm_registry
 
 
 
@@ -20,16 +21,23 @@ class OpenAILLM(BaseLLMProvider):
                                            api_key_name="OPENAI_API_KEY",
                                            model_name="OpenAI"):
                 try:
-                    self.llm = ChatOpenAI(
+                    self.llm = get_llm_registry().get_or_create(
+                        provider="OpenAI",
+                        model_class=ChatOpenAI,
                         api_key=openai_api_key,
                         model=openai_selected_model,
                         max_tokens=10_000,
-                        temperature=0.7
+                        temperature=0.7,
+                        # Report token usage on streamed responses too, for telemetry
+                        stream_usage=True
                     )
                 except Exception as e:
-                    self.llm = ChatOpenAI(
+                    self.llm = get_llm_registry().get_or_create(
+                        provider="OpenAI",
+                        model_class=ChatOpenAI,
                         api_key=openai_api_key,
                         model=openai_selected_model,
+                        stream_usage=True
                     )
                 return self.llm
 
@@ -0,0 +1,92 @@
+from typing import Any, AsyncIterator, Iterator, List, Optional
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from src.youtube_assistant.llm.wrapped_llm import ChatModelWrapper
+
+
+# Bump when the node prompts change, so runs on old and new prompts are never shared
+PROMPT_VERSION = 1
+
+
+def transcript_prefix_message(transcript: str) -> SystemMessage:
+    """
+    Build the system message every transcript prompt starts with.
+
+    The message holds the transcript and nothing node-specific, so the title, content,
+    summary and notes calls on the same video send a byte-identical prefix that the
+    provider's prompt cache can reuse. Node instructions follow in the human message.
+
+    Args:
+        transcript (str): The transcript, or its condensed version.
+
+    Returns:
+        SystemMessage: The shared prefix message.
+    """
+    return SystemMessage(
+        content=(
+            "You are an expert content writer working from the transcript of a YouTube video. "
+            "Use only the transcript below as the source of your answer, and follow the instructions "
+            "in the next message.\n\n"
+            f"Transcript:\n{transcript}"
+        )
+    )
+
+
+def _mark_system_prefix(messages: List[BaseMessage]) -> List[BaseMessage]:
+    # Put a cache breakpoint on the last block of the leading system message
+    if not messages or not isinstance(messages[0], SystemMessage):
+        return messages
+
+    content = messages[0].content
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = [dict(block) if isinstance(block, dict) else {"type": "text", "text": block} for block in content]
+    if not blocks:
+        return messages
+
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return [messages[0].model_copy(update={"content": blocks}), *messages[1:]]
+
+
+class PromptCachingChatModel(ChatModelWrapper):
+    """
+    Chat model that marks the leading system message as an Anthropic prompt-cache
+    breakpoint.
+
+    Anthropic only caches prompt prefixes that carry an explicit cache_control marker.
+    OpenAI and Groq cache long identical prefixes automatically, so their models are
+    not wrapped.
+    """
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any) -> ChatResult:
+        return self.inner._generate(_mark_system_prefix(messages), stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        return await self.inner._agenerate(_mark_system_prefix(messages), stop=stop, run_manager=run_manager,
+                                           **kwargs)
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        yield from self.inner._stream(_mark_system_prefix(messages), stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        async for chunk in self.inner._astream(_mark_system_prefix(messages), stop=stop, run_manager=run_manager,
+                                               **kwargs):
+            yield chunk
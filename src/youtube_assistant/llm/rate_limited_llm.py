@@ -0,0 +1,155 @@
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Iterator, List, Optional
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langgraph.config import get_stream_writer
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from src.youtube_assistant.llm.tokens import estimate_message_tokens
+from src.youtube_assistant.llm.wrapped_llm import ChatModelWrapper
+from src.youtube_assistant.runtime.admission import AdmissionController
+from src.youtube_assistant.runtime.rate_limiter import ProviderRateLimiter, RetryPolicy
+
+
+def _total_tokens(message: Optional[BaseMessage]) -> int:
+    usage = getattr(message, "usage_metadata", None) or {}
+    return usage.get("total_tokens", 0)
+
+
+def _no_op() -> None:
+    pass
+
+
+def _report_queue_position(provider: str):
+    def report(position: int, estimated_wait_seconds: float) -> None:
+        # Surfaces in the graph's "custom" stream, shown by the UI while the call waits
+        # Outside a runnable there is no config (RuntimeError), and a runnable that is not
+        # part of a graph has no graph runtime in its config (KeyError)
+        try:
+            writer = get_stream_writer()
+        except (RuntimeError, KeyError):
+            return
+        writer({'admission_queue': {'provider': provider,
+                                    'position': position,
+                                    'estimated_wait_seconds': round(estimated_wait_seconds, 1)}})
+    return report
+
+
+class RateLimitedChatModel(ChatModelWrapper):
+    """
+    Chat model that paces calls through a provider's rate limiter and retries
+    throttled or transient failures with jittered exponential backoff.
+
+    Each call first takes one of the provider's concurrency slots from the optional
+    admission controller, queueing in FIFO order across sessions, and holds it through
+    its retries. Each attempt reserves one request and the estimated prompt tokens; the
+    token budget is corrected with the provider-reported usage once the call returns.
+    Streams are only retried while no chunk has been emitted yet. An optional
+    on_admitted callable in the call kwargs is called whenever an attempt is sent, after
+    the admission and rate limit waits.
+    """
+
+    provider_rate_limiter: ProviderRateLimiter
+    retry_policy: RetryPolicy
+    admission_controller: Optional[AdmissionController] = None
+
+    def _slot(self):
+        if self.admission_controller is None:
+            return nullcontext()
+        return self.admission_controller.slot(_report_queue_position(self.admission_controller.name))
+
+    def _aslot(self):
+        if self.admission_controller is None:
+            return nullcontext()
+        return self.admission_controller.aslot(_report_queue_position(self.admission_controller.name))
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any) -> ChatResult:
+        estimated_tokens = estimate_message_tokens(messages)
+        on_admitted = kwargs.pop('on_admitted', None) or _no_op
+
+        def attempt() -> ChatResult:
+            self.provider_rate_limiter.acquire(estimated_tokens)
+            on_admitted()
+            return self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        with self._slot():
+            result = self.retry_policy.call(attempt)
+        self.provider_rate_limiter.reconcile(estimated_tokens, _total_tokens(result.generations[0].message))
+        return result
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        estimated_tokens = estimate_message_tokens(messages)
+        on_admitted = kwargs.pop('on_admitted', None) or _no_op
+
+        async def attempt() -> ChatResult:
+            await self.provider_rate_limiter.aacquire(estimated_tokens)
+            on_admitted()
+            return await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        async with self._aslot():
+            result = await self.retry_policy.acall(attempt)
+        self.provider_rate_limiter.reconcile(estimated_tokens, _total_tokens(result.generations[0].message))
+        return result
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        estimated_tokens = estimate_message_tokens(messages)
+        on_admitted = kwargs.pop('on_admitted', None) or _no_op
+
+        def start() -> tuple:
+            # Pull the first chunk inside the retry so throttled stream openings are retried
+            self.provider_rate_limiter.acquire(estimated_tokens)
+            on_admitted()
+            chunks = self.inner._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            return chunks, next(chunks, None)
+
+        with self._slot():
+            chunks, first = self.retry_policy.call(start)
+            if first is None:
+                return
+
+            actual_tokens = _total_tokens(first.message)
+            yield first
+            for chunk in chunks:
+                actual_tokens += _total_tokens(chunk.message)
+                yield chunk
+        self.provider_rate_limiter.reconcile(estimated_tokens, actual_tokens)
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        estimated_tokens = estimate_message_tokens(messages)
+        on_admitted = kwargs.pop('on_admitted', None) or _no_op
+
+        async def start() -> tuple:
+            await self.provider_rate_limiter.aacquire(estimated_tokens)
+            on_admitted()
+            chunks = self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs).__aiter__()
+            try:
+                return chunks, await chunks.__anext__()
+            except StopAsyncIteration:
+                return chunks, None
+
+        async with self._aslot():
+            chunks, first = await self.retry_policy.acall(start)
+            if first is None:
+                return
+
+            actual_tokens = _total_tokens(first.message)
+            yield first
+            async for chunk in chunks:
+                actual_tokens += _total_tokens(chunk.message)
+                yield chunk
+        self.provider_rate_limiter.reconcile(estimated_tokens, actual_tokens)
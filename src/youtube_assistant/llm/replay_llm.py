@@ -0,0 +1,350 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    message_chunk_to_message,
+    message_to_dict,
+    messages_from_dict
+)
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from src.youtube_assistant.llm.base_llm import BaseLLMProvider
+from src.youtube_assistant.llm.tokens import CHARS_PER_TOKEN, estimate_message_tokens, estimate_tokens
+from src.youtube_assistant.llm.wrapped_llm import ChatModelWrapper
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+REPLAY_MODES = ("synthetic", "replay")
+
+_WORDS = (
+    "video", "transcript", "speaker", "explains", "model", "data", "results", "example", "process",
+    "important", "because", "however", "system", "approach", "key", "point", "shows", "team", "users",
+    "performance", "design", "question", "answer", "practice", "value", "the", "a", "of", "and", "to",
+    "in", "is", "that", "for", "with", "on", "this", "it", "as", "how"
+)
+
+# PydanticOutputParser format instructions end with the JSON schema in a code fence
+_OUTPUT_SCHEMA = re.compile(r"Here is the output schema:\s*```\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def message_key(messages: List[BaseMessage]) -> str:
+    """
+    Hash a message list into the key recorded responses are stored under.
+
+    Args:
+        messages (List[BaseMessage]): The prompt messages.
+
+    Returns:
+        str: The SHA-256 hex digest of the serialized messages.
+    """
+    serialized = json.dumps([message_to_dict(message) for message in messages],
+                            sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class LLMRecordingStore:
+    """
+    JSONL file of recorded LLM responses keyed by message hash.
+
+    Each line holds one key and the serialized response message. Later lines win, so
+    re-recording a prompt replaces its response.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the recording store, loading existing recordings.
+
+        Args:
+            path (str): The JSONL file the recordings are read from and appended to.
+        """
+        self.path = path
+        self._recordings: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if os.path.exists(path):
+            with open(path, mode='r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        recording = json.loads(line)
+                        self._recordings[recording['key']] = recording['message']
+
+    def get(self, key: str) -> Optional[BaseMessage]:
+        with self._lock:
+            recording = self._recordings.get(key)
+        return messages_from_dict([recording])[0] if recording else None
+
+    def put(self, key: str, message: BaseMessage) -> None:
+        serialized = message_to_dict(message)
+        with self._lock:
+            self._recordings[key] = serialized
+            with open(self.path, mode='a', encoding='utf-8') as f:
+                f.write(json.dumps({'key': key, 'message': serialized}, default=str) + "\n")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._recordings)
+
+
+class RecordingChatModel(ChatModelWrapper):
+    """
+    Chat model that records the inner model's responses for later replay.
+
+    Streams are recorded once they complete.
+    """
+
+    recording_store: LLMRecordingStore
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any) -> ChatResult:
+        result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self.recording_store.put(message_key(messages), result.generations[0].message)
+        return result
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self.recording_store.put(message_key(messages), result.generations[0].message)
+        return result
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        generation = None
+        for chunk in self.inner._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            generation = chunk if generation is None else generation + chunk
+            yield chunk
+
+        if generation is not None:
+            self.recording_store.put(message_key(messages), message_chunk_to_message(generation.message))
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        generation = None
+        async for chunk in self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            generation = chunk if generation is None else generation + chunk
+            yield chunk
+
+        if generation is not None:
+            self.recording_store.put(message_key(messages), message_chunk_to_message(generation.message))
+
+
+class ReplayChatModel(BaseChatModel):
+    """
+    Offline chat model for benchmarks and load tests.
+
+    In replay mode it answers with the response recorded for the same messages. In
+    synthetic mode it generates filler text of a sampled size, as JSON when the prompt
+    asks for a PydanticOutputParser schema. Both modes wait a sampled time to first
+    token and stream at a sampled throughput. Samples are seeded by the message hash,
+    so the same prompt always gets the same output and timings.
+    """
+
+    mode: str = "synthetic"
+    recording_store: Optional[LLMRecordingStore] = None
+    seed: int = 0
+    ttft_seconds: float = 0.5
+    ttft_jitter_seconds: float = 0.1
+    tokens_per_second: float = 80.0
+    tokens_per_second_jitter: float = 10.0
+    output_tokens: int = 800
+    output_tokens_jitter: int = 200
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {'model_name': f"replay-{self.mode}", 'seed': self.seed, 'output_tokens': self.output_tokens}
+
+    def _get_ls_params(self, stop: Optional[List[str]] = None, **kwargs: Any):
+        params = super()._get_ls_params(stop=stop, **kwargs)
+        params.update(ls_provider="replay", ls_model_name=f"replay-{self.mode}")
+        return params
+
+    def _synthetic_text(self, rng: random.Random, tokens: int) -> str:
+        paragraphs = []
+        words: List[str] = []
+        section = 1
+        # At least one word, since even empty text estimates to one token
+        while not (paragraphs or words) or estimate_tokens("\n\n".join(paragraphs + [" ".join(words)])) < tokens:
+            words.append(rng.choice(_WORDS))
+            if len(words) == 60:
+                if len(paragraphs) % 3 == 0:
+                    paragraphs.append(f"## Section {section}")
+                    section += 1
+                paragraphs.append(" ".join(words).capitalize() + ".")
+                words = []
+        if words:
+            paragraphs.append(" ".join(words).capitalize() + ".")
+        return "\n\n".join(paragraphs)
+
+    def _synthetic_content(self, messages: List[BaseMessage], rng: random.Random, tokens: int) -> str:
+        schema_match = _OUTPUT_SCHEMA.search(messages[-1].text) if messages else None
+        if not schema_match:
+            return self._synthetic_text(rng, tokens)
+
+        properties = json.loads(schema_match.group(1)).get('properties', {})
+        return json.dumps({
+            name: self._synthetic_text(rng, 12) if 'title' in name else self._synthetic_text(rng, tokens)
+            for name in properties
+        })
+
+    def _plan(self, messages: List[BaseMessage]) -> Tuple[AIMessage, float, float]:
+        # The response and its timings: seconds to first token and tokens per second
+        key = message_key(messages)
+        rng = random.Random(f"{self.seed}:{key}")
+        ttft = max(0.0, rng.gauss(self.ttft_seconds, self.ttft_jitter_seconds))
+        tokens_per_second = max(1.0, rng.gauss(self.tokens_per_second, self.tokens_per_second_jitter))
+
+        if self.mode == "replay":
+            message = self.recording_store.get(key) if self.recording_store else None
+            if message is None:
+                raise KeyError(f"No recorded response for this prompt (key {key[:12]}). "
+                               "Record it first with RECORD = True in [REPLAY].")
+            return AIMessage(**message.model_dump(exclude={'type'})), ttft, tokens_per_second
+
+        tokens = max(1, int(rng.gauss(self.output_tokens, self.output_tokens_jitter)))
+        content = self._synthetic_content(messages, rng, tokens)
+        input_tokens = estimate_message_tokens(messages)
+        output_tokens = estimate_tokens(content)
+        message = AIMessage(
+            content=content,
+            response_metadata={'model_name': f"replay-{self.mode}"},
+            usage_metadata={'input_tokens': input_tokens,
+                            'output_tokens': output_tokens,
+                            'total_tokens': input_tokens + output_tokens}
+        )
+        return message, ttft, tokens_per_second
+
+    def _chunks(self, message: AIMessage) -> Iterator[Tuple[AIMessageChunk, float]]:
+        # One chunk per word, paired with its share of the estimated tokens
+        pieces = re.findall(r"\S+\s*|\s+", message.text) or [""]
+        for index, piece in enumerate(pieces):
+            last = index == len(pieces) - 1
+            yield AIMessageChunk(
+                content=piece,
+                response_metadata=message.response_metadata if last else {},
+                usage_metadata=message.usage_metadata if last else None
+            ), len(piece) / CHARS_PER_TOKEN
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any) -> ChatResult:
+        message, ttft, tokens_per_second = self._plan(messages)
+        time.sleep(ttft + estimate_tokens(message.text) / tokens_per_second)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self,
+                         messages: List[BaseMessage],
+                         stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        message, ttft, tokens_per_second = self._plan(messages)
+        await asyncio.sleep(ttft + estimate_tokens(message.text) / tokens_per_second)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        message, ttft, tokens_per_second = self._plan(messages)
+        time.sleep(ttft)
+        # Pace against the stream's start, so sleep overhead does not add up per chunk
+        started, emitted = time.monotonic(), 0
+        for chunk, tokens in self._chunks(message):
+            yield ChatGenerationChunk(message=chunk)
+            emitted += tokens
+            time.sleep(max(0.0, started + emitted / tokens_per_second - time.monotonic()))
+
+    async def _astream(self,
+                       messages: List[BaseMessage],
+                       stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        message, ttft, tokens_per_second = self._plan(messages)
+        await asyncio.sleep(ttft)
+        started, emitted = time.monotonic(), 0
+        for chunk, tokens in self._chunks(message):
+            yield ChatGenerationChunk(message=chunk)
+            emitted += tokens
+            await asyncio.sleep(max(0.0, started + emitted / tokens_per_second - time.monotonic()))
+
+
+_recording_store: Optional[LLMRecordingStore] = None
+_recording_store_lock = threading.Lock()
+
+
+def get_recording_store() -> LLMRecordingStore:
+    """
+    Return the process-wide recording store, configured in uiconfigfile.ini.
+
+    Returns:
+        LLMRecordingStore: The shared recording store.
+    """
+    global _recording_store
+
+    with _recording_store_lock:
+        if _recording_store is None:
+            _recording_store = LLMRecordingStore(Config().get_replay_settings()['recordings_path'])
+
+        return _recording_store
+
+
+class ReplayLLM(BaseLLMProvider):
+
+    def get_llm_model(self) -> Optional[BaseChatModel]:
+        try:
+            self.error_messages = []
+
+            replay_mode = self.user_input.get('selected_replay_model')
+            if replay_mode not in REPLAY_MODES:
+                self.error_messages.append(f"Please select a Replay mode: {', '.join(REPLAY_MODES)}.")
+                self.display_errors()
+                return None
+
+            settings = Config().get_replay_settings()
+            self.llm = ReplayChatModel(
+                mode=replay_mode,
+                recording_store=get_recording_store() if replay_mode == "replay" else None,
+                seed=settings['seed'],
+                ttft_seconds=settings['ttft_seconds'],
+                ttft_jitter_seconds=settings['ttft_jitter_seconds'],
+                tokens_per_second=settings['tokens_per_second'],
+                tokens_per_second_jitter=settings['tokens_per_second_jitter'],
+                output_tokens=settings['output_tokens'],
+                output_tokens_jitter=settings['output_tokens_jitter']
+            )
+            return self.llm
+
+        except Exception as e:
+            self.error_messages.append(f"Error initializing Replay LLM: {str(e)}")
+            self.display_errors()
+            return None
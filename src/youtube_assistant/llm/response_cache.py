@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from src.youtube_assistant.runtime.sqlite_store import SQLiteStore
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+class LLMResponseCache(SQLiteStore):
+    """
+    Two-tier store for chat-model responses.
+
+    Responses are kept in an in-memory LRU tier in front of a persistent SQLite tier,
+    keyed by a request hash. Serialized messages are stored compressed, expire after
+    a configurable TTL, and the least recently used rows are evicted once the total
+    stored size exceeds the configured limit.
+    """
+
+    table = "responses"
+
+    def __init__(self,
+                 db_path: str,
+                 memory_max_entries: int = 256,
+                 ttl_seconds: int = 7 * 86_400,
+                 max_size_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+            memory_max_entries (int): Number of responses kept in the in-memory tier.
+            ttl_seconds (int): Time-to-live of a cached response in seconds.
+            max_size_bytes (int): Upper bound on the total compressed payload size on disk.
+        """
+        self.memory_max_entries = memory_max_entries
+        self.memory_hits = 0
+        # key -> (created_at, serialized messages)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        super().__init__(db_path, ttl_seconds, max_size_bytes)
+
+    def _remember(self, key: str, created_at: float, messages: List[Dict]) -> None:
+        with self._lock:
+            self._memory[key] = (created_at, messages)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): The request hash.
+
+        Returns:
+            Optional[List[Dict]]: The serialized response messages, or None on a miss.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and time.time() - entry[0] <= self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[1]
+
+        entry = self._load((key,))
+        if entry is not None:
+            messages, created_at = entry
+            self._remember(key, created_at, messages)
+            # Hits of the SQLite tier are the store's hits
+            self._count(hit=True)
+            return messages
+
+        with self._lock:
+            self._memory.pop(key, None)
+        self._count(hit=False)
+        return None
+
+    def put(self, key: str, messages: List[Dict]) -> None:
+        """
+        Store a response in both tiers and evict least recently used rows if over the size limit.
+
+        Args:
+            key (str): The request hash.
+            messages (List[Dict]): The serialized response messages.
+        """
+        self._remember(key, time.time(), messages)
+        self._store((key,), messages)
+
+    def clear(self) -> None:
+        """Remove every cached response and reset the counters."""
+        super().clear()
+        with self._lock:
+            self._memory.clear()
+            self.memory_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, float]: Hit counts per tier, miss count, hit rate, entry counts
+            and stored size.
+        """
+        entries, size = self._storage_stats()
+
+        with self._lock:
+            memory_hits, disk_hits, misses = self.memory_hits, self.hits, self.misses
+            memory_entries = len(self._memory)
+
+        hits = memory_hits + disk_hits
+        lookups = hits + misses
+        return {
+            "memory_hits": memory_hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "entries": entries,
+            "size_bytes": size
+        }
+
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_loaded = False
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Return the process-wide LLM response cache configured in uiconfigfile.ini.
+
+    Returns:
+        Optional[LLMResponseCache]: The shared cache, or None if caching is disabled.
+    """
+    global _response_cache, _response_cache_loaded
+
+    with _response_cache_lock:
+        if not _response_cache_loaded:
+            settings = Config().get_llm_cache_settings()
+            if settings['enabled']:
+                _response_cache = LLMResponseCache(
+                    db_path=settings['db_path'],
+                    memory_max_entries=settings['memory_max_entries'],
+                    ttl_seconds=settings['ttl_seconds'],
+                    max_size_bytes=settings['max_size_mb'] * 1024 * 1024
+                )
+            _response_cache_loaded = True
+
+        return _response_cache
@@ -0,0 +1,54 @@
+from typing import Any, List
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.output_parsers import BaseOutputParser
+
+
+def _reask_messages(messages: List[BaseMessage],
+                    response: BaseMessage,
+                    error: OutputParserException,
+                    parser: BaseOutputParser) -> List[BaseMessage]:
+    # The re-ask extends the conversation, so the shared transcript prefix stays cached
+    return [
+        *messages,
+        AIMessage(content=response.text),
+        HumanMessage(
+            content=(
+                f"Your answer could not be parsed: {error}\n\n"
+                f"{parser.get_format_instructions()}\n\n"
+                "Answer again with only the requested output."
+            )
+        )
+    ]
+
+
+def invoke_with_parse_retry(llm: BaseChatModel, parser: BaseOutputParser, messages: List[BaseMessage]) -> Any:
+    """
+    Invoke the model and parse its response, re-asking once if the response does not parse.
+
+    Args:
+        llm (BaseChatModel): The chat model.
+        parser (BaseOutputParser): The parser of the expected output format.
+        messages (List[BaseMessage]): The prompt messages.
+
+    Returns:
+        Any: The parsed output.
+
+    Raises:
+        OutputParserException: If the response to the re-ask does not parse either.
+    """
+    response = llm.invoke(messages)
+    try:
+        return parser.invoke(response)
+    except OutputParserException as e:
+        return parser.invoke(llm.invoke(_reask_messages(messages, response, e, parser)))
+
+
+async def ainvoke_with_parse_retry(llm: BaseChatModel, parser: BaseOutputParser, messages: List[BaseMessage]) -> Any:
+    """Async variant of invoke_with_parse_retry."""
+    response = await llm.ainvoke(messages)
+    try:
+        return parser.invoke(response)
+    except OutputParserException as e:
+        return parser.invoke(await llm.ainvoke(_reask_messages(messages, response, e, parser)))
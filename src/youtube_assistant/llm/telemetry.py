@@ -0,0 +1,295 @@
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+from src.youtube_assistant.llm.tokens import estimate_message_tokens, estimate_tokens
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+@dataclass
+class LLMCallRecord:
+    """Token usage, latency and cost of a single chat model call."""
+
+    run_id: str
+    usecase: str
+    node: str
+    provider: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    wall_seconds: float = 0.0
+    time_to_first_token_seconds: Optional[float] = None
+    cost_usd: Optional[float] = None
+    usage_estimated: bool = False
+    cached: bool = False
+    error: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+def summarize_records(records: Iterable[LLMCallRecord], key: str) -> List[Dict[str, Any]]:
+    """
+    Aggregate call records by one of their fields.
+
+    Args:
+        records (Iterable[LLMCallRecord]): The call records.
+        key (str): The record field to group by, e.g. "node" or "usecase".
+
+    Returns:
+        List[Dict[str, Any]]: One row per group with call counts, token totals, the share of
+            prompt tokens read from the provider's prompt cache, latency and cost.
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        group = groups.setdefault(getattr(record, key), {
+            key: getattr(record, key),
+            'calls': 0,
+            'cached_calls': 0,
+            'failed_calls': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'cache_read_tokens': 0,
+            'prompt_cache_hit_rate': 0.0,
+            'wall_seconds': 0.0,
+            'cost_usd': 0.0
+        })
+        group['calls'] += 1
+        group['cached_calls'] += int(record.cached)
+        group['failed_calls'] += int(record.error is not None)
+        group['prompt_tokens'] += record.prompt_tokens
+        group['completion_tokens'] += record.completion_tokens
+        group['cache_read_tokens'] += record.cache_read_tokens
+        if group['prompt_tokens']:
+            group['prompt_cache_hit_rate'] = round(group['cache_read_tokens'] / group['prompt_tokens'], 3)
+        group['wall_seconds'] = round(group['wall_seconds'] + record.wall_seconds, 3)
+        group['cost_usd'] = round(group['cost_usd'] + (record.cost_usd or 0.0), 6)
+
+    return list(groups.values())
+
+
+class TelemetryStore:
+    """
+    Process-wide sink for LLM call records.
+
+    Records are appended to a JSONL file, one call per line, and kept in memory so
+    totals per use case can be shown across runs.
+    """
+
+    def __init__(self, jsonl_path: Optional[str] = None, max_records: int = 10000):
+        """
+        Initialize the telemetry store.
+
+        Args:
+            jsonl_path (Optional[str]): File the records are appended to, or None to keep them in memory only.
+            max_records (int): Maximum number of records kept in memory.
+        """
+        self.jsonl_path = jsonl_path
+        self.max_records = max_records
+        self._records: List[LLMCallRecord] = []
+        self._lock = threading.Lock()
+
+        if jsonl_path and os.path.dirname(jsonl_path):
+            os.makedirs(os.path.dirname(jsonl_path), exist_ok=True)
+
+    def add(self, records: List[LLMCallRecord]) -> None:
+        """Append the records of a run to the JSONL file and the in-memory history."""
+        if not records:
+            return
+
+        with self._lock:
+            if self.jsonl_path:
+                with open(self.jsonl_path, mode='a', encoding='utf-8') as f:
+                    for record in records:
+                        f.write(json.dumps(asdict(record)) + "\n")
+
+            self._records.extend(records)
+            del self._records[:-self.max_records]
+
+    def records(self) -> List[LLMCallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def usecase_summary(self) -> List[Dict[str, Any]]:
+        """Aggregate the recorded calls per use case."""
+        return summarize_records(self.records(), key='usecase')
+
+
+class LLMTelemetryHandler(BaseCallbackHandler):
+    """
+    Callback handler recording every chat model call of one graph run.
+
+    Tokens come from the response usage metadata, or are estimated when the provider
+    does not report them (e.g. some streamed responses). The calling node is taken from
+    the LangGraph run metadata, and cost from the price table in uiconfigfile.ini.
+    A call that delegates to child model runs, such as a hedged call and its
+    contenders, is recorded through its children only.
+    """
+
+    # Record timings on the calling thread, also for async runs
+    run_inline = True
+
+    def __init__(self, usecase: str, store: Optional[TelemetryStore] = None):
+        """
+        Initialize the handler for one graph run.
+
+        Args:
+            usecase (str): The use case the graph runs.
+            store (Optional[TelemetryStore]): Where flush sends the records.
+        """
+        self.usecase = usecase
+        self.store = store
+        self.run_id = uuid.uuid4().hex
+        self.records: List[LLMCallRecord] = []
+        self._flushed = 0
+        self._calls: Dict[Any, Dict[str, Any]] = {}
+        self._prices: Dict[str, Optional[tuple]] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self,
+                            serialized: Dict[str, Any],
+                            messages: List[List[BaseMessage]],
+                            *,
+                            run_id: Any,
+                            parent_run_id: Optional[Any] = None,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            **kwargs: Any) -> None:
+        metadata = metadata or {}
+        with self._lock:
+            parent = self._calls.get(parent_run_id)
+            if parent is not None:
+                parent['delegated'] = True
+            self._calls[run_id] = {
+                'start': time.perf_counter(),
+                'first_token': None,
+                'node': metadata.get('langgraph_node', ''),
+                'provider': metadata.get('ls_provider', ''),
+                'model': metadata.get('ls_model_name', ''),
+                'prompt_tokens': estimate_message_tokens(messages[0]) if messages else 0,
+                'delegated': False
+            }
+
+    def on_llm_new_token(self, token: str, *, run_id: Any, **kwargs: Any) -> None:
+        with self._lock:
+            call = self._calls.get(run_id)
+            if call is not None and call['first_token'] is None:
+                call['first_token'] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: Any, **kwargs: Any) -> None:
+        with self._lock:
+            call = self._calls.pop(run_id, None)
+        if call is None or call['delegated']:
+            return
+
+        record = self._new_record(call)
+        message = getattr(response.generations[0][0], 'message', None) if response.generations else None
+        if message is not None:
+            response_metadata = message.response_metadata or {}
+            # The model that answered, which differs from the selected one when a hedge won
+            record.model = response_metadata.get('model_name') or response_metadata.get('model') or record.model
+            record.cached = bool(response_metadata.get('cached'))
+
+            usage = getattr(message, 'usage_metadata', None)
+            if usage:
+                record.prompt_tokens = usage.get('input_tokens', 0)
+                record.completion_tokens = usage.get('output_tokens', 0)
+                input_details = usage.get('input_token_details') or {}
+                record.cache_read_tokens = input_details.get('cache_read') or 0
+                record.cache_creation_tokens = input_details.get('cache_creation') or 0
+            elif not record.cached:
+                record.prompt_tokens = call['prompt_tokens']
+                record.completion_tokens = estimate_tokens(message.text)
+                record.usage_estimated = True
+
+        if record.cached:
+            record.cost_usd = 0.0
+        else:
+            record.cost_usd = self._cost(record)
+        self._add(record)
+
+    def on_llm_error(self, error: BaseException, *, run_id: Any, **kwargs: Any) -> None:
+        with self._lock:
+            call = self._calls.pop(run_id, None)
+        if call is None or call['delegated']:
+            return
+
+        record = self._new_record(call)
+        record.error = f"{type(error).__name__}: {error}"
+        self._add(record)
+
+    def _new_record(self, call: Dict[str, Any]) -> LLMCallRecord:
+        now = time.perf_counter()
+        return LLMCallRecord(
+            run_id=self.run_id,
+            usecase=self.usecase,
+            node=call['node'],
+            provider=call['provider'],
+            model=call['model'],
+            wall_seconds=round(now - call['start'], 3),
+            time_to_first_token_seconds=round(call['first_token'] - call['start'], 3) if call['first_token'] else None
+        )
+
+    def _cost(self, record: LLMCallRecord) -> Optional[float]:
+        if record.model not in self._prices:
+            self._prices[record.model] = Config().get_llm_price(record.model)
+
+        price = self._prices[record.model]
+        if price is None:
+            return None
+
+        input_price, output_price, cached_input_price, cache_write_price = price
+        # Prompt tokens include those read from and written to the prompt cache, which
+        # Anthropic bills at a discount and a premium respectively
+        uncached_tokens = max(0, record.prompt_tokens - record.cache_read_tokens - record.cache_creation_tokens)
+        return round((uncached_tokens * input_price
+                      + record.cache_read_tokens * cached_input_price
+                      + record.cache_creation_tokens * cache_write_price
+                      + record.completion_tokens * output_price) / 1_000_000, 6)
+
+    def _add(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def node_summary(self) -> List[Dict[str, Any]]:
+        """Aggregate the calls of this run per node."""
+        with self._lock:
+            records = list(self.records)
+        return summarize_records(records, key='node')
+
+    def flush(self) -> None:
+        """Send the records of this run to the store."""
+        with self._lock:
+            records = self.records[self._flushed:]
+            self._flushed = len(self.records)
+        if self.store:
+            self.store.add(records)
+
+
+_telemetry_store: Optional[TelemetryStore] = None
+_telemetry_store_lock = threading.Lock()
+
+
+def get_telemetry_store() -> Optional[TelemetryStore]:
+    """
+    Return the process-wide telemetry store, configured in uiconfigfile.ini.
+
+    Returns:
+        Optional[TelemetryStore]: The shared store, or None if telemetry is disabled.
+    """
+    global _telemetry_store
+
+    settings = Config().get_telemetry_settings()
+    if not settings['enabled']:
+        return None
+
+    with _telemetry_store_lock:
+        if _telemetry_store is None:
+            _telemetry_store = TelemetryStore(jsonl_path=settings['jsonl_path'] or None)
+
+        return _telemetry_store
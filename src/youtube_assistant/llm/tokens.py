@@ -0,0 +1,71 @@
+from typing import List, Sequence
+from langchain_core.messages import BaseMessage
+
+
+# Rough average for English text across the supported providers' tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text without a provider tokenizer.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        int: The estimated number of tokens.
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def estimate_message_tokens(messages: Sequence[BaseMessage]) -> int:
+    """
+    Estimate the prompt token count of a list of chat messages.
+
+    Args:
+        messages (Sequence[BaseMessage]): The chat messages.
+
+    Returns:
+        int: The estimated number of prompt tokens.
+    """
+    return sum(estimate_tokens(message.text) for message in messages)
+
+
+def split_by_tokens(text: str, max_tokens: int, overlap_tokens: int = 0) -> List[str]:
+    """
+    Split text into chunks of at most max_tokens estimated tokens.
+
+    Chunks end on whitespace where possible, and each chunk repeats the last
+    overlap_tokens of the previous one so no sentence is lost at a boundary.
+
+    Args:
+        text (str): The text to split.
+        max_tokens (int): Upper bound on the estimated tokens of a chunk.
+        overlap_tokens (int): Estimated tokens shared by consecutive chunks.
+
+    Returns:
+        List[str]: The chunks in order.
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    overlap_chars = min(max(0, overlap_tokens * CHARS_PER_TOKEN), max_chars // 2)
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            boundary = text.rfind(' ', start + overlap_chars + 1, end)
+            if boundary != -1:
+                end = boundary
+
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+
+        # Step back by the overlap, then forward to the start of a word
+        next_start = max(end - overlap_chars, start + 1)
+        boundary = text.find(' ', next_start, end)
+        start = boundary + 1 if overlap_chars and boundary != -1 else next_start
+
+    return [chunk for chunk in chunks if chunk]
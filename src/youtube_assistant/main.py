@@ -1,9 +1,11 @@
 import traceback
 import streamlit as st
 from src.youtube_assistant.ui.streamlit import StreamlitUILoader
-from src.youtube_assistant.llm import get_llm
-from src.youtube_assistant.graph import GraphBuilder
+from src.youtube_assistant.llm import PROMPT_VERSION, api_key_fingerprint, get_llm
+from src.youtube_assistant.graph import GraphBuilder, get_graph_cache
 from src.youtube_assistant.ui.streamlit import DisplayResultStreamlit
+from src.youtube_assistant.transcript import extract_video_id
+from src.youtube_assistant.ui.uiconfigfile import Config
 
 
 
@@ -17,6 +19,11 @@ def youtube_assistant():
     
     with st.form("YouTube Assistant"):
         youtube_url = st.text_input(label="Enter the YouTube URL", placeholder="YouTube URL")
+        resume = False
+        if Config().get_checkpoint_settings()['enabled']:
+            resume = st.checkbox(label="Resume a failed run",
+                                 value=False,
+                                 help="Continue the last failed run of this video from its last completed step.")
         submit = st.form_submit_button("Submit")
         
 
@@ -39,45 +46,35 @@ def youtube_assistant():
                 selected_llm_model = user_input['selected_openai_model']
             elif user_input['selected_llm'] == "Groq":
                 selected_llm_model = user_input['selected_groq_model']
-            
+            elif user_input['selected_llm'] == "Replay":
+                selected_llm_model = user_input['selected_replay_model']
+            else:
+                st.error(f"Error: Unsupported LLM provider: {user_input['selected_llm']}")
+                return
 
+            # Identical concurrent requests made with the same API key share one graph run
             try:
+                flight_key = (extract_video_id(youtube_url), usecase, user_input['selected_llm'],
+                              selected_llm_model, api_key_fingerprint(user_input), PROMPT_VERSION)
+            except Exception:
+                # Invalid URLs are reported by the graph, without coalescing
+                flight_key = None
+            
 
-                # if ('selected_usecase' not in st.session_state or 
-                #     'selected_llm_name' not in st.session_state or 
-                #     'selecetd_llm_model_model' not in st.session_state):
+            try:
 
-                #     st.session_state['selected_usecase'] = usecase
-                #     st.session_state['selected_llm_name'] = type(llm).__name__
-                #     st.session_state['selected_llm_model_name'] = selected_llm_model
-                #     graph = GraphBuilder(user_input).setup_graph()
-                #     st.session_state['graph'] = graph
-                #     st.info("Creating new Graph") #
-                #     st.code(user_input) # 
-                # else:
-                #     if (
-                #         st.session_state['selected_usecase'] != usecase or
-                #         st.session_state['selected_llm_name'] != type(llm).__name__ or
-                #         st.session_state['selected_llm_model_name'] != selected_llm_model
-                #     ):
-                #         st.info("Creating new Graph with updates") # 
-                #         st.code(user_input) # 
-                #         st.session_state['selected_usecase'] = usecase
-                #         st.session_state['selected_llm_name'] = type(llm).__name__
-                #         st.session_state['selected_llm_model_name'] = selected_llm_model
-                #         graph = GraphBuilder(user_input).setup_graph()
-                #         st.session_state['graph'] = graph
-                #     else:
-                #         st.info("No changes in the graph")
-                
-                # graph = st.session_state['graph']
-                
-                graph = GraphBuilder(user_input).setup_graph()
+                # Compiled graphs are shared across submits and sessions with the same settings
+                graph_cache = get_graph_cache()
+                if graph_cache:
+                    graph = graph_cache.get_or_build(user_input)
+                else:
+                    graph = GraphBuilder(user_input).setup_graph()
                 if graph is None:
                     st.error("Error: Graph setup failed.")
                     return
                 
-                DisplayResultStreamlit(usecase, graph, youtube_url).display_result_on_ui()
+                DisplayResultStreamlit(usecase, graph, youtube_url, flight_key=flight_key,
+                                       resume=resume).display_result_on_ui()
 
             except Exception as e:
                 st.error(f"Error: {e}\n\{traceback.format_exc()}")
@@ -1,6 +1,9 @@
 from src.youtube_assistant.nodes.get_transcript_node import TranscriptNode
+from src.youtube_assistant.nodes.transcript_digest_node import TranscriptDigestNode
 from src.youtube_assistant.nodes.title_generation_node import GenerateBlogTitleNode
 from src.youtube_assistant.nodes.content_generation_node import GenerateBlogContentNode
+from src.youtube_assistant.nodes.blog_generation_node import GenerateBlogNode
 from src.youtube_assistant.nodes.aggregator_node import BlogAggregatorNode
+from src.youtube_assistant.nodes.artifacts_join_node import ArtifactsJoinNode
 from src.youtube_assistant.nodes.youtube_summarizer_node import YouTubeSummarizerNode
 from src.youtube_assistant.nodes.youtube_notes_node_node import YouTubeNotesNode
\ No newline at end of file
@@ -81,4 +81,17 @@ class BlogAggregatorNode:
             error_msg = f"Failed to aggregate blog: {str(e)}"
             st.error(error_msg)
             st.code(traceback.format_exc(), language="python")
-            raise RuntimeError(error_msg)
\ No newline at end of file
+            raise RuntimeError(error_msg)
+
+    async def aaggregate_blog_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of aggregate_blog_node. Formatting is CPU-only, so it runs inline
+        on the event loop instead of being handed to a worker thread.
+
+        Args:
+            state (BlogState): The application state containing blog title and content.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the final formatted blog.
+        """
+        return self.aggregate_blog_node(state)
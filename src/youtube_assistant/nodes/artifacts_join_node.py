@@ -0,0 +1,67 @@
+import streamlit as st
+import traceback
+from typing import Dict
+from src.youtube_assistant.nodes.aggregator_node import BlogAggregatorNode
+from src.youtube_assistant.state import BlogState
+
+
+class ArtifactsJoinNode:
+    """
+    Node that joins the parallel branches of the all-artifacts graph.
+    Formats the blog when both its title and content were generated, and keeps
+    whatever summary and notes succeeded. Only fails when no artifact was produced.
+    """
+
+    def __init__(self):
+        """Initialize the ArtifactsJoinNode."""
+        self.aggregator = BlogAggregatorNode()
+
+    def join_artifacts_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Combine the artifacts generated by the parallel branches.
+
+        Args:
+            state (BlogState): The application state containing the generated artifacts
+                and the errors of failed branches.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the final formatted blog, if any.
+
+        Raises:
+            RuntimeError: If every branch failed.
+        """
+        try:
+            update: Dict[str, str] = {}
+
+            blog_title = state.get('blog_title')
+            blog_content = state.get('blog_content')
+            if blog_title and blog_content:
+                update['final_blog'] = self.aggregator._format_blog(blog_title, blog_content)
+
+            if not (update.get('final_blog') or state.get('video_summary') or state.get('video_notes')):
+                errors = state.get('artifact_errors') or {}
+                details = "; ".join(f"{node}: {error}" for node, error in errors.items())
+                error_msg = f"No artifact was generated. {details}".strip()
+                st.error(error_msg)
+                raise ValueError(error_msg)
+
+            return update
+
+        except Exception as e:
+            error_msg = f"Failed to join artifacts: {str(e)}"
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise RuntimeError(error_msg)
+
+    async def ajoin_artifacts_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of join_artifacts_node. Joining is CPU-only, so it runs inline
+        on the event loop instead of being handed to a worker thread.
+
+        Args:
+            state (BlogState): The application state containing the generated artifacts.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the final formatted blog, if any.
+        """
+        return self.join_artifacts_node(state)
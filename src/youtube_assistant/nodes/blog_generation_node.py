@@ -0,0 +1,175 @@
+from typing import Dict
+from pydantic import Field
+import streamlit as st
+import traceback
+from src.youtube_assistant.llm import (ainvoke_with_parse_retry, get_llm, invoke_with_parse_retry,
+                                       transcript_prefix_message)
+from src.youtube_assistant.nodes.title_generation_node import BlogTitle
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
+from src.youtube_assistant.retriever.transcript_digest import transcript_source
+from src.youtube_assistant.state import BlogState
+from langchain_core.messages import HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser
+
+
+class BlogPost(BlogTitle):
+    """Pydantic model for generating the blog title and content in one call."""
+
+    content: str = Field(
+        description=(
+            "The blog body in markdown, without the title.\n"
+            "Should have:\n"
+            "- An engaging introduction\n"
+            "- Clear sections with ## subheadings\n"
+            "- A strong conclusion"
+        )
+    )
+
+
+class GenerateBlogNode:
+    """
+    Node for generating the blog title and content from a YouTube video transcript
+    with a single LLM call, so the transcript is only sent once.
+    """
+
+    def __init__(self, user_input: Dict[str, str]):
+        """
+        Initialize the single-call blog generator.
+
+        Args:
+            user_input (Dict[str, str]): User configuration for the LLM.
+        """
+        try:
+            self.llm = get_llm(user_input)
+        except Exception as e:
+            error_msg = f"Failed to initialize LLM: {str(e)}"
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise RuntimeError(error_msg)
+
+        # Format instructions instead of tool calling keep the shared transcript prefix
+        self.blog_parser = PydanticOutputParser(pydantic_object=BlogPost)
+
+    def _create_messages(self, transcript: str) -> list:
+        """
+        Create the messages for the LLM, the shared transcript prefix followed by the
+        title and content instructions.
+
+        Args:
+            transcript (str): The validated transcript.
+
+        Returns:
+            list: A list of messages for the LLM.
+        """
+        human_msg = HumanMessage(
+            content=(
+                "You are an expert blog writer and title generator, creating engaging, informative "
+                "and well-structured articles from youtube video transcripts while optimizing for both "
+                "engagement and SEO.\n\n"
+                "Guidelines for the title:\n"
+                "1. Accurately reflect the main topic, key points and unique insights\n"
+                "2. Use power words that drive engagement and relevant keywords for SEO\n"
+                "3. Maintain professional tone - no clickbait or sensationalism\n"
+                "4. Keep length between 40-60 characters with proper capitalization\n\n"
+                "Guidelines for the content:\n"
+                "1. Create an engaging introduction and a strong conclusion\n"
+                "2. Create clear section hierarchy with relevant subheadings (use ## for headings)\n"
+                "3. Expand on key points with examples and context\n"
+                "4. Use transitional phrases between sections\n"
+                "5. Optimize content for both readability and SEO\n"
+                "6. Write in an engaging but professional tone with short paragraphs\n"
+                "7. Add relevant context where the video may lack detail\n"
+                "8. Use markdown formatting for structure, and don't repeat the title in the content\n\n"
+                "Please generate the title and a comprehensive blog post based on this video transcript.\n\n"
+                f"{self.blog_parser.get_format_instructions()}"
+            )
+        )
+
+        return [transcript_prefix_message(transcript), human_msg]
+
+    def _blog_from_response(self, response) -> Dict[str, str]:
+        """
+        Validate the structured LLM response and extract the title and content.
+
+        Args:
+            response: The parsed BlogPost response.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the blog title and content.
+
+        Raises:
+            ValueError: If the title or content is empty.
+        """
+        if not response or not response.title.strip() or not response.content.strip():
+            error_msg = "Failed to generate the blog - empty title or content from LLM"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        if len(response.content.split()) < 300:
+            st.warning("Generated content is shorter than expected. It might not be comprehensive enough.")
+
+        st.success("Blog title and content generated successfully!")
+
+        return {'blog_title': response.title, 'blog_content': response.content}
+
+    def _prepare_messages(self, state: BlogState) -> list:
+        """
+        Validate the transcript in the state and create the messages for the LLM.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            list: A list of messages for the LLM.
+
+        Raises:
+            ValueError: If the transcript is missing.
+        """
+        transcript = transcript_source(state, "long")
+        if not transcript:
+            error_msg = "YouTube transcript is missing"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        return self._create_messages(transcript)
+
+    def generate_blog_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Generate the blog title and content based on the transcript in the state.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the blog title and content.
+
+        Raises:
+            RuntimeError: If the blog generation process fails.
+        """
+        with reported_failure("Blog generation process failed"):
+            messages = self._prepare_messages(state)
+
+            with reported_failure("Blog generation failed"), st.spinner("Generating blog title and content..."):
+                # A response that does not parse is re-asked once
+                response = invoke_with_parse_retry(self.llm, self.blog_parser, messages)
+                return self._blog_from_response(response)
+
+    async def agenerate_blog_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of generate_blog_node, awaiting the LLM instead of blocking.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the blog title and content.
+
+        Raises:
+            RuntimeError: If the blog generation process fails.
+        """
+        with reported_failure("Blog generation process failed"):
+            messages = self._prepare_messages(state)
+
+            with reported_failure("Blog generation failed"):
+                response = await ainvoke_with_parse_retry(self.llm, self.blog_parser, messages)
+                return self._blog_from_response(response)
@@ -1,9 +1,11 @@
 from typing import Dict, Optional
 import streamlit as st
 import traceback
-from src.youtube_assistant.llm import get_llm
+from src.youtube_assistant.llm import get_llm, transcript_prefix_message
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
+from src.youtube_assistant.retriever.transcript_digest import transcript_source
 from src.youtube_assistant.state import BlogState
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import HumanMessage
 
 
 class GenerateBlogContentNode:
@@ -47,7 +49,8 @@ class GenerateBlogContentNode:
     
     def _create_messages(self, transcript: str) -> list:
         """
-        Create the system and human messages for the LLM.
+        Create the messages for the LLM, the shared transcript prefix followed by the
+        blog content instructions.
         
         Args:
             transcript (str): The validated transcript.
@@ -55,7 +58,7 @@ class GenerateBlogContentNode:
         Returns:
             list: A list of messages for the LLM.
         """
-        system_msg = SystemMessage(
+        human_msg = HumanMessage(
             content=(
                 "You are an expert blog content writer specializing in creating engaging, "
                 "informative, and well-structured articles from youtube video transcript.\n\n"
@@ -73,13 +76,8 @@ class GenerateBlogContentNode:
                 "10. Add relevant context where the video may lack detail\n\n"
                 "Focus on creating content that is both informative and engaging while "
                 "maintaining the original message of the video.\n\n"
-                "Format your response using markdown for better readability."
-            )
-        )
-        
-        human_msg = HumanMessage(
-            content=(
-                f"Please generate a comprehensive blog post based on this video transcript.\n\n"
+                "Format your response using markdown for better readability.\n\n"
+                "Please generate a comprehensive blog post based on this video transcript.\n\n"
                 "Requirements:\n"
                 "- Create an engaging introduction\n"
                 "- Create clear section hierarchy with relevant subheadings (use ## for headings)\n"
@@ -87,12 +85,11 @@ class GenerateBlogContentNode:
                 "- Add value beyond the transcript\n"
                 "- Ensure smooth transitions between sections\n"
                 "- Use markdown formatting for structure\n\n"
-                f"Transcript:\n{transcript}\n\n"
                 "Note: Don't write a title for the blog, as it's already provided separately."
             )
         )
         
-        return [system_msg, human_msg]
+        return [transcript_prefix_message(transcript), human_msg]
     
     def _check_content_quality(self, content: str) -> None:
         """
@@ -116,6 +113,60 @@ class GenerateBlogContentNode:
         # Check for markdown headings
         if "##" not in content:
             st.warning("Generated content may lack proper section headings.")
+
+    def _content_from_response(self, blog_content_response) -> Dict[str, str]:
+        """
+        Validate the LLM response and extract the blog content.
+
+        Args:
+            blog_content_response: The LLM response message.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated blog content.
+
+        Raises:
+            ValueError: If the response is malformed or empty.
+        """
+        if not hasattr(blog_content_response, 'content'):
+            error_msg = "Unexpected response format from LLM"
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise ValueError(error_msg)
+
+        content = blog_content_response.content
+        if not content or not content.strip():
+            error_msg = "Generated blog content is empty"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        st.success("Blog content generated successfully!")
+
+        return {'blog_content': content}
+    
+    def _prepare_messages(self, state: BlogState) -> list:
+        """
+        Validate the transcript in the state and create the messages for the LLM.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            list: A list of messages for the LLM.
+
+        Raises:
+            ValueError: If the transcript is missing.
+        """
+        transcript = transcript_source(state, "long")
+        if not transcript:
+            error_msg = "YouTube transcript is missing"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        messages = self._create_messages(transcript)
+
+        st.info("Starting blog content generation. This may take a few moments...")
+
+        return messages
     
     def generate_blog_content_node(self, state: BlogState) -> Dict[str, str]:
         """
@@ -130,48 +181,29 @@ class GenerateBlogContentNode:
         Raises:
             RuntimeError: If the blog content generation process fails.
         """
-        try:
-            transcript = state.get("youtube_transcript")
-            if not transcript:
-                error_msg = "YouTube transcript is missing"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise ValueError(error_msg)
-
-            messages = self._create_messages(transcript)
-            
-            st.info("Starting blog content generation. This may take a few moments...")
-            
-            try:
-                with st.spinner("Generating comprehensive blog content..."):
-                    blog_content_response = self.llm.invoke(
-                        input=messages,
-                    )
-                    
-                    if not hasattr(blog_content_response, 'content'):
-                        error_msg = "Unexpected response format from LLM"
-                        st.error(error_msg)
-                        st.code(traceback.format_exc(), language="python")
-                        raise ValueError(error_msg)
-                    
-                    content = blog_content_response.content
-                    if not content or not content.strip():
-                        error_msg = "Generated blog content is empty"
-                        st.error(error_msg)
-                        raise ValueError(error_msg)
-                    
-                    st.success("Blog content generated successfully!")
-                    
-                    return {'blog_content': content}
-                
-            except Exception as e:
-                error_msg = f"Blog generation failed: {str(e)}"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-                
-        except Exception as e:
-            error_msg = f"Blog content generation process failed: {str(e)}"
-            st.error(error_msg)
-            st.code(traceback.format_exc(), language="python")
-            raise RuntimeError(error_msg)
\ No newline at end of file
+        with reported_failure("Blog content generation process failed"):
+            messages = self._prepare_messages(state)
+
+            with reported_failure("Blog generation failed"), st.spinner("Generating comprehensive blog content..."):
+                blog_content_response = self.llm.invoke(input=messages)
+                return self._content_from_response(blog_content_response)
+
+    async def agenerate_blog_content_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of generate_blog_content_node, awaiting the LLM instead of blocking.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated blog content.
+
+        Raises:
+            RuntimeError: If the blog content generation process fails.
+        """
+        with reported_failure("Blog content generation process failed"):
+            messages = self._prepare_messages(state)
+
+            with reported_failure("Blog generation failed"):
+                blog_content_response = await self.llm.ainvoke(input=messages)
+                return self._content_from_response(blog_content_response)
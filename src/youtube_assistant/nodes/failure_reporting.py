@@ -0,0 +1,26 @@
+import streamlit as st
+import traceback
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def reported_failure(message: str) -> Iterator[None]:
+    """
+    Report an error raised in the block through the UI and re-raise it as a RuntimeError.
+
+    Shared by the sync and async variants of the nodes, so both report failures alike.
+
+    Args:
+        message (str): Description of the failed step, prefixed to the error.
+
+    Raises:
+        RuntimeError: If the block raises.
+    """
+    try:
+        yield
+    except Exception as e:
+        error_msg = f"{message}: {str(e)}"
+        st.error(error_msg)
+        st.code(traceback.format_exc(), language="python")
+        raise RuntimeError(error_msg)
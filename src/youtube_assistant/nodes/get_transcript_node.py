@@ -1,18 +1,48 @@
-from urllib.parse import urlparse, parse_qs
 from youtube_transcript_api import (
-    YouTubeTranscriptApi,
     NoTranscriptFound,
     TranscriptsDisabled,
     VideoUnavailable
 )
-import re
+import asyncio
 import streamlit as st
 import traceback
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
 from src.youtube_assistant.state import BlogState
+from src.youtube_assistant.transcript import (
+    get_transcript_cache,
+    get_transcript_source,
+    extract_video_id,
+    normalize_segments,
+    normalize_text,
+    TranscriptSegments
+)
+
+
+class CachedTranscriptFailure(Exception):
+    """Raised when a video is known, from the negative cache, to have no usable transcript."""
+
+    def __init__(self, error_class: str):
+        super().__init__(error_class)
+        self.error_class = error_class
 
 
 class TranscriptNode:
     """Class for extracting and processing YouTube video transcripts."""
+
+    TRANSCRIPT_LANGUAGES = ['en', 'en-US', 'en-GB']
+
+    TRANSCRIPT_ERROR_MESSAGES = {
+        'NoTranscriptFound': "No transcript available for this video",
+        'TranscriptsDisabled': "Transcripts are disabled for this video",
+        'VideoUnavailable': "Video is unavailable or private"
+    }
+
+    def __init__(self):
+        """Initialize the TranscriptNode with the configured transcript source and the shared cache."""
+        self.transcript_source = get_transcript_source()
+        self.transcript_cache = get_transcript_cache() if self.transcript_source.cacheable else None
     
     def _extract_video_id(self, url: str) -> str:
         """
@@ -33,17 +63,7 @@ class TranscriptNode:
                 st.error(error_msg)
                 raise ValueError(error_msg)
                 
-            if 'youtu.be' in url:
-                return url.split('/')[-1].split('?')[0]
-            
-            parsed_url = urlparse(url)
-            if 'youtube.com' in parsed_url.netloc:
-                if '/watch' in parsed_url.path:
-                    return parse_qs(parsed_url.query)['v'][0]
-                elif '/embed/' in parsed_url.path or '/v/' in parsed_url.path:
-                    return parsed_url.path.split('/')[-1]
-                
-            raise ValueError("Invalid YouTube URL format")
+            return extract_video_id(url)
             
         except Exception as e:
             error_msg = f"Failed to extract video ID: {str(e)}"
@@ -61,16 +81,149 @@ class TranscriptNode:
         Returns:
             str: The cleaned transcript text.
         """
-        if not text:
-            return ""
-            
-        # Remove multiple newlines
-        text = re.sub(r'\n\s*\n', '\n', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?-]', '', text)
-        # Normalize whitespace
-        text = ' '.join(text.split())
-        return text
+        return normalize_text(text)
+
+    def _fetch_transcript(self, video_id: str) -> Iterable[Dict]:
+        """
+        Fetch the raw transcript segments, consulting the transcript cache first.
+
+        Known failures are served from the negative cache, and a previously resolved
+        language track is fetched directly instead of walking the fallback list.
+
+        Args:
+            video_id (str): The YouTube video ID.
+
+        Returns:
+            Iterable[Dict]: Transcript segments with 'text', 'start' and 'duration' keys.
+
+        Raises:
+            CachedTranscriptFailure: If a recent lookup for this video already failed.
+        """
+        if not self.transcript_cache:
+            return self.transcript_source.fetch(video_id, self.TRANSCRIPT_LANGUAGES).segments
+
+        error_class = self.transcript_cache.get_failure(video_id)
+        if error_class:
+            raise CachedTranscriptFailure(error_class)
+
+        resolved = self.transcript_cache.get_resolved_language(video_id)
+        languages = self.TRANSCRIPT_LANGUAGES
+        if resolved:
+            languages = [resolved[0]] + [language for language in languages if language != resolved[0]]
+
+        cached = self.transcript_cache.get(video_id, languages)
+        if cached is not None:
+            _, segments = cached
+            return segments
+
+        try:
+            fetched = self.transcript_source.fetch(video_id, self.TRANSCRIPT_LANGUAGES, resolved_track=resolved)
+        except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable) as e:
+            self.transcript_cache.put_failure(video_id, type(e).__name__)
+            raise
+
+        segments = list(fetched.segments)
+        self.transcript_cache.put(video_id, fetched.language_code, segments)
+        self.transcript_cache.put_resolved_language(video_id, fetched.language_code, fetched.is_generated)
+
+        return segments
+
+    def fetch_transcript_text(self, video_id: str) -> str:
+        """
+        Fetch a transcript and return it as cleaned text.
+
+        Unlike get_transcript_node, this method does not report errors through the UI,
+        which makes it safe to call from worker threads.
+
+        Args:
+            video_id (str): The YouTube video ID.
+
+        Returns:
+            str: The cleaned transcript text, empty if the transcript has no text.
+        """
+        return normalize_segments(self._fetch_transcript(video_id))
+
+    def fetch_transcript_segments(self, video_id: str) -> TranscriptSegments:
+        """
+        Fetch a transcript as a compact, timestamped segment store.
+
+        Args:
+            video_id (str): The YouTube video ID.
+
+        Returns:
+            TranscriptSegments: The segments, whose text is the cleaned transcript.
+        """
+        return TranscriptSegments.from_raw_segments(self._fetch_transcript(video_id))
+    
+    def _video_id_from_state(self, state: BlogState) -> str:
+        """
+        Validate the YouTube URL in the state and extract its video ID.
+
+        Args:
+            state (BlogState): The application state containing the YouTube URL.
+
+        Returns:
+            str: The extracted video ID.
+
+        Raises:
+            ValueError: If the URL is missing or invalid.
+        """
+        url = state.get('youtube_url')
+        if not url:
+            error_msg = "YouTube URL is missing from state"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        return self._extract_video_id(url)
+
+    @contextmanager
+    def _reported_fetch_failure(self) -> Iterator[None]:
+        """
+        Report a failed transcript fetch through the UI and re-raise it as a RuntimeError.
+
+        Raises:
+            RuntimeError: If the block raises.
+        """
+        try:
+            yield
+        except CachedTranscriptFailure as e:
+            error_msg = f"{self.TRANSCRIPT_ERROR_MESSAGES[e.error_class]} (cached result)"
+            st.error(error_msg)
+            raise RuntimeError(error_msg)
+        except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable) as e:
+            error_msg = self.TRANSCRIPT_ERROR_MESSAGES[type(e).__name__]
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise RuntimeError(error_msg)
+        except Exception as e:
+            error_msg = f"Failed to extract transcript: {str(e)}"
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise RuntimeError(error_msg)
+
+    def _transcript_update(self, segments: TranscriptSegments) -> dict:
+        """
+        Validate the fetched segments and build the state update.
+
+        Args:
+            segments (TranscriptSegments): The fetched transcript segments.
+
+        Returns:
+            dict: A dictionary containing the cleaned transcript and its timestamped segments.
+
+        Raises:
+            ValueError: If the transcript is empty after processing.
+        """
+        cleaned_content = segments.text
+        if not cleaned_content:
+            error_msg = "Empty transcript after processing"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        return {
+            'youtube_transcript': cleaned_content,
+            'youtube_transcript_segments': segments
+        }
     
     def get_transcript_node(self, state: BlogState) -> dict:
         """
@@ -80,63 +233,38 @@ class TranscriptNode:
             state (BlogState): The application state containing the YouTube URL.
             
         Returns:
-            dict: A dictionary containing the cleaned transcript.
+            dict: A dictionary containing the cleaned transcript and its timestamped segments.
             
         Raises:
             RuntimeError: If the transcript extraction process fails.
         """
-        try:
-            url = state.get('youtube_url')
-            if not url:
-                error_msg = "YouTube URL is missing from state"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise ValueError(error_msg)
+        with reported_failure("Transcript extraction process failed"):
+            video_id = self._video_id_from_state(state)
 
-            video_id = self._extract_video_id(url)
-            
-            try:
-                transcript = YouTubeTranscriptApi.get_transcript(
-                    video_id=video_id,
-                    languages=['en', 'en-US', 'en-GB'] 
-                )
-                
-                content = "\n".join(subtitle.get('text', '').strip() 
-                                   for subtitle in transcript 
-                                   if subtitle.get('text'))
-                
-                cleaned_content = self._clean_transcript_text(content)
-                
-                if not cleaned_content:
-                    error_msg = "Empty transcript after processing"
-                    st.error(error_msg)
-                    raise ValueError(error_msg)
-                    
-                return {'youtube_transcript': cleaned_content}
-                
-            except NoTranscriptFound:
-                error_msg = "No transcript available for this video"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-            except TranscriptsDisabled:
-                error_msg = "Transcripts are disabled for this video"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-            except VideoUnavailable:
-                error_msg = "Video is unavailable or private"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-            except Exception as e:
-                error_msg = f"Failed to extract transcript: {str(e)}"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-                
-        except Exception as e:
-            error_msg = f"Transcript extraction process failed: {str(e)}"
-            st.error(error_msg)
-            st.code(traceback.format_exc(), language="python")
-            raise RuntimeError(error_msg)
\ No newline at end of file
+            with self._reported_fetch_failure():
+                segments = self.fetch_transcript_segments(video_id)
+                return self._transcript_update(segments)
+
+    async def aget_transcript_node(self, state: BlogState) -> dict:
+        """
+        Async variant of get_transcript_node.
+
+        youtube-transcript-api and the SQLite cache are blocking, so only the fetch runs
+        in a worker thread while the event loop keeps serving other runs. Errors are
+        reported from the coroutine, since worker threads have no Streamlit script context.
+
+        Args:
+            state (BlogState): The application state containing the YouTube URL.
+
+        Returns:
+            dict: A dictionary containing the cleaned transcript and its timestamped segments.
+
+        Raises:
+            RuntimeError: If the transcript extraction process fails.
+        """
+        with reported_failure("Transcript extraction process failed"):
+            video_id = self._video_id_from_state(state)
+
+            with self._reported_fetch_failure():
+                segments = await asyncio.to_thread(self.fetch_transcript_segments, video_id)
+                return self._transcript_update(segments)
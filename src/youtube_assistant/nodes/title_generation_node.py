@@ -2,9 +2,13 @@ from typing import Dict
 from pydantic import BaseModel, Field
 import streamlit as st
 import traceback
-from src.youtube_assistant.llm import get_llm
+from src.youtube_assistant.llm import (ainvoke_with_parse_retry, get_llm, invoke_with_parse_retry,
+                                       transcript_prefix_message)
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
+from src.youtube_assistant.retriever.transcript_digest import transcript_source
 from src.youtube_assistant.state import BlogState
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser
 
 
 class BlogTitle(BaseModel):
@@ -40,10 +44,15 @@ class GenerateBlogTitleNode:
             st.error(error_msg)
             st.code(traceback.format_exc(), language="python")
             raise RuntimeError(error_msg)
+
+        # Format instructions instead of tool calling, since tool definitions are sent
+        # ahead of the system prompt and would break the shared transcript prefix
+        self.title_parser = PydanticOutputParser(pydantic_object=BlogTitle)
     
     def _create_messages(self, transcript: str) -> list:
         """
-        Create the system and human messages for the LLM.
+        Create the messages for the LLM, the shared transcript prefix followed by the
+        title instructions.
         
         Args:
             transcript (str): The validated transcript.
@@ -51,7 +60,7 @@ class GenerateBlogTitleNode:
         Returns:
             list: A list of messages for the LLM.
         """
-        system_msg = SystemMessage(
+        human_msg = HumanMessage(
             content=(
                 "You are an expert blog title generator optimizing for both engagement and SEO.\n\n"
                 "Guidelines for title generation:\n"
@@ -64,23 +73,61 @@ class GenerateBlogTitleNode:
                 "7. Keep length between 40-60 characters\n"
                 "8. Make it compelling but honest\n\n"
                 "Focus on creating a title that would make readers want to learn more while "
-                "accurately representing the content."
-            )
-        )
-        
-        human_msg = HumanMessage(
-            content=(
+                "accurately representing the content.\n\n"
                 "Please analyze this video transcript and generate an optimal blog title.\n\n"
                 "Consider these aspects while analyzing:\n"
                 "- Main topic and key message\n"
                 "- Target audience\n"
                 "- Unique insights or valuable information\n"
                 "- Professional context\n\n"
-                f"Transcript:\n{transcript}"
+                f"{self.title_parser.get_format_instructions()}"
             )
         )
         
-        return [system_msg, human_msg]
+        return [transcript_prefix_message(transcript), human_msg]
+
+    def _title_from_response(self, response) -> Dict[str, str]:
+        """
+        Validate the structured LLM response and extract the title.
+
+        Args:
+            response: The parsed BlogTitle response.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated blog title.
+
+        Raises:
+            RuntimeError: If the response is empty.
+        """
+        if not response or not hasattr(response, 'title'):
+            error_msg = "Failed to generate a title - empty response from LLM"
+            st.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        st.toast("Blog title generated successfully!")
+
+        return {'blog_title': response.title}
+    
+    def _prepare_messages(self, state: BlogState) -> list:
+        """
+        Validate the transcript in the state and create the messages for the LLM.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            list: A list of messages for the LLM.
+
+        Raises:
+            ValueError: If the transcript is missing or empty.
+        """
+        transcript = transcript_source(state, "long")
+        if not transcript:
+            error_msg = "Transcript is missing or empty"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        return self._create_messages(transcript)
     
     def generate_blog_title_node(self, state: BlogState) -> Dict[str, str]:
         """
@@ -95,38 +142,30 @@ class GenerateBlogTitleNode:
         Raises:
             RuntimeError: If the title generation process fails.
         """
-        try:
-            transcript = state.get("youtube_transcript")
-            if not transcript:
-                error_msg = "Transcript is missing or empty"
-                st.error(error_msg)
-                raise ValueError(error_msg)
-            
-            messages = self._create_messages(transcript)
-            
-            try:
-                with st.spinner("Generating blog title..."):
-                    title_generator_llm = self.llm.with_structured_output(schema=BlogTitle)
-                
-                    response = title_generator_llm.invoke(input=messages)
-                    
-                    if not response or not hasattr(response, 'title'):
-                        error_msg = "Failed to generate a title - empty response from LLM"
-                        st.error(error_msg)
-                        raise RuntimeError(error_msg)
-                    
-                    st.toast("Blog title generated successfully!")
-                    
-                    return {'blog_title': response.title}
-                
-            except Exception as e:
-                error_msg = f"Title generation failed: {str(e)}"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-                
-        except Exception as e:
-            error_msg = f"Blog title generation process failed: {str(e)}"
-            st.error(error_msg)
-            st.code(traceback.format_exc(), language="python")
-            raise RuntimeError(error_msg)
\ No newline at end of file
+        with reported_failure("Blog title generation process failed"):
+            messages = self._prepare_messages(state)
+
+            with reported_failure("Title generation failed"), st.spinner("Generating blog title..."):
+                # A response that does not parse is re-asked once
+                response = invoke_with_parse_retry(self.llm, self.title_parser, messages)
+                return self._title_from_response(response)
+
+    async def agenerate_blog_title_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of generate_blog_title_node, awaiting the LLM instead of blocking.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated blog title.
+
+        Raises:
+            RuntimeError: If the title generation process fails.
+        """
+        with reported_failure("Blog title generation process failed"):
+            messages = self._prepare_messages(state)
+
+            with reported_failure("Title generation failed"):
+                response = await ainvoke_with_parse_retry(self.llm, self.title_parser, messages)
+                return self._title_from_response(response)
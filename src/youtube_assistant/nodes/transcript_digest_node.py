@@ -0,0 +1,135 @@
+import streamlit as st
+import traceback
+from typing import Dict, Optional
+from src.youtube_assistant.llm import get_llm
+from src.youtube_assistant.llm.tokens import estimate_tokens
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
+from src.youtube_assistant.retriever.transcript_digest import TranscriptDigest, TranscriptDigestBuilder
+from src.youtube_assistant.retriever.transcript_digest import digest_key, get_digest_store
+from src.youtube_assistant.state import BlogState
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+class TranscriptDigestNode:
+    """
+    Node that provides the hierarchical digest of a long transcript.
+    The digest is read from the digest store when an earlier run on the video with the
+    same model built it, and built and stored otherwise. Digests of the Replay provider
+    and digests with empty summaries are used for the run but never stored. Transcripts
+    below the token threshold, or runs with digests disabled, pass through without one
+    and use the raw transcript.
+    """
+
+    def __init__(self, user_input: Dict[str, str]):
+        """
+        Initialize the transcript digest node.
+
+        Args:
+            user_input (Dict[str, str]): User configuration for the LLM.
+        """
+        try:
+            self.digest_store = get_digest_store()
+            self.builder = None
+            if self.digest_store is None:
+                return
+
+            map_reduce_settings = Config().get_map_reduce_settings()
+            digest_settings = Config().get_digest_settings()
+            self.token_threshold = digest_settings['token_threshold']
+            self.chunks_per_section = digest_settings['chunks_per_section']
+            self.provider = user_input['selected_llm']
+            self.model = user_input.get(f"selected_{self.provider.lower()}_model", '')
+            # Replayed responses are canned, so their digests must not serve real runs
+            self.persist = self.provider != "Replay"
+
+            llm = get_llm(user_input)
+            if llm:
+                self.builder = TranscriptDigestBuilder(
+                    llm=llm,
+                    chunk_tokens=map_reduce_settings['chunk_tokens'],
+                    overlap_tokens=map_reduce_settings['overlap_tokens'],
+                    chunks_per_section=self.chunks_per_section,
+                    max_concurrency=map_reduce_settings['max_concurrency']
+                )
+        except Exception as e:
+            error_msg = f"Failed to initialize LLM: {str(e)}"
+            st.error(error_msg)
+            st.code(traceback.format_exc(), language="python")
+            raise RuntimeError(error_msg)
+
+    def _digest_key(self, state: BlogState):
+        """
+        Return the digest key of the transcript in the state, or None if no digest is needed.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Optional[str]: The digest key.
+        """
+        transcript = state.get("youtube_transcript")
+        if not self.builder or not transcript or estimate_tokens(transcript) <= self.token_threshold:
+            return None
+
+        return digest_key(transcript, self.provider, self.model, self.builder.chunk_tokens,
+                          self.builder.overlap_tokens, self.builder.chunks_per_section)
+
+    def _load(self, key: str) -> Optional[TranscriptDigest]:
+        """Return the stored digest, or None on a miss or if digests of this provider are not stored."""
+        return self.digest_store.get(key) if self.persist else None
+
+    def _store(self, key: str, digest: TranscriptDigest) -> None:
+        """Store a freshly built digest unless it is incomplete or from a provider that is not stored."""
+        if self.persist and digest.is_complete():
+            self.digest_store.put(key, digest)
+
+    def build_transcript_digest_node(self, state: BlogState) -> Dict:
+        """
+        Provide the digest of the transcript in the state.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict: A dictionary containing the transcript digest, or an empty update if none is needed.
+
+        Raises:
+            RuntimeError: If building the digest fails.
+        """
+        with reported_failure("Transcript digest failed"):
+            key = self._digest_key(state)
+            if key is None:
+                return {}
+
+            digest = self._load(key)
+            if digest is None:
+                with st.spinner("Long transcript detected, building a reusable digest of it..."):
+                    digest = self.builder.build(state["youtube_transcript"])
+                self._store(key, digest)
+
+            return {'transcript_digest': digest}
+
+    async def abuild_transcript_digest_node(self, state: BlogState) -> Dict:
+        """
+        Async variant of build_transcript_digest_node, awaiting the LLM instead of blocking.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict: A dictionary containing the transcript digest, or an empty update if none is needed.
+
+        Raises:
+            RuntimeError: If building the digest fails.
+        """
+        with reported_failure("Transcript digest failed"):
+            key = self._digest_key(state)
+            if key is None:
+                return {}
+
+            digest = self._load(key)
+            if digest is None:
+                digest = await self.builder.abuild(state["youtube_transcript"])
+                self._store(key, digest)
+
+            return {'transcript_digest': digest}
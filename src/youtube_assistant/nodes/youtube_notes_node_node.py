@@ -1,16 +1,22 @@
 import streamlit as st
 import traceback
 from typing import Dict, Optional
-from src.youtube_assistant.llm import get_llm
+from src.youtube_assistant.llm import get_llm, transcript_prefix_message
+from src.youtube_assistant.llm.map_reduce import get_map_reduce_pipeline
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
+from src.youtube_assistant.retriever.transcript_digest import transcript_source
 from src.youtube_assistant.state import BlogState
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import HumanMessage
 
 
 class YouTubeNotesNode:
     """
     Node for generating structured learning notes from YouTube video transcripts.
     Creates comprehensive, well-organized notes ideal for review after watching a video.
+    Transcripts above the configured token threshold are condensed with map-reduce first.
     """
+
+    MAP_REDUCE_FOCUS = "topics, definitions, formulas, terminology, examples and references for study notes"
     
     def __init__(self, user_input: Dict[str, str]):
         """
@@ -21,6 +27,7 @@ class YouTubeNotesNode:
         """
         try:
             self.llm = get_llm(user_input)
+            self.map_reduce = get_map_reduce_pipeline(self.llm) if self.llm else None
         except Exception as e:
             error_msg = f"Failed to initialize LLM: {str(e)}"
             st.error(error_msg)
@@ -30,7 +37,8 @@ class YouTubeNotesNode:
 
     def _create_notes_messages(self, transcript: str) -> list:
         """
-        Create the system and human messages for the notes generation LLM.
+        Create the messages for the notes generation LLM, the shared transcript prefix
+        followed by the notes instructions.
         
         Args:
             transcript (str): The validated transcript.
@@ -38,7 +46,7 @@ class YouTubeNotesNode:
         Returns:
             list: A list of messages for the LLM.
         """
-        system_msg = SystemMessage(
+        human_msg = HumanMessage(
             content=(
                 "You are an expert educational content creator specializing in transforming video lectures "
                 "into comprehensive study notes. You excel at organizing information into clear, structured "
@@ -59,12 +67,8 @@ class YouTubeNotesNode:
                 "Your notes should be comprehensive enough to serve as a standalone study resource "
                 "while being concise and well-structured for efficient revision. Format your notes using "
                 "markdown with appropriate headings (# for main topics, ## for subtopics, etc.), "
-                "bullet points, numbered lists, and emphasis where needed."
-            )
-        )
-        
-        human_msg = HumanMessage(
-            content=(
+                "bullet points, numbered lists, and emphasis where needed.\n\n"
+                
                 "Please transform this YouTube video transcript into professional, comprehensive study notes. "
                 "These notes will be used by learners who have watched the video and need a structured resource "
                 "for review and revision.\n\n"
@@ -78,14 +82,64 @@ class YouTubeNotesNode:
                 "- Use appropriate markdown formatting for structure (headings, lists, emphasis)\n"
                 "- Create a notes structure that facilitates quick review and retention\n\n"
                 
-                f"Here is the transcript:\n\n{transcript}\n\n"
-                
                 "Please provide comprehensive study notes that would help a student effectively "
                 "review and master the material covered in this video."
             )
         )
         
-        return [system_msg, human_msg]
+        return [transcript_prefix_message(transcript), human_msg]
+
+    def _notes_from_response(self, notes_response) -> Dict[str, str]:
+        """
+        Validate the LLM response and extract the notes.
+
+        Args:
+            notes_response: The LLM response message.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated educational notes.
+
+        Raises:
+            ValueError: If the response is malformed or empty.
+        """
+        if not hasattr(notes_response, 'content'):
+            error_msg = "Unexpected response format from LLM"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        notes_content = notes_response.content
+
+        if not notes_content.strip():
+            error_msg = "Generated notes are empty"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        return {'video_notes': notes_content}
+    
+    def _validated_transcript(self, state: BlogState) -> str:
+        """
+        Return the transcript in the state, which may still need condensing.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            str: The transcript.
+
+        Raises:
+            ValueError: If the transcript is missing.
+        """
+        transcript = transcript_source(state, "long")
+        if not transcript:
+            error_msg = "YouTube transcript is missing"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        return transcript
+
+    def _needs_condensing(self, transcript: str) -> bool:
+        """Return whether the transcript is long enough to be condensed with map-reduce first."""
+        return bool(self.map_reduce and self.map_reduce.applies_to(transcript))
     
     def generate_youtube_notes_node(self, state: BlogState) -> Dict[str, str]:
         """
@@ -100,43 +154,40 @@ class YouTubeNotesNode:
         Raises:
             RuntimeError: If the notes generation process fails.
         """
-        try:
-            transcript = state.get("youtube_transcript")
-            if not transcript:
-                error_msg = "YouTube transcript is missing"
-                st.error(error_msg)
-                raise ValueError(error_msg)
-            
-            
+        with reported_failure("YouTube notes generation process failed"):
+            transcript = self._validated_transcript(state)
+
+            if self._needs_condensing(transcript):
+                with st.spinner("Long transcript detected, condensing it in parallel chunks..."):
+                    transcript = self.map_reduce.condense(transcript, focus=self.MAP_REDUCE_FOCUS)
+
             messages = self._create_notes_messages(transcript)
-            
-            try:
-                notes_response = self.llm.invoke(
-                    input=messages,
-                )
-                
-                if not hasattr(notes_response, 'content'):
-                    error_msg = "Unexpected response format from LLM"
-                    st.error(error_msg)
-                    raise ValueError(error_msg)
-                
-                notes_content = notes_response.content
-                
-                if not notes_content.strip():
-                    error_msg = "Generated notes are empty"
-                    st.error(error_msg)
-                    raise ValueError(error_msg)
-                
-                return {'video_notes': notes_content}
-                
-            except Exception as e:
-                error_msg = f"Notes generation failed: {str(e)}"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-                
-        except Exception as e:
-            error_msg = f"YouTube notes generation process failed: {str(e)}"
-            st.error(error_msg)
-            st.code(traceback.format_exc(), language="python")
-            raise RuntimeError(error_msg)
\ No newline at end of file
+
+            with reported_failure("Notes generation failed"):
+                notes_response = self.llm.invoke(input=messages)
+                return self._notes_from_response(notes_response)
+
+    async def agenerate_youtube_notes_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of generate_youtube_notes_node, awaiting the LLM instead of blocking.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated educational notes.
+
+        Raises:
+            RuntimeError: If the notes generation process fails.
+        """
+        with reported_failure("YouTube notes generation process failed"):
+            transcript = self._validated_transcript(state)
+
+            if self._needs_condensing(transcript):
+                transcript = await self.map_reduce.acondense(transcript, focus=self.MAP_REDUCE_FOCUS)
+
+            messages = self._create_notes_messages(transcript)
+
+            with reported_failure("Notes generation failed"):
+                notes_response = await self.llm.ainvoke(input=messages)
+                return self._notes_from_response(notes_response)
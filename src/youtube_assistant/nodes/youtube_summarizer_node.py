@@ -1,16 +1,22 @@
 import streamlit as st
 import traceback
 from typing import Dict, Optional
-from src.youtube_assistant.llm import get_llm
+from src.youtube_assistant.llm import get_llm, transcript_prefix_message
+from src.youtube_assistant.llm.map_reduce import get_map_reduce_pipeline
+from src.youtube_assistant.nodes.failure_reporting import reported_failure
+from src.youtube_assistant.retriever.transcript_digest import transcript_source
 from src.youtube_assistant.state import BlogState
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import HumanMessage
 
 
 class YouTubeSummarizerNode:
     """
     Node for generating professional summaries from YouTube video transcripts.
     Takes a transcript from the state and produces a concise, structured summary.
+    Transcripts above the configured token threshold are condensed with map-reduce first.
     """
+
+    MAP_REDUCE_FOCUS = "main points, arguments, statistics, data points and expert quotes for a summary"
     
     def __init__(self, user_input: Dict[str, str]):
         """
@@ -21,6 +27,7 @@ class YouTubeSummarizerNode:
         """
         try:
             self.llm = get_llm(user_input)
+            self.map_reduce = get_map_reduce_pipeline(self.llm) if self.llm else None
         except Exception as e:
             error_msg = f"Failed to initialize LLM: {str(e)}"
             st.error(error_msg)
@@ -30,7 +37,8 @@ class YouTubeSummarizerNode:
     
     def _create_summary_messages(self, transcript: str) -> list:
         """
-        Create the system and human messages for the summarization LLM.
+        Create the messages for the summarization LLM, the shared transcript prefix
+        followed by the summary instructions.
         
         Args:
             transcript (str): The validated transcript.
@@ -38,7 +46,7 @@ class YouTubeSummarizerNode:
         Returns:
             list: A list of messages for the LLM.
         """
-        system_msg = SystemMessage(
+        human_msg = HumanMessage(
             content=(
                 "You are an expert content summarizer specializing in creating concise, "
                 "informative, and well-structured summaries from YouTube video transcripts. "
@@ -58,12 +66,8 @@ class YouTubeSummarizerNode:
                 
                 "Format your summary using markdown for better readability, with ## for section headings "
                 "and bullet points where appropriate. Ensure the summary stands on its own as a "
-                "complete, valuable document that conveys the essential information from the video."
-            )
-        )
-        
-        human_msg = HumanMessage(
-            content=(
+                "complete, valuable document that conveys the essential information from the video.\n\n"
+                
                 "Please create a comprehensive summary of this YouTube video based on its transcript.\n\n"
                 
                 "In your summary:\n"
@@ -74,14 +78,68 @@ class YouTubeSummarizerNode:
                 "- Conclude with the significance or implications of the content\n"
                 "- Use markdown formatting for structure and readability\n\n"
                 
-                f"Here is the transcript:\n\n{transcript}\n\n"
-                
                 "Please provide a professional summary that would be valuable to someone "
                 "who wants to understand the key content without watching the entire video."
             )
         )
         
-        return [system_msg, human_msg]
+        return [transcript_prefix_message(transcript), human_msg]
+
+    def _summary_from_response(self, summary_response) -> Dict[str, str]:
+        """
+        Validate the LLM response and extract the summary.
+
+        Args:
+            summary_response: The LLM response message.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated summary.
+
+        Raises:
+            ValueError: If the response is malformed or empty.
+        """
+        if not hasattr(summary_response, 'content'):
+            error_msg = "Unexpected response format from LLM"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        summary_content = summary_response.content
+
+        if not summary_content.strip():
+            error_msg = "Generated summary is empty"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        st.success("Summary generated successfully!")
+
+        return {'video_summary': summary_content}
+    
+    def _validated_transcript(self, state: BlogState) -> str:
+        """
+        Return the transcript in the state, which may still need condensing.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            str: The transcript.
+
+        Raises:
+            ValueError: If the transcript is missing.
+        """
+        transcript = transcript_source(state, "medium")
+        if not transcript:
+            error_msg = "YouTube transcript is missing"
+            st.error(error_msg)
+            raise ValueError(error_msg)
+
+        st.info("Starting summary generation. This may take a moment...")
+
+        return transcript
+
+    def _needs_condensing(self, transcript: str) -> bool:
+        """Return whether the transcript is long enough to be condensed with map-reduce first."""
+        return bool(self.map_reduce and self.map_reduce.applies_to(transcript))
     
     def generate_youtube_summary_node(self, state: BlogState) -> Dict[str, str]:
         """
@@ -96,47 +154,40 @@ class YouTubeSummarizerNode:
         Raises:
             RuntimeError: If the summary generation process fails.
         """
-        try:
-            transcript = state.get("youtube_transcript")
-            if not transcript:
-                error_msg = "YouTube transcript is missing"
-                st.error(error_msg)
-                raise ValueError(error_msg)
-            
+        with reported_failure("YouTube summary generation process failed"):
+            transcript = self._validated_transcript(state)
+
+            if self._needs_condensing(transcript):
+                with st.spinner("Long transcript detected, condensing it in parallel chunks..."):
+                    transcript = self.map_reduce.condense(transcript, focus=self.MAP_REDUCE_FOCUS)
+
             messages = self._create_summary_messages(transcript)
-            
-            st.info("Starting summary generation. This may take a moment...")
-            
-            try:
-                with st.spinner("Generating summary..."):
-                    summary_response = self.llm.invoke(
-                        input=messages
-                    )
-                    
-                    if not hasattr(summary_response, 'content'):
-                        error_msg = "Unexpected response format from LLM"
-                        st.error(error_msg)
-                        raise ValueError(error_msg)
-                    
-                    summary_content = summary_response.content
-                    
-                    if not summary_content.strip():
-                        error_msg = "Generated summary is empty"
-                        st.error(error_msg)
-                        raise ValueError(error_msg)
-
-                    st.success("Summary generated successfully!")
-                    
-                    return {'video_summary': summary_content}
-                
-            except Exception as e:
-                error_msg = f"Summary generation failed: {str(e)}"
-                st.error(error_msg)
-                st.code(traceback.format_exc(), language="python")
-                raise RuntimeError(error_msg)
-                
-        except Exception as e:
-            error_msg = f"YouTube summary generation process failed: {str(e)}"
-            st.error(error_msg)
-            st.code(traceback.format_exc(), language="python")
-            raise RuntimeError(error_msg)
\ No newline at end of file
+
+            with reported_failure("Summary generation failed"), st.spinner("Generating summary..."):
+                summary_response = self.llm.invoke(input=messages)
+                return self._summary_from_response(summary_response)
+
+    async def agenerate_youtube_summary_node(self, state: BlogState) -> Dict[str, str]:
+        """
+        Async variant of generate_youtube_summary_node, awaiting the LLM instead of blocking.
+
+        Args:
+            state (BlogState): The application state containing the transcript.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the generated summary.
+
+        Raises:
+            RuntimeError: If the summary generation process fails.
+        """
+        with reported_failure("YouTube summary generation process failed"):
+            transcript = self._validated_transcript(state)
+
+            if self._needs_condensing(transcript):
+                transcript = await self.map_reduce.acondense(transcript, focus=self.MAP_REDUCE_FOCUS)
+
+            messages = self._create_summary_messages(transcript)
+
+            with reported_failure("Summary generation failed"):
+                summary_response = await self.llm.ainvoke(input=messages)
+                return self._summary_from_response(summary_response)
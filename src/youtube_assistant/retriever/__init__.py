@@ -0,0 +1,8 @@
+from src.youtube_assistant.retriever.transcript_digest import (
+    TranscriptDigest,
+    TranscriptDigestBuilder,
+    TranscriptDigestStore,
+    digest_key,
+    get_digest_store,
+    transcript_source
+)
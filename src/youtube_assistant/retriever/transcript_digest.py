@@ -0,0 +1,339 @@
+import hashlib
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, List, Mapping, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langgraph.constants import TAG_NOSTREAM
+from src.youtube_assistant.llm.tokens import estimate_tokens, split_by_tokens
+from src.youtube_assistant.runtime.sqlite_store import SQLiteStore
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+# Bump when the digest prompts change, so digests built from old prompts are not reused
+DIGEST_VERSION = 1
+
+RESOLUTIONS = ("short", "medium", "long")
+
+
+@dataclass
+class TranscriptDigest:
+    """
+    Hierarchical digest of one transcript.
+
+    Chunk summaries cover consecutive transcript chunks, section summaries cover
+    consecutive groups of chunk summaries, and the overview covers the whole video.
+    """
+
+    chunk_summaries: List[str]
+    section_summaries: List[str]
+    overview: str
+
+    def view(self, resolution: str) -> str:
+        """
+        Return the digest at a resolution.
+
+        Args:
+            resolution (str): "short" for the overview, "medium" for the section
+                summaries, or "long" for the chunk summaries.
+
+        Returns:
+            str: The digest text at that resolution.
+
+        Raises:
+            ValueError: If the resolution is unknown.
+        """
+        if resolution == "short":
+            return self.overview
+        if resolution == "medium":
+            return "\n\n".join(self.section_summaries)
+        if resolution == "long":
+            return "\n\n".join(self.chunk_summaries)
+        raise ValueError(f"Unknown digest resolution: {resolution}. Valid options are: {', '.join(RESOLUTIONS)}")
+
+    def is_complete(self) -> bool:
+        """
+        Return whether every summary of the digest has text. Incomplete digests, e.g.
+        from a model that returned empty responses, are used once but not stored.
+
+        Returns:
+            bool: True if no chunk summary, section summary or overview is empty.
+        """
+        summaries = [*self.chunk_summaries, *self.section_summaries, self.overview]
+        return bool(self.chunk_summaries) and all(summary.strip() for summary in summaries)
+
+
+def transcript_source(state: Mapping[str, Any], resolution: str) -> Optional[str]:
+    """
+    Return the text a node should work from: the transcript digest at the node's
+    resolution when the state holds one, and the raw transcript otherwise.
+
+    Args:
+        state (Mapping[str, Any]): The application state.
+        resolution (str): The digest resolution the node needs, see TranscriptDigest.view.
+
+    Returns:
+        Optional[str]: The source text, or None if the state has no transcript.
+    """
+    digest = state.get("transcript_digest")
+    if digest is not None:
+        return digest.view(resolution)
+    return state.get("youtube_transcript")
+
+
+def digest_key(transcript: str,
+               provider: str,
+               model: str,
+               chunk_tokens: int,
+               overlap_tokens: int,
+               chunks_per_section: int) -> str:
+    """
+    Derive the cache key of a transcript's digest.
+
+    The key covers the transcript text, the model that writes the summaries and every
+    setting that shapes the digest, so a digest serves every later use case on the
+    video run with the same model.
+
+    Args:
+        transcript (str): The transcript text.
+        provider (str): The LLM provider building the digest.
+        model (str): The model building the digest.
+        chunk_tokens (int): Upper bound on the estimated tokens of a chunk.
+        overlap_tokens (int): Estimated tokens shared by consecutive chunks.
+        chunks_per_section (int): Chunk summaries merged into one section summary.
+
+    Returns:
+        str: The hex digest key.
+    """
+    transcript_hash = hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+    settings = f"v{DIGEST_VERSION}:{provider}:{model}:{chunk_tokens}:{overlap_tokens}:{chunks_per_section}"
+    return hashlib.sha256(f"{transcript_hash}:{settings}".encode("utf-8")).hexdigest()
+
+
+class TranscriptDigestStore(SQLiteStore):
+    """
+    Persistent digest store backed by SQLite.
+
+    Digests are stored compressed and keyed by digest_key. Entries expire after a
+    configurable TTL, and the least recently used entries are evicted once the total
+    stored size exceeds the configured limit.
+    """
+
+    table = "digests"
+
+    def __init__(self,
+                 db_path: str,
+                 ttl_seconds: int = 30 * 86_400,
+                 max_size_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the digest store.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+            ttl_seconds (int): Time-to-live of a stored digest in seconds.
+            max_size_bytes (int): Upper bound on the total compressed payload size.
+        """
+        super().__init__(db_path, ttl_seconds, max_size_bytes)
+
+    def get(self, key: str) -> Optional[TranscriptDigest]:
+        """
+        Look up a stored digest.
+
+        Args:
+            key (str): The digest key.
+
+        Returns:
+            Optional[TranscriptDigest]: The digest, or None on a miss.
+        """
+        entry = self._load((key,))
+        self._count(hit=entry is not None)
+        return TranscriptDigest(**entry[0]) if entry is not None else None
+
+    def put(self, key: str, digest: TranscriptDigest) -> None:
+        """
+        Store a digest and evict least recently used entries if over the size limit.
+
+        Args:
+            key (str): The digest key.
+            digest (TranscriptDigest): The digest to store.
+        """
+        self._store((key,), asdict(digest))
+
+
+class TranscriptDigestBuilder:
+    """
+    Builds the hierarchical digest of a transcript.
+
+    The transcript is split into token-bounded, overlapping chunks that are summarized
+    in parallel. Consecutive chunk summaries are merged into section summaries, and the
+    section summaries into an overview of the whole video. Unlike map-reduce, the
+    prompts are not specific to a use case, so one digest serves them all.
+    """
+
+    def __init__(self,
+                 llm: BaseChatModel,
+                 chunk_tokens: int = 4000,
+                 overlap_tokens: int = 200,
+                 chunks_per_section: int = 4,
+                 max_concurrency: int = 4):
+        """
+        Initialize the digest builder.
+
+        Args:
+            llm (BaseChatModel): The chat model used for the digest calls.
+            chunk_tokens (int): Upper bound on the estimated tokens of a chunk.
+            overlap_tokens (int): Estimated tokens shared by consecutive chunks.
+            chunks_per_section (int): Chunk summaries merged into one section summary.
+            max_concurrency (int): Maximum number of LLM calls in flight at once.
+        """
+        self.llm = llm
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.chunks_per_section = max(2, chunks_per_section)
+        self.max_concurrency = max_concurrency
+
+    def _chunk_messages(self, chunk: str, index: int, total: int) -> List[BaseMessage]:
+        system_msg = SystemMessage(
+            content=(
+                "You are an expert content analyst summarizing one part of a long YouTube video transcript. "
+                "Your summary will be used for blogs, summaries and study notes, so keep it self-contained, "
+                "detailed and faithful to the source."
+            )
+        )
+        human_msg = HumanMessage(
+            content=(
+                f"This is part {index} of {total} of the transcript. Consecutive parts overlap slightly.\n\n"
+                f"{chunk}\n\n"
+                "Summarize this part as concise markdown bullet points, preserving key points, arguments, "
+                "facts, figures, definitions, examples and notable quotes in their original order."
+            )
+        )
+        return [system_msg, human_msg]
+
+    def _section_messages(self, summaries: List[str], index: int, total: int) -> List[BaseMessage]:
+        system_msg = SystemMessage(
+            content=(
+                "You are an expert content analyst merging summaries of consecutive parts of a YouTube video "
+                "transcript into the summary of one section of the video."
+            )
+        )
+        parts = "\n\n".join(f"### Part {number}\n{summary}" for number, summary in enumerate(summaries, start=1))
+        human_msg = HumanMessage(
+            content=(
+                f"This is section {index} of {total} of the video.\n\n{parts}\n\n"
+                "Merge these parts into one section summary: a short markdown heading naming the section's "
+                "topic, followed by bullet points with its main points, key facts and figures. Remove "
+                "repetition caused by overlapping parts and keep the original order."
+            )
+        )
+        return [system_msg, human_msg]
+
+    def _overview_messages(self, summaries: List[str]) -> List[BaseMessage]:
+        system_msg = SystemMessage(
+            content="You are an expert content analyst writing the overview of a YouTube video from its section summaries."
+        )
+        sections = "\n\n".join(summaries)
+        human_msg = HumanMessage(
+            content=(
+                f"{sections}\n\n"
+                "Write an overview of the whole video in one or two short paragraphs: what it is about, "
+                "its main points and its conclusion."
+            )
+        )
+        return [system_msg, human_msg]
+
+    def _sections(self, summaries: List[str]) -> List[List[str]]:
+        groups = [summaries[start:start + self.chunks_per_section]
+                  for start in range(0, len(summaries), self.chunks_per_section)]
+        # A lone trailing summary joins the previous section
+        if len(groups) > 1 and len(groups[-1]) == 1:
+            groups[-2].extend(groups.pop())
+        return groups
+
+    def _invoke_all(self, message_lists: List[List[BaseMessage]]) -> List[str]:
+        # Digest calls are not streamed to the UI
+        responses = self.llm.batch(message_lists, config={'max_concurrency': self.max_concurrency,
+                                                          'tags': [TAG_NOSTREAM]})
+        return [response.content for response in responses]
+
+    async def _ainvoke_all(self, message_lists: List[List[BaseMessage]]) -> List[str]:
+        responses = await self.llm.abatch(message_lists, config={'max_concurrency': self.max_concurrency,
+                                                                 'tags': [TAG_NOSTREAM]})
+        return [response.content for response in responses]
+
+    def _section_message_lists(self, summaries: List[str]) -> List[List[BaseMessage]]:
+        groups = self._sections(summaries)
+        return [self._section_messages(group, index, len(groups)) for index, group in enumerate(groups, start=1)]
+
+    def build(self, transcript: str) -> TranscriptDigest:
+        """
+        Build the digest of a transcript, one level after the other.
+
+        Args:
+            transcript (str): The transcript text.
+
+        Returns:
+            TranscriptDigest: The chunk summaries, section summaries and overview.
+        """
+        chunks = split_by_tokens(transcript, self.chunk_tokens, self.overlap_tokens)
+        chunk_summaries = self._invoke_all([
+            self._chunk_messages(chunk, index, len(chunks))
+            for index, chunk in enumerate(chunks, start=1)
+        ])
+        section_summaries = self._invoke_all(self._section_message_lists(chunk_summaries))
+
+        # Very long videos merge sections further until the overview input fits one call
+        summaries = section_summaries
+        while len(summaries) > 1 and estimate_tokens("\n\n".join(summaries)) > self.chunk_tokens:
+            summaries = self._invoke_all(self._section_message_lists(summaries))
+        overview = self._invoke_all([self._overview_messages(summaries)])[0]
+
+        return TranscriptDigest(chunk_summaries=chunk_summaries,
+                                section_summaries=section_summaries,
+                                overview=overview)
+
+    async def abuild(self, transcript: str) -> TranscriptDigest:
+        """Async variant of build."""
+        chunks = split_by_tokens(transcript, self.chunk_tokens, self.overlap_tokens)
+        chunk_summaries = await self._ainvoke_all([
+            self._chunk_messages(chunk, index, len(chunks))
+            for index, chunk in enumerate(chunks, start=1)
+        ])
+        section_summaries = await self._ainvoke_all(self._section_message_lists(chunk_summaries))
+
+        summaries = section_summaries
+        while len(summaries) > 1 and estimate_tokens("\n\n".join(summaries)) > self.chunk_tokens:
+            summaries = await self._ainvoke_all(self._section_message_lists(summaries))
+        overview = (await self._ainvoke_all([self._overview_messages(summaries)]))[0]
+
+        return TranscriptDigest(chunk_summaries=chunk_summaries,
+                                section_summaries=section_summaries,
+                                overview=overview)
+
+
+_digest_store: Optional[TranscriptDigestStore] = None
+_digest_store_loaded = False
+_digest_store_lock = threading.Lock()
+
+
+def get_digest_store() -> Optional[TranscriptDigestStore]:
+    """
+    Return the process-wide digest store configured in uiconfigfile.ini.
+
+    Returns:
+        Optional[TranscriptDigestStore]: The shared store, or None if digests are disabled.
+    """
+    global _digest_store, _digest_store_loaded
+
+    with _digest_store_lock:
+        if not _digest_store_loaded:
+            settings = Config().get_digest_settings()
+            if settings['enabled']:
+                _digest_store = TranscriptDigestStore(
+                    db_path=settings['db_path'],
+                    ttl_seconds=settings['ttl_seconds'],
+                    max_size_bytes=settings['max_size_mb'] * 1024 * 1024
+                )
+            _digest_store_loaded = True
+
+        return _digest_store
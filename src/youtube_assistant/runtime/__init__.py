@@ -0,0 +1,10 @@
+from src.youtube_assistant.runtime.rate_limiter import (
+    TokenBucket,
+    ProviderRateLimiter,
+    RetryPolicy,
+    get_rate_limiter,
+    get_retry_policy
+)
+from src.youtube_assistant.runtime.event_loop import BackgroundEventLoop, get_event_loop
+from src.youtube_assistant.runtime.admission import AdmissionController, AdmissionRejected, get_admission_controller
+from src.youtube_assistant.runtime.single_flight import SingleFlight, get_single_flight
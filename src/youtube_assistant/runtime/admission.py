@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Deque, Dict, Iterator, Optional
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+# Called with a waiting caller's queue position and estimated wait in seconds
+QueueObserver = Callable[[int, float], None]
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a call would wait in the admission queue longer than the deadline."""
+
+
+class _Ticket:
+    """A queued caller, woken from its own thread or event loop when granted a slot."""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.granted = False
+        self.loop = loop
+        self.event = asyncio.Event() if loop else threading.Event()
+
+    def grant(self) -> None:
+        self.granted = True
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.event.set)
+        else:
+            self.event.set()
+
+
+class AdmissionController:
+    """
+    Process-wide concurrency slots of one provider with a fair FIFO queue.
+
+    Callers from every session, sync or async, take a slot for the duration of a call.
+    When all slots are busy they queue in arrival order, and a released slot is handed
+    straight to the head of the queue. A caller whose estimated wait exceeds the
+    deadline is rejected up front, and one still queued at the deadline gives up.
+    """
+
+    def __init__(self,
+                 name: str,
+                 max_concurrency: int = 0,
+                 max_queue_wait_seconds: float = 60.0,
+                 expected_call_seconds: float = 10.0):
+        """
+        Initialize the admission controller.
+
+        Args:
+            name (str): Provider name used in messages.
+            max_concurrency (int): Calls allowed in flight at once, 0 for unlimited.
+            max_queue_wait_seconds (float): Longest a caller may wait for a slot.
+            expected_call_seconds (float): Initial estimate of how long a call holds a slot.
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self._average_call_seconds = expected_call_seconds
+        self._in_use = 0
+        self._queue: Deque[_Ticket] = deque()
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._queued = 0
+        self._rejected = 0
+
+    def _estimated_wait(self, position: int) -> float:
+        # Slots free up about once per average call, max_concurrency at a time
+        return -(-position // self.max_concurrency) * self._average_call_seconds
+
+    def _enter(self, loop: Optional[asyncio.AbstractEventLoop]) -> Optional[_Ticket]:
+        # Take a free slot, or join the queue; None means admitted right away
+        with self._lock:
+            self._admitted += 1
+            if self._in_use < self.max_concurrency and not self._queue:
+                self._in_use += 1
+                return None
+
+            estimated_wait = self._estimated_wait(len(self._queue) + 1)
+            if estimated_wait > self.max_queue_wait_seconds:
+                self._admitted -= 1
+                self._rejected += 1
+                raise AdmissionRejected(
+                    f"{self.name} is at capacity: the estimated wait of {estimated_wait:.0f}s exceeds "
+                    f"{self.max_queue_wait_seconds:.0f}s. Please try again shortly."
+                )
+
+            ticket = _Ticket(loop)
+            self._queue.append(ticket)
+            self._queued += 1
+            return ticket
+
+    def _position(self, ticket: _Ticket) -> int:
+        with self._lock:
+            return 0 if ticket.granted else self._queue.index(ticket) + 1
+
+    def _give_up(self, ticket: _Ticket) -> None:
+        # Leave the queue at the deadline, unless a slot was granted in the meantime
+        with self._lock:
+            if ticket.granted:
+                return
+            self._queue.remove(ticket)
+            self._admitted -= 1
+            self._rejected += 1
+
+        raise AdmissionRejected(
+            f"Waited more than {self.max_queue_wait_seconds:.0f}s for a {self.name} slot. Please try again shortly."
+        )
+
+    def _release(self, held_seconds: float) -> None:
+        with self._lock:
+            self._average_call_seconds = 0.8 * self._average_call_seconds + 0.2 * held_seconds
+            if self._queue:
+                # Hand the slot over, so it cannot be taken out of turn
+                self._queue.popleft().grant()
+            else:
+                self._in_use -= 1
+
+    def _report(self, ticket: _Ticket, on_queued: Optional[QueueObserver], last_position: int) -> int:
+        position = self._position(ticket)
+        if on_queued and position and position != last_position:
+            on_queued(position, self._estimated_wait(position))
+        return position
+
+    @contextmanager
+    def slot(self, on_queued: Optional[QueueObserver] = None) -> Iterator[None]:
+        """
+        Hold a slot for the duration of the block, waiting for one in FIFO order.
+
+        Args:
+            on_queued (Optional[QueueObserver]): Called while queued, whenever the position changes.
+
+        Raises:
+            AdmissionRejected: If the wait would exceed, or exceeded, the deadline.
+        """
+        if self.max_concurrency <= 0:
+            yield
+            return
+
+        ticket = self._enter(loop=None)
+        if ticket:
+            deadline = time.monotonic() + self.max_queue_wait_seconds
+            position = self._report(ticket, on_queued, 0)
+            while not ticket.event.wait(timeout=min(1.0, max(0.0, deadline - time.monotonic()))):
+                if time.monotonic() >= deadline:
+                    self._give_up(ticket)
+                    break
+                position = self._report(ticket, on_queued, position)
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    @asynccontextmanager
+    async def aslot(self, on_queued: Optional[QueueObserver] = None) -> AsyncIterator[None]:
+        """Async variant of slot, waiting without blocking the event loop."""
+        if self.max_concurrency <= 0:
+            yield
+            return
+
+        ticket = self._enter(loop=asyncio.get_running_loop())
+        if ticket:
+            deadline = time.monotonic() + self.max_queue_wait_seconds
+            position = self._report(ticket, on_queued, 0)
+            while not ticket.event.is_set():
+                try:
+                    await asyncio.wait_for(ticket.event.wait(),
+                                           timeout=min(1.0, max(0.0, deadline - time.monotonic())))
+                except asyncio.TimeoutError:
+                    if time.monotonic() >= deadline:
+                        self._give_up(ticket)
+                        break
+                    position = self._report(ticket, on_queued, position)
+                except asyncio.CancelledError:
+                    # A cancelled waiter must not strand a slot granted to it
+                    try:
+                        self._give_up(ticket)
+                    except AdmissionRejected:
+                        pass
+                    else:
+                        self._release(0.0)
+                    raise
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return counters of the admission controller.
+
+        Returns:
+            Dict[str, float]: Slots in use, queue length, admitted, queued and rejected calls,
+                and the average time a call holds a slot.
+        """
+        with self._lock:
+            return {
+                'in_use': self._in_use,
+                'queue_length': len(self._queue),
+                'admitted': self._admitted,
+                'queued': self._queued,
+                'rejected': self._rejected,
+                'average_call_seconds': round(self._average_call_seconds, 3)
+            }
+
+
+_admission_controllers: Dict[str, AdmissionController] = {}
+_admission_lock = threading.Lock()
+
+
+def get_admission_controller(provider: str) -> AdmissionController:
+    """
+    Return the process-wide admission controller of a provider, configured in uiconfigfile.ini.
+
+    Args:
+        provider (str): The provider name, e.g. 'Groq'.
+
+    Returns:
+        AdmissionController: The shared admission controller.
+    """
+    with _admission_lock:
+        if provider not in _admission_controllers:
+            settings = Config().get_admission_settings(provider)
+            _admission_controllers[provider] = AdmissionController(
+                name=provider,
+                max_concurrency=settings['max_concurrency'],
+                max_queue_wait_seconds=settings['max_queue_wait_seconds'],
+                expected_call_seconds=settings['expected_call_seconds']
+            )
+        return _admission_controllers[provider]
@@ -0,0 +1,101 @@
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterable, Coroutine, Iterator, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class BackgroundEventLoop:
+    """
+    Process-wide asyncio event loop running in a daemon thread.
+
+    Async graph runs from every Streamlit session are scheduled on this one loop, so
+    concurrent runs overlap their I/O without an OS thread per in-flight call, and
+    async HTTP clients shared through the LLM client registry always stay on the
+    loop they were first used on.
+    """
+
+    def __init__(self):
+        """Start the event loop thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="youtube-assistant-event-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and block until it completes.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): The coroutine to run.
+            timeout (Optional[float]): Seconds to wait before giving up.
+
+        Returns:
+            T: The coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> None:
+        """Schedule a coroutine on the loop without waiting for it."""
+        asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def iterate(self, iterable: AsyncIterable[T]) -> Iterator[T]:
+        """
+        Consume an async iterable on the loop and yield its items in the calling thread.
+
+        Args:
+            iterable (AsyncIterable[T]): The async iterable, e.g. graph.astream(...).
+
+        Yields:
+            T: The items in order. Errors raised by the iterable are re-raised here.
+        """
+        items: "queue.Queue" = queue.Queue()
+
+        async def pump() -> None:
+            try:
+                async for item in iterable:
+                    items.put((item, None))
+            except BaseException as e:
+                items.put((None, e))
+            else:
+                items.put((_DONE, None))
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self.loop)
+        try:
+            while True:
+                item, error = items.get()
+                if error is not None:
+                    raise error
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            # Stop the producer if the consumer stopped early
+            future.cancel()
+
+
+_event_loop: Optional[BackgroundEventLoop] = None
+_event_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> BackgroundEventLoop:
+    """
+    Return the process-wide background event loop, starting it on first use.
+
+    Returns:
+        BackgroundEventLoop: The shared event loop.
+    """
+    global _event_loop
+
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = BackgroundEventLoop()
+
+        return _event_loop
@@ -0,0 +1,256 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: throttling, transient server errors and Anthropic's "overloaded"
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+RETRYABLE_ERROR_NAMES = ("RateLimit", "TooManyRequests", "Timeout", "Connection", "Overloaded",
+                         "InternalServer", "RequestBlocked", "IpBlocked", "YouTubeRequestFailed")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a per-minute rate.
+
+    Callers reserve capacity up front and get back how long to wait before using it.
+    Reservations may push the bucket into debt, which makes later callers wait in
+    arrival order. A request larger than the whole bucket only waits for a full bucket.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize the token bucket.
+
+        Args:
+            per_minute (float): Bucket capacity and refill rate per minute.
+        """
+        self.capacity = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserve capacity from the bucket.
+
+        Args:
+            amount (float): The amount to take.
+
+        Returns:
+            float: Seconds to wait before the reserved capacity may be used.
+        """
+        with self._lock:
+            self._refill()
+            needed = min(amount, self.capacity)
+            wait_seconds = max(0.0, needed - self.tokens) / self.refill_per_second
+            self.tokens -= amount
+            return wait_seconds
+
+    def adjust(self, amount: float) -> None:
+        """
+        Return capacity to the bucket, or take more if the amount is negative.
+
+        Args:
+            amount (float): The amount to give back.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class ProviderRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budgets for one provider.
+
+    A budget of 0 means unlimited.
+    """
+
+    def __init__(self, name: str, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        """
+        Initialize the provider rate limiter.
+
+        Args:
+            name (str): The provider name.
+            requests_per_minute (float): Request budget per minute, 0 for unlimited.
+            tokens_per_minute (float): Token budget per minute, 0 for unlimited.
+        """
+        self.name = name
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+    def _reserve(self, tokens: int) -> float:
+        wait_seconds = 0.0
+        if self.request_bucket:
+            wait_seconds = max(wait_seconds, self.request_bucket.reserve(1))
+        if self.token_bucket and tokens:
+            wait_seconds = max(wait_seconds, self.token_bucket.reserve(tokens))
+        return wait_seconds
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request with the given token estimate fits the budgets.
+
+        Args:
+            tokens (int): Estimated tokens the request will consume.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait_seconds = self._reserve(tokens)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async variant of acquire."""
+        wait_seconds = self._reserve(tokens)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        return wait_seconds
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Correct the token budget once the actual usage of a request is known.
+
+        Args:
+            estimated_tokens (int): The estimate passed to acquire.
+            actual_tokens (int): The tokens the provider reported.
+        """
+        if self.token_bucket and actual_tokens:
+            self.token_bucket.adjust(estimated_tokens - actual_tokens)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient provider errors."""
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 30.0):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int): Total attempts including the first one.
+            base_delay (float): Backoff ceiling of the first retry in seconds.
+            max_delay (float): Upper bound of the backoff ceiling in seconds.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        """
+        Decide whether an error is transient.
+
+        Errors are matched by HTTP status code or by the name of their class or one of
+        its base classes, so provider SDKs do not need to be imported here.
+
+        Args:
+            error (BaseException): The raised error.
+
+        Returns:
+            bool: True if the call should be retried.
+        """
+        status_code = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+        if status_code in RETRYABLE_STATUS_CODES:
+            return True
+        return any(name in error_class.__name__
+                   for error_class in type(error).__mro__
+                   for name in RETRYABLE_ERROR_NAMES)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the delay before a retry.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1.
+
+        Returns:
+            float: Seconds to sleep.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Call a function, retrying transient errors.
+
+        Args:
+            fn (Callable[[], T]): The function to call.
+
+        Returns:
+            T: The function's result.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return fn()
+            except Exception as e:
+                if attempt == self.max_attempts or not self.is_retryable(e):
+                    raise
+                time.sleep(self.backoff(attempt))
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of call."""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await fn()
+            except Exception as e:
+                if attempt == self.max_attempts or not self.is_retryable(e):
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+
+
+_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+_retry_policy: Optional[RetryPolicy] = None
+_rate_limit_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """
+    Return the process-wide rate limiter of a provider, configured in uiconfigfile.ini.
+
+    Args:
+        provider (str): The provider name, e.g. 'Groq' or 'YouTube'.
+
+    Returns:
+        ProviderRateLimiter: The shared rate limiter.
+    """
+    with _rate_limit_lock:
+        if provider not in _rate_limiters:
+            budgets = Config().get_rate_limit_settings(provider)
+            _rate_limiters[provider] = ProviderRateLimiter(
+                name=provider,
+                requests_per_minute=budgets['requests_per_minute'],
+                tokens_per_minute=budgets['tokens_per_minute']
+            )
+        return _rate_limiters[provider]
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Return the process-wide retry policy configured in uiconfigfile.ini.
+
+    Returns:
+        RetryPolicy: The shared retry policy.
+    """
+    global _retry_policy
+
+    with _rate_limit_lock:
+        if _retry_policy is None:
+            settings = Config().get_retry_settings()
+            _retry_policy = RetryPolicy(
+                max_attempts=settings['max_attempts'],
+                base_delay=settings['base_delay'],
+                max_delay=settings['max_delay']
+            )
+        return _retry_policy
@@ -0,0 +1,156 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """Items, outcome and waiters of one in-flight computation."""
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.condition = threading.Condition()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical computations into one.
+
+    The first caller for a key starts the computation on a worker thread, and callers
+    arriving with the same key while it runs attach to it. Every caller receives every
+    item the computation produces from the start, and its error if it fails. The
+    computation runs to completion even if a caller stops consuming, so one closed
+    session does not fail the others. Once it finishes, the key is free again.
+    """
+
+    def __init__(self):
+        """Initialize an empty single-flight group."""
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._started = 0
+        self._coalesced = 0
+
+    def stream(self,
+               key: Hashable,
+               producer: Callable[[], Iterable[T]],
+               prepare_thread: Optional[Callable[[threading.Thread], None]] = None) -> Iterator[T]:
+        """
+        Iterate the items of the computation for a key, starting it if none is in flight.
+
+        Args:
+            key (Hashable): Identifies identical computations.
+            producer (Callable[[], Iterable[T]]): Starts the computation and returns its items.
+            prepare_thread (Optional[Callable[[threading.Thread], None]]): Called with the worker
+                thread before it starts, e.g. to attach the caller's Streamlit script context.
+
+        Returns:
+            Iterator[T]: All items of the computation. Its error, if any, is raised at the end.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._started += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if leader:
+            thread = threading.Thread(target=self._run, args=(key, flight, producer), name="single-flight",
+                                      daemon=True)
+            if prepare_thread:
+                prepare_thread(thread)
+            thread.start()
+
+        return self._subscribe(flight)
+
+    def run(self,
+            key: Hashable,
+            fn: Callable[[], T],
+            prepare_thread: Optional[Callable[[threading.Thread], None]] = None) -> T:
+        """
+        Return the result of the computation for a key, starting it if none is in flight.
+
+        Args:
+            key (Hashable): Identifies identical computations.
+            fn (Callable[[], T]): The computation.
+            prepare_thread (Optional[Callable[[threading.Thread], None]]): See stream.
+
+        Returns:
+            T: The shared result.
+        """
+        for result in self.stream(key, lambda: [fn()], prepare_thread):
+            return result
+
+    def _run(self, key: Hashable, flight: _Flight, producer: Callable[[], Iterable[Any]]) -> None:
+        try:
+            for item in producer():
+                with flight.condition:
+                    flight.items.append(item)
+                    flight.condition.notify_all()
+        except BaseException as e:
+            flight.error = e
+        finally:
+            # Later callers start a fresh computation
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            with flight.condition:
+                flight.done = True
+                flight.condition.notify_all()
+
+    @staticmethod
+    def _subscribe(flight: _Flight) -> Iterator[Any]:
+        index = 0
+        while True:
+            with flight.condition:
+                while index == len(flight.items) and not flight.done:
+                    flight.condition.wait()
+                items = flight.items[index:]
+                done = flight.done
+            index += len(items)
+
+            yield from items
+
+            if done:
+                if flight.error is not None:
+                    raise flight.error
+                return
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return counters of the single-flight group.
+
+        Returns:
+            Dict[str, int]: Computations in flight, started, and callers that attached to one.
+        """
+        with self._lock:
+            return {
+                'in_flight': len(self._flights),
+                'started': self._started,
+                'coalesced': self._coalesced
+            }
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Return the process-wide single-flight group, creating it on first use.
+
+    Returns:
+        SingleFlight: The shared single-flight group.
+    """
+    global _single_flight
+
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+
+        return _single_flight
@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+
+class SQLiteStore:
+    """
+    Base of the persistent, size-bounded stores backed by SQLite.
+
+    Each store keeps its entries in one table, named by the subclass and keyed by the
+    subclass's key columns. Values are stored as compressed JSON, expire after a TTL,
+    and the least recently used entries are evicted once the total stored size exceeds
+    the limit. Subclasses add their own tables in _create_tables and convert their
+    values to and from JSON-compatible data around _load and _store.
+    """
+
+    table: str = ""
+    key_columns: Tuple[str, ...] = ("key",)
+
+    def __init__(self, db_path: str, ttl_seconds: int, max_size_bytes: int):
+        """
+        Initialize the store and create its tables.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+            ttl_seconds (int): Time-to-live of an entry in seconds.
+            max_size_bytes (int): Upper bound on the total compressed payload size.
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        key_definitions = "".join(f" {column} TEXT NOT NULL," for column in self.key_columns)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                f"{key_definitions}"
+                " payload BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL,"
+                f" PRIMARY KEY ({', '.join(self.key_columns)}))"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table}_last_access ON {self.table} (last_access)")
+            self._create_tables(conn)
+
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Create the subclass's tables beyond the entries table."""
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A short-lived connection per operation keeps the store safe to share across threads.
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _key_condition(self) -> str:
+        return " AND ".join(f"{column} = ?" for column in self.key_columns)
+
+    def _load(self, key: Sequence[str]) -> Optional[Tuple[Any, float]]:
+        """
+        Read an entry, dropping it if expired and marking it as used otherwise.
+
+        Hits and misses are not counted here, since a lookup may try several keys.
+
+        Args:
+            key (Sequence[str]): Values of the key columns.
+
+        Returns:
+            Optional[Tuple[Any, float]]: The stored value and its creation time, or None.
+        """
+        now = time.time()
+        condition = self._key_condition()
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT payload, created_at FROM {self.table} WHERE {condition}", tuple(key)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            payload, created_at = row
+            if now - created_at > self.ttl_seconds:
+                conn.execute(f"DELETE FROM {self.table} WHERE {condition}", tuple(key))
+                return None
+
+            conn.execute(f"UPDATE {self.table} SET last_access = ? WHERE {condition}", (now, *key))
+
+        return json.loads(zlib.decompress(payload)), created_at
+
+    def _store(self, key: Sequence[str], value: Any) -> None:
+        """
+        Write an entry and evict least recently used entries if over the size limit.
+
+        Args:
+            key (Sequence[str]): Values of the key columns.
+            value (Any): The JSON-compatible value.
+        """
+        payload = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        columns = ", ".join(self.key_columns)
+        placeholders = ", ".join("?" for _ in self.key_columns)
+
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} ({columns}, payload, size, created_at, last_access)"
+                f" VALUES ({placeholders}, ?, ?, ?, ?)",
+                (*key, payload, len(payload), now, now)
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used ones until under the size limit."""
+        conn.execute(f"DELETE FROM {self.table} WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        total_size = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        columns = ", ".join(self.key_columns)
+        condition = self._key_condition()
+        rows = conn.execute(f"SELECT {columns}, size FROM {self.table} ORDER BY last_access ASC").fetchall()
+        for *key, size in rows:
+            if total_size <= self.max_size_bytes:
+                break
+            conn.execute(f"DELETE FROM {self.table} WHERE {condition}", tuple(key))
+            total_size -= size
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _storage_stats(self) -> Tuple[int, int]:
+        """Return the number of stored entries and their total compressed size."""
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}").fetchone()
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM {self.table}")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return store statistics.
+
+        Returns:
+            Dict[str, float]: Hit and miss counts, hit rate, entry count and stored size.
+        """
+        entries, size = self._storage_stats()
+
+        with self._lock:
+            hits, misses = self.hits, self.misses
+
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size
+        }
@@ -1,10 +1,19 @@
 from typing_extensions import TypedDict
-from typing import Optional
+from typing import Annotated, Dict, Optional
+from src.youtube_assistant.retriever.transcript_digest import TranscriptDigest
+from src.youtube_assistant.transcript import TranscriptSegments
+
+
+def merge_errors(left: Optional[Dict[str, str]], right: Optional[Dict[str, str]]) -> Dict[str, str]:
+    # Parallel branches each report their own failure, so the updates are merged
+    return {**(left or {}), **(right or {})}
 
 
 class BlogState(TypedDict):
     youtube_url: str
     youtube_transcript: str
+    youtube_transcript_segments: TranscriptSegments
+    transcript_digest: TranscriptDigest
     
     blog_title: str
     blog_content: str
@@ -13,4 +22,5 @@ class BlogState(TypedDict):
     video_notes: str
 
     video_summary: str
-    
\ No newline at end of file
+
+    artifact_errors: Annotated[Dict[str, str], merge_errors]
@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+from src.youtube_assistant.nodes import TranscriptNode
+from src.youtube_assistant.transcript import extract_video_id
+
+
+@dataclass
+class IngestionResult:
+    """Outcome of ingesting the transcript of a single video."""
+
+    url: str
+    video_id: Optional[str]
+    status: str
+    transcript: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+
+class BulkTranscriptIngestor:
+    """
+    Fetch transcripts for many videos concurrently.
+
+    Work runs on a bounded thread pool, and a per-host semaphore caps how many requests
+    hit the same host at once. Every YouTube URL counts as the same host, including
+    when requests rotate over proxies, so the pool is capped at per_host_limit workers,
+    since more would only wait on the semaphore. Fetched transcripts land in
+    the shared transcript cache, so later graph runs on the same videos skip the network.
+    """
+
+    def __init__(self, max_workers: int = 8, per_host_limit: int = 4, transcript_node: Optional[TranscriptNode] = None):
+        """
+        Initialize the bulk ingestor.
+
+        Args:
+            max_workers (int): Size of the worker thread pool, capped at per_host_limit.
+            per_host_limit (int): Maximum number of concurrent fetches per host.
+            transcript_node (Optional[TranscriptNode]): Node used to fetch transcripts.
+        """
+        if max_workers < 1 or per_host_limit < 1:
+            raise ValueError("max_workers and per_host_limit must be at least 1")
+
+        # Every video is fetched from YouTube, so more workers than the host allows would only wait
+        self.max_workers = min(max_workers, per_host_limit)
+        self.per_host_limit = per_host_limit
+        self.transcript_node = transcript_node or TranscriptNode()
+
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+
+    @staticmethod
+    def load_playlist_file(path: str) -> List[str]:
+        """
+        Read video URLs from a playlist file, one URL per line.
+
+        Blank lines and lines starting with '#' are ignored.
+
+        Args:
+            path (str): Path of the playlist file.
+
+        Returns:
+            List[str]: The video URLs in file order.
+        """
+        with open(path, mode='r', encoding="utf-8-sig") as f:
+            return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+    def _host_key(self, url: str) -> str:
+        # All YouTube URL flavours are served by the same backend
+        host = urlparse(url).netloc.lower()
+        if host == 'youtu.be' or host.endswith('youtube.com'):
+            return 'youtube.com'
+        return host
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = self._host_key(url)
+        with self._host_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_semaphores[host]
+
+    def _ingest_one(self, url: str) -> IngestionResult:
+        started = time.perf_counter()
+        video_id = None
+
+        try:
+            video_id = extract_video_id(url)
+
+            with self._host_semaphore(url):
+                transcript = self.transcript_node.fetch_transcript_text(video_id)
+
+            if not transcript:
+                raise ValueError("Empty transcript after processing")
+
+            return IngestionResult(url=url,
+                                   video_id=video_id,
+                                   status="ok",
+                                   transcript=transcript,
+                                   elapsed_seconds=time.perf_counter() - started)
+
+        except Exception as e:
+            return IngestionResult(url=url,
+                                   video_id=video_id,
+                                   status="failed",
+                                   error=f"{type(e).__name__}: {str(e)}",
+                                   elapsed_seconds=time.perf_counter() - started)
+
+    def ingest(self, urls: Iterable[str]) -> Iterator[IngestionResult]:
+        """
+        Fetch transcripts for the given URLs, yielding results as they complete.
+
+        Failures are reported per video and never abort the batch.
+
+        Args:
+            urls (Iterable[str]): The YouTube video URLs.
+
+        Yields:
+            IngestionResult: The outcome for each video, in completion order.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="transcript-ingest") as executor:
+            futures = [executor.submit(self._ingest_one, url) for url in urls]
+
+            for future in as_completed(futures):
+                yield future.result()
+
+    def ingest_playlist_file(self, path: str) -> Iterator[IngestionResult]:
+        """
+        Fetch transcripts for every URL listed in a playlist file.
+
+        Args:
+            path (str): Path of the playlist file.
+
+        Yields:
+            IngestionResult: The outcome for each video, in completion order.
+        """
+        yield from self.ingest(self.load_playlist_file(path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch YouTube transcripts in bulk.")
+    parser.add_argument("urls", nargs="*", help="YouTube video URLs")
+    parser.add_argument("--playlist-file", help="File with one YouTube URL per line")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Size of the worker thread pool, capped at --per-host-limit")
+    parser.add_argument("--per-host-limit", type=int, default=4,
+                        help="Concurrent fetches allowed per host, across all proxies")
+    parser.add_argument("--output-dir", help="Directory to write <video_id>.txt transcripts into")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.playlist_file:
+        urls.extend(BulkTranscriptIngestor.load_playlist_file(args.playlist_file))
+
+    if not urls:
+        parser.error("Provide at least one URL or --playlist-file")
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    if args.workers > args.per_host_limit:
+        print(f"Warning: --workers {args.workers} exceeds --per-host-limit {args.per_host_limit}, "
+              f"and every video is fetched from YouTube, so only {args.per_host_limit} workers are used",
+              file=sys.stderr)
+
+    ingestor = BulkTranscriptIngestor(max_workers=args.workers, per_host_limit=args.per_host_limit)
+    failed = 0
+
+    for result in ingestor.ingest(urls):
+        if result.status == "ok" and args.output_dir:
+            with open(os.path.join(args.output_dir, f"{result.video_id}.txt"), mode='w', encoding="utf-8") as f:
+                f.write(result.transcript)
+
+        failed += result.status != "ok"
+        report = asdict(result)
+        report.pop("transcript")
+        print(json.dumps(report), flush=True)
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,7 @@
+from src.youtube_assistant.transcript.transcript_cache import TranscriptCache, get_transcript_cache
+from src.youtube_assistant.transcript.video_url import extract_video_id
+from src.youtube_assistant.transcript.normalizer import normalize_segments, normalize_text
+from src.youtube_assistant.transcript.segments import TranscriptSegments
+from src.youtube_assistant.transcript.base_source import BaseTranscriptSource, SourceTranscript
+from src.youtube_assistant.transcript.source import get_transcript_source
+from src.youtube_assistant.transcript.http_pool import PooledHttpClient, get_http_client
\ No newline at end of file
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+
+class SourceTranscript(NamedTuple):
+    """A transcript returned by a transcript source."""
+
+    language_code: str
+    is_generated: bool
+    segments: Iterable[Dict]
+
+
+class BaseTranscriptSource(ABC):
+    """
+    Base class for transcript backends.
+
+    A source turns a video ID into transcript segments, each a dict with 'text',
+    'start' and 'duration' keys.
+    """
+
+    # Whether fetched transcripts should be kept in the transcript cache
+    cacheable: bool = True
+
+    def __init__(self, settings: Dict[str, str]):
+        """
+        Initialize the transcript source.
+
+        Args:
+            settings (Dict[str, str]): The [TRANSCRIPT_SOURCE] settings from uiconfigfile.ini.
+        """
+        self.settings = settings
+
+    @abstractmethod
+    def fetch(self,
+              video_id: str,
+              languages: Sequence[str],
+              resolved_track: Optional[Tuple[str, bool]] = None) -> SourceTranscript:
+        """
+        Fetch the transcript of a video.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            languages (Sequence[str]): Language codes in order of preference.
+            resolved_track (Optional[Tuple[str, bool]]): Language code and generated flag
+                of a track known to exist, tried before the language list.
+
+        Returns:
+            SourceTranscript: The resolved language and the transcript segments.
+        """
+        pass
@@ -0,0 +1,185 @@
+import codecs
+import html
+import json
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+# 00:01:02,500 (SRT), 00:01:02.500 or 01:02.500 (WebVTT)
+_TIMESTAMP = re.compile(r'(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{1,3})')
+_CUE_TIMING = re.compile(r'^\s*(\S+)\s+-->\s+(\S+)')
+_CUE_TAG = re.compile(r'<[^>]*>')
+_JSON_WHITESPACE = re.compile(r'\s*')
+
+_JSON_READ_SIZE = 64 * 1024
+_JSON_MAX_BUFFER = 16 * 1024 * 1024
+
+
+def _parse_timestamp(value: str) -> float:
+    match = _TIMESTAMP.fullmatch(value)
+    if not match:
+        raise ValueError(f"Invalid caption timestamp: {value}")
+
+    hours, minutes, seconds, fraction = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction.ljust(3, '0')) / 1000
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[Optional[mmap.mmap]]:
+    with open(path, mode='rb') as f:
+        # mmap cannot map empty files
+        if f.seek(0, 2) == 0:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _iter_lines(mapped: mmap.mmap) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    for line in iter(mapped.readline, b''):
+        yield decoder.decode(line).rstrip('\r\n')
+
+
+def _iter_cues(lines: Iterator[str]) -> Iterator[Dict]:
+    """Parse timed cue blocks shared by SRT and WebVTT, skipping anything without a timing line."""
+    start = end = None
+    text_lines: List[str] = []
+
+    for line in lines:
+        if not line.strip():
+            if start is not None and text_lines:
+                yield {'text': html.unescape(_CUE_TAG.sub('', ' '.join(text_lines))),
+                       'start': start,
+                       'duration': max(end - start, 0.0)}
+            start = end = None
+            text_lines = []
+            continue
+
+        if start is None:
+            timing = _CUE_TIMING.match(line)
+            if timing:
+                start, end = _parse_timestamp(timing.group(1)), _parse_timestamp(timing.group(2))
+            # Lines before the timing line are cue numbers/identifiers or header blocks
+            continue
+
+        text_lines.append(line.strip())
+
+    if start is not None and text_lines:
+        yield {'text': html.unescape(_CUE_TAG.sub('', ' '.join(text_lines))),
+               'start': start,
+               'duration': max(end - start, 0.0)}
+
+
+def iter_srt_segments(path: str) -> Iterator[Dict]:
+    """
+    Stream segments from a SubRip (.srt) caption file.
+
+    Args:
+        path (str): Path of the caption file.
+
+    Yields:
+        Dict: Segments with 'text', 'start' and 'duration' keys.
+    """
+    with _mapped(path) as mapped:
+        if mapped is not None:
+            yield from _iter_cues(_iter_lines(mapped))
+
+
+def iter_vtt_segments(path: str) -> Iterator[Dict]:
+    """
+    Stream segments from a WebVTT (.vtt) caption file.
+
+    NOTE, STYLE and REGION blocks are skipped, cue settings are ignored and inline
+    tags such as <c> or <00:00:01.000> are stripped from the cue text.
+
+    Args:
+        path (str): Path of the caption file.
+
+    Yields:
+        Dict: Segments with 'text', 'start' and 'duration' keys.
+    """
+    with _mapped(path) as mapped:
+        if mapped is not None:
+            yield from _iter_cues(_iter_lines(mapped))
+
+
+def iter_json_segments(path: str) -> Iterator[Dict]:
+    """
+    Stream segments from a youtube-transcript-api JSON dump.
+
+    The file must hold a top-level array of objects with 'text', 'start' and
+    'duration' keys. Objects are decoded one at a time from a bounded buffer.
+
+    Args:
+        path (str): Path of the JSON file.
+
+    Yields:
+        Dict: Segments with 'text', 'start' and 'duration' keys.
+
+    Raises:
+        ValueError: If the file is not a JSON array of segment objects.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+
+    with _mapped(path) as mapped:
+        if mapped is None:
+            return
+
+        position = 0
+        buffer = ""
+        cursor = 0
+        opened = False
+
+        def fill() -> bool:
+            # Drop the consumed prefix and append the next chunk of the file
+            nonlocal buffer, cursor, position
+            if position >= len(mapped):
+                return False
+            chunk = mapped[position:position + _JSON_READ_SIZE]
+            position += len(chunk)
+            buffer = buffer[cursor:] + text_decoder.decode(chunk, final=position >= len(mapped))
+            cursor = 0
+            return True
+
+        while True:
+            cursor = _JSON_WHITESPACE.match(buffer, cursor).end()
+
+            if cursor >= len(buffer):
+                if fill():
+                    continue
+                if opened:
+                    raise ValueError(f"Unterminated JSON array in {path}")
+                return
+
+            if not opened:
+                if buffer[cursor] != '[':
+                    raise ValueError(f"Expected a JSON array of transcript segments in {path}")
+                cursor += 1
+                opened = True
+                continue
+
+            if buffer[cursor] == ',':
+                cursor += 1
+                continue
+
+            if buffer[cursor] == ']':
+                return
+
+            try:
+                segment, cursor_end = decoder.raw_decode(buffer, cursor)
+            except json.JSONDecodeError:
+                if len(buffer) - cursor > _JSON_MAX_BUFFER or not fill():
+                    raise ValueError(f"Invalid transcript segment in {path}")
+                continue
+
+            if not isinstance(segment, dict):
+                raise ValueError(f"Expected transcript segment objects in {path}")
+
+            cursor = cursor_end
+            yield {'text': segment.get('text', ''),
+                   'start': float(segment.get('start', 0.0)),
+                   'duration': float(segment.get('duration', 0.0))}
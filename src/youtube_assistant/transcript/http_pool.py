@@ -0,0 +1,167 @@
+import threading
+import time
+from contextlib import contextmanager
+from queue import Queue
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from requests import Session
+from requests.adapters import HTTPAdapter
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+class PooledHttpClient:
+    """
+    Shared keep-alive HTTP sessions for transcript fetching, with optional proxy rotation.
+
+    Each egress route (direct, or one per proxy) has one HTTPAdapter, whose bounded
+    urllib3 connection pool keeps connections and TLS sessions alive across videos and
+    Streamlit sessions. requests.Session itself is not thread-safe, so every route keeps
+    pool_size sessions mounting that adapter, and a request checks one out for its
+    duration, waiting while all of them are in use. Requests rotate round-robin over the
+    healthy proxies, and a proxy that fails repeatedly is benched for a cooldown period.
+    """
+
+    def __init__(self,
+                 pool_size: int = 10,
+                 proxies: Optional[Sequence[str]] = None,
+                 failure_threshold: int = 3,
+                 cooldown_seconds: float = 120.0):
+        """
+        Initialize the pooled HTTP client.
+
+        Args:
+            pool_size (int): Maximum number of concurrent requests and kept-alive
+                connections per host and route.
+            proxies (Optional[Sequence[str]]): Proxy URLs to rotate across. Requests go
+                out directly when empty.
+            failure_threshold (int): Consecutive failures after which a proxy is benched.
+            cooldown_seconds (float): How long a benched proxy is skipped.
+        """
+        self.pool_size = pool_size
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+
+        self.routes: List[Optional[str]] = list(proxies) if proxies else [None]
+        self._adapters: Dict[Optional[str], HTTPAdapter] = {
+            route: HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            for route in self.routes
+        }
+        self._idle_sessions: Dict[Optional[str], "Queue[Session]"] = {}
+        for route in self.routes:
+            self._idle_sessions[route] = Queue()
+            for _ in range(max(1, self.pool_size)):
+                self._idle_sessions[route].put(self._create_session(route))
+        self._health: Dict[Optional[str], Dict[str, float]] = {
+            route: {'successes': 0, 'failures': 0, 'consecutive_failures': 0, 'benched_until': 0.0}
+            for route in self.routes
+        }
+        self._next_route = 0
+        self._lock = threading.Lock()
+
+    def _create_session(self, proxy: Optional[str]) -> Session:
+        session = Session()
+        adapter = self._adapters[proxy]
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if proxy:
+            session.proxies = {"http": proxy, "https": proxy}
+        return session
+
+    def _next_healthy_route(self) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            for _ in range(len(self.routes)):
+                route = self.routes[self._next_route]
+                self._next_route = (self._next_route + 1) % len(self.routes)
+                if self._health[route]['benched_until'] <= now:
+                    return route
+
+            # Every proxy is benched, use the one that comes back first
+            return min(self.routes, key=lambda route: self._health[route]['benched_until'])
+
+    @contextmanager
+    def checkout(self) -> Iterator[Tuple[Optional[str], Session]]:
+        """
+        Check out a session of the next route for one request, and return it afterwards.
+
+        Yields:
+            Tuple[Optional[str], Session]: The proxy URL (None when going direct) and a
+            session no other thread uses meanwhile. Pass the proxy back to
+            report_success or report_failure.
+        """
+        route = self._next_healthy_route()
+        idle_sessions = self._idle_sessions[route]
+        session = idle_sessions.get()
+        try:
+            yield route, session
+        finally:
+            idle_sessions.put(session)
+
+    def report_success(self, proxy: Optional[str]) -> None:
+        """Record a successful request through a proxy."""
+        with self._lock:
+            health = self._health[proxy]
+            health['successes'] += 1
+            health['consecutive_failures'] = 0
+            health['benched_until'] = 0.0
+
+    def report_failure(self, proxy: Optional[str]) -> None:
+        """Record a failed request through a proxy and bench it past the failure threshold."""
+        with self._lock:
+            health = self._health[proxy]
+            health['failures'] += 1
+            health['consecutive_failures'] += 1
+            if proxy is not None and health['consecutive_failures'] >= self.failure_threshold:
+                health['benched_until'] = time.time() + self.cooldown_seconds
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return per-route health statistics.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Success/failure counts and bench state keyed by
+            proxy URL, or 'direct' when no proxies are configured.
+        """
+        now = time.time()
+        with self._lock:
+            return {
+                route or "direct": {
+                    'successes': health['successes'],
+                    'failures': health['failures'],
+                    'benched': health['benched_until'] > now
+                }
+                for route, health in self._health.items()
+            }
+
+    def close(self) -> None:
+        """Close every idle session and the connection pools of all routes."""
+        for idle_sessions in self._idle_sessions.values():
+            while not idle_sessions.empty():
+                idle_sessions.get_nowait().close()
+        for adapter in self._adapters.values():
+            adapter.close()
+
+
+_http_client: Optional[PooledHttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHttpClient:
+    """
+    Return the process-wide pooled HTTP client configured in uiconfigfile.ini.
+
+    Returns:
+        PooledHttpClient: The shared HTTP client.
+    """
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            settings = Config().get_transcript_http_settings()
+            _http_client = PooledHttpClient(
+                pool_size=settings['pool_size'],
+                proxies=settings['proxies'],
+                failure_threshold=settings['proxy_failure_threshold'],
+                cooldown_seconds=settings['proxy_cooldown_seconds']
+            )
+
+        return _http_client
@@ -0,0 +1,63 @@
+import os
+from typing import Dict, Optional, Sequence, Tuple
+from src.youtube_assistant.transcript.base_source import BaseTranscriptSource, SourceTranscript
+from src.youtube_assistant.transcript.caption_parsers import (
+    iter_srt_segments,
+    iter_vtt_segments,
+    iter_json_segments
+)
+
+
+class LocalFileTranscriptSource(BaseTranscriptSource):
+    """
+    Transcript source reading caption files from a local directory, no network needed.
+
+    For a video ID the source looks for '<video_id>.<language>.<ext>' for each requested
+    language, then '<video_id>.<ext>', where ext is one of srt, vtt or json. Files are
+    parsed lazily, so segments stream from disk as they are consumed.
+    """
+
+    # Local files are already on disk, caching them would only duplicate storage
+    cacheable = False
+
+    parsers = {
+        "srt": iter_srt_segments,
+        "vtt": iter_vtt_segments,
+        "json": iter_json_segments
+    }
+
+    def __init__(self, settings: Dict[str, str]):
+        """
+        Initialize the local file source.
+
+        Args:
+            settings (Dict[str, str]): Source settings, 'local_directory' names the
+                directory holding the caption files.
+        """
+        super().__init__(settings)
+        self.directory = settings['local_directory']
+
+    def _find_caption_file(self, video_id: str, languages: Sequence[str]) -> Optional[Tuple[str, str, str]]:
+        for language in list(languages) + [None]:
+            stem = f"{video_id}.{language}" if language else video_id
+            for extension in self.parsers:
+                path = os.path.join(self.directory, f"{stem}.{extension}")
+                if os.path.isfile(path):
+                    return path, extension, language or languages[0]
+        return None
+
+    def fetch(self,
+              video_id: str,
+              languages: Sequence[str],
+              resolved_track: Optional[Tuple[str, bool]] = None) -> SourceTranscript:
+        if resolved_track:
+            languages = [resolved_track[0]] + [language for language in languages if language != resolved_track[0]]
+
+        found = self._find_caption_file(video_id, languages)
+        if found is None:
+            raise FileNotFoundError(f"No caption file for video {video_id} in {self.directory}")
+
+        path, extension, language = found
+        return SourceTranscript(language_code=language,
+                                is_generated=False,
+                                segments=self.parsers[extension](path))
@@ -0,0 +1,81 @@
+import re
+from typing import Dict, Iterable
+
+
+# Everything except word characters, whitespace and basic punctuation
+_SPECIAL_CHARACTERS = re.compile(r'[^\w\s.,!?-]')
+
+# ASCII bytes never occur inside a multi-byte UTF-8 sequence, so ASCII special
+# characters can be deleted from the encoded text with a single bytes.translate.
+_ASCII_SPECIAL_BYTES = bytes(c for c in range(128) if _SPECIAL_CHARACTERS.match(chr(c)))
+_ASCII_BYTES = bytes(range(128))
+
+# Characters str.split() treats as whitespace but bytes.split() does not
+_STR_ONLY_WHITESPACE_BYTES = bytes(c for c in range(128) if chr(c).isspace() and not bytes([c]).isspace())
+
+
+def strip_special_characters(text: str) -> str:
+    """
+    Remove every character outside [\\w\\s.,!?-] from text, leaving whitespace as is.
+
+    Args:
+        text (str): The text to clean.
+
+    Returns:
+        str: The text without special characters.
+    """
+    if text.isascii():
+        return text.encode('ascii').translate(None, _ASCII_SPECIAL_BYTES).decode('ascii')
+
+    data = text.encode('utf-8', 'surrogatepass').translate(None, _ASCII_SPECIAL_BYTES)
+    text = data.decode('utf-8', 'surrogatepass')
+
+    # Only the distinct non-ASCII characters need the regex check
+    non_ascii = data.translate(None, _ASCII_BYTES).decode('utf-8', 'surrogatepass')
+    for char in set(non_ascii):
+        if _SPECIAL_CHARACTERS.match(char):
+            text = text.replace(char, '')
+
+    return text
+
+
+def normalize_text(text: str) -> str:
+    """
+    Clean transcript text by removing special characters and collapsing whitespace.
+
+    Produces the same output as removing every character outside [\\w\\s.,!?-] with a
+    regex and then joining text.split() with single spaces, but does the character
+    removal in C-level translate/replace passes instead of a per-character regex scan.
+
+    Args:
+        text (str): The transcript text to clean.
+
+    Returns:
+        str: The cleaned transcript text.
+    """
+    if not text:
+        return ""
+
+    if text.isascii():
+        data = text.encode('ascii').translate(None, _ASCII_SPECIAL_BYTES)
+        if len(data.translate(None, _STR_ONLY_WHITESPACE_BYTES)) == len(data):
+            return b' '.join(data.split()).decode('ascii')
+        return ' '.join(data.decode('ascii').split())
+
+    return ' '.join(strip_special_characters(text).split())
+
+
+def normalize_segments(segments: Iterable[Dict]) -> str:
+    """
+    Clean raw transcript segments into a single normalized string.
+
+    The segment texts are joined once and normalized in place of the previous
+    join, double regex substitution and whitespace collapse passes.
+
+    Args:
+        segments (Iterable[Dict]): Transcript segments with a 'text' key.
+
+    Returns:
+        str: The cleaned transcript text.
+    """
+    return normalize_text("\n".join([segment['text'] for segment in segments if segment.get('text')]))
@@ -0,0 +1,208 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Tuple, Union
+from src.youtube_assistant.transcript.normalizer import strip_special_characters
+
+
+# Joins the segment texts for the single normalization pass. It is whitespace, so it
+# survives the special character removal and never merges words of adjacent segments.
+_SEGMENT_SEPARATOR = '\x1e'
+
+# Replaces the separator for the whitespace collapse. It is a special character, so
+# the stripped text cannot contain it otherwise.
+_SEGMENT_MARKER = '\x00'
+
+
+class TranscriptSegments:
+    """
+    Compact, timestamped view of a normalized transcript.
+
+    Holds one contiguous text buffer plus array-backed start, duration and offset
+    columns instead of a dict per segment. Segment i covers
+    text[offsets[i]:offsets[i + 1] - 1] and starts at starts[i] seconds.
+    """
+
+    __slots__ = ("text", "starts", "durations", "offsets")
+
+    def __init__(self,
+                 text: str,
+                 starts: Union[array, bytes],
+                 durations: Union[array, bytes],
+                 offsets: Union[array, bytes]):
+        """
+        Initialize the segment store from prebuilt columns.
+
+        Args:
+            text (str): The normalized transcript text.
+            starts (Union[array, bytes]): Segment start times in seconds, non-decreasing.
+            durations (Union[array, bytes]): Segment durations in seconds.
+            offsets (Union[array, bytes]): Offset of each segment's first character in text.
+                Columns given as bytes are the machine representation of the array.
+        """
+        self.text = text
+        self.starts = starts if isinstance(starts, array) else array('d', starts)
+        self.durations = durations if isinstance(durations, array) else array('d', durations)
+        self.offsets = offsets if isinstance(offsets, array) else array('q', offsets)
+
+    def _asdict(self) -> Dict[str, Any]:
+        # Lets the msgpack checkpoint serializer store the columns as plain bytes,
+        # and rebuild the store by passing them back to the constructor
+        return {
+            'text': self.text,
+            'starts': self.starts.tobytes(),
+            'durations': self.durations.tobytes(),
+            'offsets': self.offsets.tobytes()
+        }
+
+    @classmethod
+    def from_raw_segments(cls, segments: Iterable[Dict]) -> "TranscriptSegments":
+        """
+        Build the segment store from raw transcript segments.
+
+        Segments are ordered by start time, and their texts are joined once and
+        stripped of special characters in a single pass, like normalize_segments().
+        The offsets are derived from the joined result, so for time-ordered input the
+        text is identical to normalize_segments(). Segments that are empty after
+        normalization are dropped.
+
+        Args:
+            segments (Iterable[Dict]): Segments with 'text', 'start' and 'duration' keys.
+
+        Returns:
+            TranscriptSegments: The compact segment store.
+        """
+        raw_starts = array('d')
+        raw_durations = array('d')
+        texts = []
+        in_order = True
+
+        # Consume the segments as a stream so file-backed sources never materialize them
+        for segment in segments:
+            text = segment.get('text')
+            if not text:
+                continue
+
+            start = segment.get('start', 0.0)
+            if raw_starts and start < raw_starts[-1]:
+                in_order = False
+
+            raw_starts.append(start)
+            raw_durations.append(segment.get('duration', 0.0))
+            texts.append(text)
+
+        if not in_order:
+            order = sorted(range(len(raw_starts)), key=raw_starts.__getitem__)
+            raw_starts = array('d', (raw_starts[i] for i in order))
+            raw_durations = array('d', (raw_durations[i] for i in order))
+            texts = [texts[i] for i in order]
+
+        joined = _SEGMENT_SEPARATOR.join(texts)
+        if joined.count(_SEGMENT_SEPARATOR) != max(len(texts) - 1, 0):
+            joined = _SEGMENT_SEPARATOR.join(text.replace(_SEGMENT_SEPARATOR, ' ') for text in texts)
+
+        starts = array('d')
+        durations = array('d')
+        offsets = array('q')
+        pieces = []
+        position = 0
+
+        stripped = strip_special_characters(joined).replace(_SEGMENT_SEPARATOR, _SEGMENT_MARKER)
+        # One whitespace collapse over the whole text, which keeps the markers between segments
+        cleaned_texts = map(str.strip, ' '.join(stripped.split()).split(_SEGMENT_MARKER)) if texts else ()
+        for index, cleaned in enumerate(cleaned_texts):
+            if not cleaned:
+                continue
+
+            starts.append(raw_starts[index])
+            durations.append(raw_durations[index])
+            offsets.append(position)
+            pieces.append(cleaned)
+            position += len(cleaned) + 1
+
+        return cls(' '.join(pieces), starts, durations, offsets)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _segment_end(self, index: int) -> int:
+        return self.offsets[index + 1] - 1 if index + 1 < len(self.offsets) else len(self.text)
+
+    def segment(self, index: int) -> Tuple[float, float, str]:
+        """
+        Return a single segment.
+
+        Args:
+            index (int): The segment index.
+
+        Returns:
+            Tuple[float, float, str]: The start time, duration and text of the segment.
+        """
+        return self.starts[index], self.durations[index], self.text[self.offsets[index]:self._segment_end(index)]
+
+    def index_at_time(self, seconds: float) -> int:
+        """
+        Find the segment playing at a point in time.
+
+        Args:
+            seconds (float): Time from the start of the video in seconds.
+
+        Returns:
+            int: Index of the last segment starting at or before the given time,
+            or -1 if the time precedes the first segment.
+        """
+        return bisect_right(self.starts, seconds) - 1
+
+    def index_at_offset(self, offset: int) -> int:
+        """
+        Find the segment containing a character offset of the transcript text.
+
+        Args:
+            offset (int): Character offset into the transcript text.
+
+        Returns:
+            int: Index of the segment containing the offset, or -1 if there is none.
+        """
+        return bisect_right(self.offsets, offset) - 1
+
+    def text_at_time(self, seconds: float) -> str:
+        """
+        Return the text of the segment playing at a point in time.
+
+        Args:
+            seconds (float): Time from the start of the video in seconds.
+
+        Returns:
+            str: The segment text, or an empty string if no segment has started yet.
+        """
+        index = self.index_at_time(seconds)
+        return self.segment(index)[2] if index >= 0 else ""
+
+    def time_at_offset(self, offset: int) -> float:
+        """
+        Return the start time of the segment containing a character offset.
+
+        Args:
+            offset (int): Character offset into the transcript text.
+
+        Returns:
+            float: The segment start time in seconds, 0.0 if the offset precedes all segments.
+        """
+        index = self.index_at_offset(offset)
+        return self.starts[index] if index >= 0 else 0.0
+
+    def text_between(self, start_seconds: float, end_seconds: float) -> str:
+        """
+        Return the text of every segment starting within a time window.
+
+        Args:
+            start_seconds (float): Window start in seconds, inclusive.
+            end_seconds (float): Window end in seconds, exclusive.
+
+        Returns:
+            str: The concatenated segment texts.
+        """
+        first = bisect_left(self.starts, start_seconds)
+        last = bisect_left(self.starts, end_seconds)
+        if first >= last:
+            return ""
+        return self.text[self.offsets[first]:self._segment_end(last - 1)]
@@ -0,0 +1,31 @@
+from typing import Dict, Type
+from src.youtube_assistant.transcript.base_source import BaseTranscriptSource
+from src.youtube_assistant.transcript.youtube_source import YouTubeTranscriptSource
+from src.youtube_assistant.transcript.local_source import LocalFileTranscriptSource
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+def get_transcript_source() -> BaseTranscriptSource:
+    """
+    Create the transcript source selected in uiconfigfile.ini.
+
+    Returns:
+        BaseTranscriptSource: The configured transcript source.
+
+    Raises:
+        ValueError: If the configured source is not supported.
+    """
+    settings = Config().get_transcript_source_settings()
+
+    transcript_sources: Dict[str, Type[BaseTranscriptSource]] = {
+        "youtube": YouTubeTranscriptSource,
+        "local": LocalFileTranscriptSource
+    }
+    selected_source = settings['source']
+    source_class = transcript_sources.get(selected_source)
+
+    if source_class is None:
+        supported_sources = ', '.join(transcript_sources.keys())
+        raise ValueError(f"Unsupported transcript source: {selected_source}. Supported sources: {supported_sources}")
+
+    return source_class(settings)
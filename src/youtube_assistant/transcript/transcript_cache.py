@@ -0,0 +1,223 @@
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.youtube_assistant.runtime.sqlite_store import SQLiteStore
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+class TranscriptCache(SQLiteStore):
+    """
+    Persistent transcript store backed by SQLite.
+
+    Raw transcript segments are stored compressed and keyed by (video_id, language).
+    Entries expire after a configurable TTL, and the least recently used entries are
+    evicted once the total stored size exceeds the configured limit.
+
+    The cache also remembers failed lookups (per error class, with short TTLs) and
+    which language track resolved for each video.
+    """
+
+    table = "transcripts"
+    key_columns = ("video_id", "language")
+
+    def __init__(self,
+                 db_path: str,
+                 ttl_seconds: int = 86_400,
+                 max_size_bytes: int = 256 * 1024 * 1024,
+                 negative_ttls: Optional[Dict[str, int]] = None,
+                 language_ttl_seconds: int = 7 * 86_400):
+        """
+        Initialize the transcript cache.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+            ttl_seconds (int): Time-to-live of a cached transcript in seconds.
+            max_size_bytes (int): Upper bound on the total compressed payload size.
+            negative_ttls (Optional[Dict[str, int]]): Time-to-live in seconds of a cached
+                failure, keyed by error class name. Unlisted error classes are not cached.
+            language_ttl_seconds (int): Time-to-live of a resolved language track.
+        """
+        self.negative_ttls = negative_ttls or {}
+        self.language_ttl_seconds = language_ttl_seconds
+        self.negative_hits = 0
+        super().__init__(db_path, ttl_seconds, max_size_bytes)
+
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS failures ("
+            " video_id TEXT PRIMARY KEY,"
+            " error_class TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS resolved_languages ("
+            " video_id TEXT PRIMARY KEY,"
+            " language TEXT NOT NULL,"
+            " is_generated INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+
+    def get(self, video_id: str, languages: Sequence[str]) -> Optional[Tuple[str, List[Dict]]]:
+        """
+        Look up a cached transcript, trying the languages in priority order.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            languages (Sequence[str]): Language codes in order of preference.
+
+        Returns:
+            Optional[Tuple[str, List[Dict]]]: The matched language code and the raw
+            transcript segments, or None on a miss.
+        """
+        for language in languages:
+            entry = self._load((video_id, language))
+            if entry is not None:
+                self._count(hit=True)
+                return language, entry[0]
+
+        self._count(hit=False)
+        return None
+
+    def put(self, video_id: str, language: str, segments: List[Dict]) -> None:
+        """
+        Store a transcript and evict least recently used entries if over the size limit.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (str): The language code of the transcript.
+            segments (List[Dict]): The raw transcript segments.
+        """
+        self._store((video_id, language), segments)
+
+    def get_failure(self, video_id: str) -> Optional[str]:
+        """
+        Look up a cached failure for a video.
+
+        Args:
+            video_id (str): The YouTube video ID.
+
+        Returns:
+            Optional[str]: The error class name of the cached failure, or None.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT error_class FROM failures WHERE video_id = ? AND expires_at > ?",
+                (video_id, time.time())
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        with self._lock:
+            self.negative_hits += 1
+        return row[0]
+
+    def put_failure(self, video_id: str, error_class: str) -> None:
+        """
+        Remember a failed lookup if its error class has a configured TTL.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            error_class (str): The name of the exception raised by the lookup.
+        """
+        ttl_seconds = self.negative_ttls.get(error_class)
+        if not ttl_seconds:
+            return
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM failures WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO failures (video_id, error_class, expires_at) VALUES (?, ?, ?)",
+                (video_id, error_class, now + ttl_seconds)
+            )
+
+    def get_resolved_language(self, video_id: str) -> Optional[Tuple[str, bool]]:
+        """
+        Look up the language track that previously resolved for a video.
+
+        Args:
+            video_id (str): The YouTube video ID.
+
+        Returns:
+            Optional[Tuple[str, bool]]: The language code and whether the track is
+            auto-generated, or None if unknown.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT language, is_generated FROM resolved_languages WHERE video_id = ? AND expires_at > ?",
+                (video_id, time.time())
+            ).fetchone()
+
+        return (row[0], bool(row[1])) if row else None
+
+    def put_resolved_language(self, video_id: str, language: str, is_generated: bool) -> None:
+        """
+        Remember which language track resolved for a video.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (str): The resolved language code.
+            is_generated (bool): Whether the resolved track is auto-generated.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM resolved_languages WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO resolved_languages (video_id, language, is_generated, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (video_id, language, int(is_generated), now + self.language_ttl_seconds)
+            )
+
+    def clear(self) -> None:
+        """Remove every cached entry and reset the counters."""
+        super().clear()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM failures")
+            conn.execute("DELETE FROM resolved_languages")
+        with self._lock:
+            self.negative_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, float]: Hit, miss and negative hit counts, hit rate, entry count
+            and stored size.
+        """
+        stats = super().stats()
+        with self._lock:
+            stats["negative_hits"] = self.negative_hits
+        return stats
+
+
+_transcript_cache: Optional[TranscriptCache] = None
+_transcript_cache_loaded = False
+_transcript_cache_lock = threading.Lock()
+
+
+def get_transcript_cache() -> Optional[TranscriptCache]:
+    """
+    Return the process-wide transcript cache configured in uiconfigfile.ini.
+
+    Returns:
+        Optional[TranscriptCache]: The shared cache, or None if caching is disabled.
+    """
+    global _transcript_cache, _transcript_cache_loaded
+
+    with _transcript_cache_lock:
+        if not _transcript_cache_loaded:
+            settings = Config().get_transcript_cache_settings()
+            if settings['enabled']:
+                _transcript_cache = TranscriptCache(
+                    db_path=settings['db_path'],
+                    ttl_seconds=settings['ttl_seconds'],
+                    max_size_bytes=settings['max_size_mb'] * 1024 * 1024,
+                    negative_ttls=settings['negative_ttls'],
+                    language_ttl_seconds=settings['language_ttl_seconds']
+                )
+            _transcript_cache_loaded = True
+
+        return _transcript_cache
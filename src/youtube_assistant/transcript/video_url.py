@@ -0,0 +1,27 @@
+from urllib.parse import urlparse, parse_qs
+
+
+def extract_video_id(url: str) -> str:
+    """
+    Extract the video ID from a YouTube URL.
+
+    Args:
+        url (str): The YouTube URL.
+
+    Returns:
+        str: The extracted video ID.
+
+    Raises:
+        ValueError: If the URL format is invalid.
+    """
+    if 'youtu.be' in url:
+        return url.split('/')[-1].split('?')[0]
+
+    parsed_url = urlparse(url)
+    if 'youtube.com' in parsed_url.netloc:
+        if '/watch' in parsed_url.path:
+            return parse_qs(parsed_url.query)['v'][0]
+        elif '/embed/' in parsed_url.path or '/v/' in parsed_url.path:
+            return parsed_url.path.split('/')[-1]
+
+    raise ValueError("Invalid YouTube URL format")
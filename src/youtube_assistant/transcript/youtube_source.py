@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Sequence, Tuple
+from requests import RequestException, Session
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    NoTranscriptFound,
+    RequestBlocked,
+    YouTubeRequestFailed
+)
+from src.youtube_assistant.transcript.base_source import BaseTranscriptSource, SourceTranscript
+from src.youtube_assistant.transcript.http_pool import get_http_client
+from src.youtube_assistant.runtime.rate_limiter import get_rate_limiter, get_retry_policy
+
+
+class YouTubeTranscriptSource(BaseTranscriptSource):
+    """
+    Transcript source backed by YouTubeTranscriptApi over the shared pooled HTTP client.
+
+    Fetches are paced by the 'YouTube' rate limiter and throttled or transient failures
+    are retried with backoff, each attempt on the next healthy route.
+    """
+
+    def __init__(self, settings: Dict[str, str]):
+        super().__init__(settings)
+        self.http_client = get_http_client()
+        self.rate_limiter = get_rate_limiter("YouTube")
+        self.retry_policy = get_retry_policy()
+
+    def fetch(self,
+              video_id: str,
+              languages: Sequence[str],
+              resolved_track: Optional[Tuple[str, bool]] = None) -> SourceTranscript:
+        return self.retry_policy.call(lambda: self._fetch_once(video_id, languages, resolved_track))
+
+    def _fetch_once(self,
+                    video_id: str,
+                    languages: Sequence[str],
+                    resolved_track: Optional[Tuple[str, bool]]) -> SourceTranscript:
+        self.rate_limiter.acquire()
+
+        with self.http_client.checkout() as (proxy, session):
+            try:
+                fetched = self._fetch_with_session(session, video_id, languages, resolved_track)
+            except (RequestBlocked, YouTubeRequestFailed, RequestException):
+                self.http_client.report_failure(proxy)
+                raise
+
+        self.http_client.report_success(proxy)
+        return fetched
+
+    def _fetch_with_session(self,
+                            session: Session,
+                            video_id: str,
+                            languages: Sequence[str],
+                            resolved_track: Optional[Tuple[str, bool]]) -> SourceTranscript:
+        transcript_list = YouTubeTranscriptApi(http_client=session).list(video_id)
+        track = None
+
+        if resolved_track:
+            language, is_generated = resolved_track
+            try:
+                if is_generated:
+                    track = transcript_list.find_generated_transcript([language])
+                else:
+                    track = transcript_list.find_manually_created_transcript([language])
+            except NoTranscriptFound:
+                # The resolved track is gone, fall back to the full language list
+                track = None
+
+        if track is None:
+            track = transcript_list.find_transcript(languages)
+
+        fetched = track.fetch()
+        return SourceTranscript(language_code=fetched.language_code,
+                                is_generated=fetched.is_generated,
+                                segments=fetched.to_raw_data())
@@ -1,13 +1,54 @@
 import streamlit as st
+import threading
 import traceback
-from typing import Literal
+from typing import Any, Dict, Hashable, Iterator, Literal, Optional, Sequence, Tuple
+from langchain_core.utils.json import parse_json_markdown
+from langgraph.types import Command, StateUpdate
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from src.youtube_assistant.graph.checkpointing import thread_id_for
+from src.youtube_assistant.graph.profiler import PROFILE_RUN_KEY, RunProfile, get_node_profiler
+from src.youtube_assistant.llm.telemetry import LLMTelemetryHandler, get_telemetry_store
+from src.youtube_assistant.runtime.event_loop import get_event_loop
+from src.youtube_assistant.runtime.single_flight import get_single_flight
+from src.youtube_assistant.ui.uiconfigfile import Config
+
+
+# Streamed nodes whose LLM output is JSON, with the field rendered while it streams
+JSON_STREAMED_FIELDS = {"generate_blog_node": "content"}
+
+
+def _streamed_view(node: str, text: str) -> str:
+    field = JSON_STREAMED_FIELDS.get(node)
+    if field is None:
+        return text
+    try:
+        partial = parse_json_markdown(text)
+    except ValueError:
+        return ""
+    value = partial.get(field) if isinstance(partial, dict) else None
+    return value if isinstance(value, str) else ""
+
+
+def _attach_script_context(thread: threading.Thread) -> None:
+    # Progress messages of a shared run still reach the session that started it
+    add_script_run_ctx(thread, get_script_run_ctx())
 
 
 class DisplayResultStreamlit:
-    def __init__(self, usecase, graph, youtube_url):
+    def __init__(self, usecase, graph, youtube_url, flight_key: Optional[Hashable] = None, resume: bool = False):
         self.usecase = usecase
         self.graph = graph
         self.youtube_url = youtube_url
+        self.flight_key = flight_key
+        self.resume = resume
+        self.single_flight_enabled = Config().get_single_flight_settings()['enabled']
+        self.streaming_enabled = Config().get_streaming_settings()['enabled']
+        self.async_enabled = Config().get_execution_settings()['async_enabled']
+        self.telemetry_store = get_telemetry_store()
+        self.telemetry: Optional[LLMTelemetryHandler] = None
+        self.node_profiler = get_node_profiler()
+        self.profile: Optional[RunProfile] = None
+        self.profile_path: Optional[str] = None
 
         if "message_history" not in st.session_state:
             st.session_state.message_history = []   
@@ -25,6 +66,273 @@ class DisplayResultStreamlit:
         for chat in st.session_state.message_history:
             self._display_message(chat["role"], chat["message"])
 
+    def _run_graph(self, streamed_nodes: Sequence[str]) -> Dict[str, Any]:
+        """
+        Run the graph, rendering LLM tokens of the given nodes as they arrive.
+
+        In async mode the graph runs on the shared background event loop through
+        ainvoke/astream, and this script thread only renders the results. With a
+        flight key, concurrent identical requests share one run and its stream.
+        With a checkpointer, the flight key also names the run's checkpoint thread,
+        so a failed run can be resumed from its last completed node, and a run with
+        failed branches by running only those branches again.
+
+        Args:
+            streamed_nodes (Sequence[str]): Names of the nodes whose output is shown live.
+
+        Returns:
+            Dict[str, Any]: The final graph state.
+        """
+        graph_input = {'youtube_url': self.youtube_url}
+        config = {}
+        if self.telemetry_store:
+            self.telemetry = LLMTelemetryHandler(usecase=self.usecase, store=self.telemetry_store)
+            config['callbacks'] = [self.telemetry]
+        if self.node_profiler:
+            self.profile = self.node_profiler.start_run(self.usecase)
+            config['configurable'] = {PROFILE_RUN_KEY: self.profile.run_id}
+
+        def graph_events() -> Iterator[Tuple[str, Any]]:
+            if self.graph.checkpointer is None:
+                return self._graph_events(graph_input, config)
+            return self._checkpointed_graph_events(graph_input, config)
+
+        try:
+            if self.single_flight_enabled and self.flight_key is not None:
+                events = get_single_flight().stream(self.flight_key, graph_events,
+                                                    prepare_thread=_attach_script_context)
+            else:
+                events = graph_events()
+            return self._consume_events(events, streamed_nodes)
+        finally:
+            if self.telemetry:
+                self.telemetry.flush()
+            if self.profile:
+                self.node_profiler.finish_run(self.profile)
+                # Runs joined through single-flight record nothing of their own
+                if self.profile.spans():
+                    self.profile_path = self.profile.export(Config().get_profiler_settings()['trace_dir'])
+
+    def _checkpointed_graph_events(self,
+                                   graph_input: Dict[str, Any],
+                                   config: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        # Runs inside the shared flight, so only one caller touches the checkpoint thread
+        # The node names keep a changed graph, e.g. another blog mode, off old checkpoints
+        thread_id = thread_id_for(None if self.flight_key is None else (self.flight_key, tuple(self.graph.nodes)))
+        config = {**config, 'configurable': {**config.get('configurable', {}), 'thread_id': thread_id}}
+        thread_config = config
+        snapshot = self._get_state(thread_config)
+        failed_branches = set(snapshot.values.get('artifact_errors') or {})
+        fork = None
+        if self.resume and self.flight_key is not None and failed_branches:
+            fork = self._fork_before_branches(config, failed_branches)
+
+        if fork is not None:
+            st.info(f"Running the failed branches of the last run again: {', '.join(sorted(failed_branches))}")
+            graph_input, config = fork
+        elif self.resume and self.flight_key is not None and snapshot.next:
+            # None as input continues from the last checkpoint, skipping completed nodes
+            st.info(f"Resuming the last failed run from: {', '.join(snapshot.next)}")
+            graph_input = None
+        else:
+            self._delete_checkpoints(thread_id)
+
+        try:
+            yield from self._graph_events(graph_input, config)
+        except Exception:
+            if self.flight_key is not None:
+                st.info("The completed steps of this run are saved. Submit again with "
+                        "\"Resume a failed run\" checked to continue from where it stopped.")
+            else:
+                self._delete_checkpoints(thread_id)
+            raise
+
+        if self.flight_key is not None and self._get_state(thread_config).values.get('artifact_errors'):
+            st.info("The artifacts that were generated are saved. Submit again with "
+                    "\"Resume a failed run\" checked to run only the failed branches again.")
+            return
+
+        # Finished runs are not resumed, so their checkpoints are dropped
+        self._delete_checkpoints(thread_id)
+
+    def _get_state(self, config: Dict[str, Any]) -> Any:
+        if self.async_enabled:
+            return get_event_loop().run(self.graph.aget_state(config))
+        return self.graph.get_state(config)
+
+    def _fork_before_branches(self,
+                              config: Dict[str, Any],
+                              failed_branches: set) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Fork a run with failed branches at the step its branches ran in, keeping the
+        results of the branches that succeeded, so only the failed ones run again.
+
+        Args:
+            config (Dict[str, Any]): The run config with the checkpoint thread.
+            failed_branches (set): Names of the branch nodes that failed.
+
+        Returns:
+            Optional[Tuple[Any, Dict[str, Any]]]: The graph input and config continuing
+            from the fork, or None if the step is not in the checkpoint history.
+        """
+        async def ahistory():
+            return [snapshot async for snapshot in self.graph.aget_state_history(config)]
+
+        if self.async_enabled:
+            history = get_event_loop().run(ahistory())
+        else:
+            history = list(self.graph.get_state_history(config))
+
+        branch_step = next((snapshot for snapshot in history if failed_branches <= set(snapshot.next)), None)
+        if branch_step is None:
+            return None
+
+        succeeded = [StateUpdate(task.result, task.name) for task in branch_step.tasks
+                     if task.result is not None and task.name not in failed_branches]
+        if succeeded:
+            # Apply the kept results as that step, then send only the failed branches
+            graph_input = Command(goto=sorted(failed_branches))
+            if self.async_enabled:
+                fork_config = get_event_loop().run(self.graph.abulk_update_state(branch_step.config, [succeeded]))
+            else:
+                fork_config = self.graph.bulk_update_state(branch_step.config, [succeeded])
+        else:
+            # Every branch failed, so a copy of the step runs all of them again
+            graph_input = None
+            if self.async_enabled:
+                fork_config = get_event_loop().run(self.graph.aupdate_state(branch_step.config, None,
+                                                                            as_node="__copy__"))
+            else:
+                fork_config = self.graph.update_state(branch_step.config, None, as_node="__copy__")
+
+        return graph_input, {**config, 'configurable': {**config['configurable'], **fork_config['configurable']}}
+
+    def _delete_checkpoints(self, thread_id: str) -> None:
+        if self.async_enabled:
+            get_event_loop().run(self.graph.checkpointer.adelete_thread(thread_id))
+        else:
+            self.graph.checkpointer.delete_thread(thread_id)
+
+    def _graph_events(self, graph_input: Dict[str, Any], config: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        # (stream mode, payload) pairs; without streaming only the final values
+        if not self.streaming_enabled:
+            if self.async_enabled:
+                yield "values", get_event_loop().run(self.graph.ainvoke(input=graph_input, config=config))
+            else:
+                yield "values", self.graph.invoke(input=graph_input, config=config)
+            return
+
+        stream_mode = ["messages", "values", "custom"]
+        if self.async_enabled:
+            yield from get_event_loop().iterate(self.graph.astream(input=graph_input, config=config,
+                                                                   stream_mode=stream_mode))
+        else:
+            yield from self.graph.stream(input=graph_input, config=config, stream_mode=stream_mode)
+
+    def _consume_events(self, events: Iterator[Tuple[str, Any]], streamed_nodes: Sequence[str]) -> Dict[str, Any]:
+        if not self.streaming_enabled:
+            final_state: Dict[str, Any] = {}
+            for mode, payload in events:
+                final_state = payload
+            return final_state
+
+        with st.chat_message("assistant"):
+            status = st.empty()
+            placeholder = st.empty()
+
+        streamed_text = ""
+        streamed_call = None
+        final_state: Dict[str, Any] = {}
+        for mode, payload in events:
+            if mode == "values":
+                final_state = payload
+                continue
+
+            if mode == "custom":
+                queue = payload.get("admission_queue") if isinstance(payload, dict) else None
+                if queue:
+                    status.info(f"Waiting for a {queue['provider']} slot: position {queue['position']} in the "
+                                f"queue, about {queue['estimated_wait_seconds']:.0f}s.")
+                continue
+
+            status.empty()
+            chunk, metadata = payload
+            node = metadata.get("langgraph_node")
+            if node in streamed_nodes and chunk.text:
+                if chunk.id != streamed_call:
+                    # A new LLM call of the node, e.g. a re-ask after a parse error, starts over
+                    streamed_call, streamed_text = chunk.id, ""
+                streamed_text += chunk.text
+                placeholder.markdown(_streamed_view(node, streamed_text) + "▌")
+
+        # The finished result is rendered by the caller
+        status.empty()
+        placeholder.empty()
+        return final_state
+
+    def _display_telemetry(self) -> None:
+        if not self.telemetry:
+            return
+
+        node_summary = self.telemetry.node_summary()
+        if not node_summary:
+            return
+
+        with st.expander(label="LLM usage", expanded=False):
+            st.caption("This run, per node")
+            st.dataframe(node_summary, use_container_width=True)
+            st.caption("All runs, per use case")
+            st.dataframe(self.telemetry_store.usecase_summary(), use_container_width=True)
+
+    def _display_profile(self) -> None:
+        if not self.profile:
+            return
+
+        timeline = self.profile.timeline()
+        if not timeline:
+            return
+
+        with st.expander(label="Node timeline", expanded=False):
+            st.vega_lite_chart(
+                {
+                    'data': {'values': timeline},
+                    'mark': {'type': 'bar', 'tooltip': True},
+                    'encoding': {
+                        'y': {'field': 'node', 'type': 'nominal', 'sort': None, 'title': None},
+                        'x': {'field': 'start_seconds', 'type': 'quantitative', 'title': 'Seconds since run start'},
+                        'x2': {'field': 'end_seconds'},
+                        'color': {'field': 'thread', 'type': 'nominal'}
+                    }
+                },
+                use_container_width=True
+            )
+            st.dataframe(timeline, use_container_width=True)
+            if self.profile_path:
+                with open(self.profile_path, mode="r", encoding="utf-8") as f:
+                    st.download_button(
+                        label="Download Chrome trace",
+                        data=f.read(),
+                        file_name=f"trace_{self.profile.run_id}.json",
+                        mime="application/json",
+                        key=f"download_trace_{self.profile.run_id}"
+                    )
+                st.caption(f"Saved to {self.profile_path}. Open it in ui.perfetto.dev or chrome://tracing.")
+
+    def _display_digest(self, response: Dict[str, Any]) -> None:
+        # Long videos come with their digest, which serves instant summaries of any length
+        digest = response.get('transcript_digest')
+        if not digest:
+            return
+
+        with st.expander(label="Video digest", expanded=False):
+            short_tab, medium_tab, long_tab = st.tabs(["Short", "Medium", "Long"])
+            with short_tab:
+                st.markdown(digest.view("short"))
+            with medium_tab:
+                st.markdown(digest.view("medium"))
+            with long_tab:
+                st.markdown(digest.view("long"))
+
     def handle_yt_blog_generation(self):
         self._display_chat_history()
 
@@ -33,11 +341,8 @@ class DisplayResultStreamlit:
 
         try:
             with st.spinner("Generating blog..."):
-                response = self.graph.invoke(
-                    input= {
-                        'youtube_url': self.youtube_url,
-                    }
-                )
+                # The content node streams in two-call mode, the whole blog in single-call mode
+                response = self._run_graph(streamed_nodes=["generate_blog_content_node", "generate_blog_node"])
                 
             if 'final_blog' in response:
                 ai_response = response['final_blog']
@@ -52,6 +357,9 @@ class DisplayResultStreamlit:
                     file_name="youtube_blog.md",
                     mime="text/markdown"
                 )
+                self._display_telemetry()
+                self._display_profile()
+                self._display_digest(response)
             else:
                 st.error("No blog content was generated.")
 
@@ -67,11 +375,7 @@ class DisplayResultStreamlit:
 
         try:
             with st.spinner("Generating summary of the video..."):
-                response = self.graph.invoke(
-                    input= {
-                        'youtube_url': self.youtube_url,
-                    }
-                )
+                response = self._run_graph(streamed_nodes=["youtube_summarizer_node"])
                 
             if 'video_summary' in response:
                 ai_response = response['video_summary']
@@ -86,6 +390,9 @@ class DisplayResultStreamlit:
                     file_name="Video_Summary.md",
                     mime="text/markdown"
                 )
+                self._display_telemetry()
+                self._display_profile()
+                self._display_digest(response)
             else:
                 st.error("No summary was generated.")
 
@@ -101,11 +408,7 @@ class DisplayResultStreamlit:
 
         try:
             with st.spinner("Generating notes of the video..."):
-                response = self.graph.invoke(
-                    input= {
-                        'youtube_url': self.youtube_url,
-                    }
-                )
+                response = self._run_graph(streamed_nodes=["youtube_notes_node"])
                 
             if 'video_notes' in response:
                 ai_response = response['video_notes']
@@ -120,6 +423,9 @@ class DisplayResultStreamlit:
                     file_name="Video_notes.md",
                     mime="text/markdown"
                 )
+                self._display_telemetry()
+                self._display_profile()
+                self._display_digest(response)
             else:
                 st.error("No notes was generated.")
 
@@ -127,11 +433,60 @@ class DisplayResultStreamlit:
             st.error(f"Error processing response: {str(e)}")
             st.code(traceback.format_exc(), language="python")
         
+    def handle_yt_all_artifacts(self):
+        self._display_chat_history()
+
+        st.session_state.message_history.append({"role": "user", "message": self.youtube_url})
+        self._display_message("user", self.youtube_url)
+
+        artifacts = [
+            ('final_blog', "Blog", "youtube_blog.md"),
+            ('video_summary', "Video Summary", "Video_Summary.md"),
+            ('video_notes', "Notes", "Video_notes.md")
+        ]
+
+        try:
+            # Branches run in parallel, so only the finished artifacts are rendered
+            with st.spinner("Generating blog, summary and notes of the video..."):
+                response = self._run_graph(streamed_nodes=[])
+
+            generated = False
+            for key, label, file_name in artifacts:
+                if not response.get(key):
+                    continue
+
+                generated = True
+                ai_response = response[key]
+                st.session_state.message_history.append({"role": "assistant", "message": ai_response})
+                self._display_message("assistant", ai_response)
+                st.download_button(
+                    label=f"Download {label} as Markdown",
+                    data=ai_response,
+                    file_name=file_name,
+                    mime="text/markdown",
+                    key=f"download_{key}"
+                )
+
+            for node, error in (response.get('artifact_errors') or {}).items():
+                st.warning(f"{node} failed: {error}")
+
+            if generated:
+                self._display_telemetry()
+                self._display_profile()
+                self._display_digest(response)
+            else:
+                st.error("No artifacts were generated.")
+
+        except Exception as e:
+            st.error(f"Error processing response: {str(e)}")
+            st.code(traceback.format_exc(), language="python")
+
     def display_result_on_ui(self):
         usecase_options = {
             "YouTube Video Blog Generation": self.handle_yt_blog_generation,
             "YouTube Video Summarization": self.handle_yt_summarization,
             "YouTube Video Notes": self.handle_yt_notes_generation,
+            "YouTube Video All Artifacts": self.handle_yt_all_artifacts,
         }
 
         handler = usecase_options.get(self.usecase)
@@ -67,6 +67,13 @@ class StreamlitUILoader:
             "https://console.anthropic.com/settings/keys"
         )
     
+    def _setup_replay_configuration(self) -> None:
+        """Set up the offline Replay LLM configuration in the sidebar."""
+        replay_model_options = self.config.get_replay_model_options()
+        self.user_input['selected_replay_model'] = st.selectbox(label="Select Replay Mode", options=replay_model_options)
+
+        st.info("Replay answers offline from recorded or synthetic responses, for benchmarks and load tests.")
+    
     def load_streamlit_ui(self) -> dict:
         page_title = self.config.get_page_title()
         st.set_page_config(page_title="🤖 " + page_title, layout="wide")
@@ -82,6 +89,8 @@ class StreamlitUILoader:
                 self._setup_openai_configuration()
             elif self.user_input['selected_llm'] == "Anthropic":
                 self._setup_anthropic_configuration()
+            elif self.user_input['selected_llm'] == "Replay":
+                self._setup_replay_configuration()
             
             usecase_options = self.config.get_usecase_options()
             self.user_input['selected_usecase'] = st.selectbox(label="Select Usecase",options=usecase_options)
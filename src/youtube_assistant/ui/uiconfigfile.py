@@ -1,7 +1,9 @@
 from configparser import ConfigParser, ParsingError
 
+CONFIG_FILE_PATH = "./src/youtube_assistant/ui/uiconfigfile.ini"
+
 class Config:
-    def __init__(self, config_file_path="./src/youtube_assistant/ui/uiconfigfile.ini"):
+    def __init__(self, config_file_path=CONFIG_FILE_PATH):
         self.config = ConfigParser()
         
         try:
@@ -20,6 +22,10 @@ class Config:
         if "DEFAULT" not in self.config:
             raise ValueError("Missing 'DEFAULT' section in uiconfigfile.ini file")
     
+    def _get_section(self, name):
+        # Optional sections fall back to DEFAULT so older config files keep working
+        return self.config[name] if name in self.config else self.config['DEFAULT']
+
     def get_llm_options(self):
         value = self.config['LLM_PROVIDERS'].get("PROVIDERS", "")
         return [llm.strip() for llm in value.split(",")] if value else []
@@ -36,12 +42,216 @@ class Config:
         value = self.config['ANTHROPIC'].get('MODEL_OPTIONS', '')
         return [model.strip() for model in value.split(',')] if value else []
 
+    def get_replay_model_options(self):
+        value = self._get_section('REPLAY').get('MODEL_OPTIONS', 'synthetic, replay')
+        return [model.strip() for model in value.split(',')] if value else []
+
     def get_page_title(self):
         return self.config['DEFAULT'].get('PAGE_TITLE', 'YouTube Assistant')
     
     def get_usecase_options(self):
         value = self.config['DEFAULT'].get('USECASE_OPTIONS', '')
         return [usecase.strip() for usecase in value.split(',')] if value else []
+
+    def get_transcript_cache_settings(self):
+        section = self._get_section('TRANSCRIPT_CACHE')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True),
+            'db_path': section.get('DB_PATH', '.cache/transcripts.sqlite3'),
+            'ttl_seconds': section.getint('TTL_SECONDS', fallback=86400),
+            'max_size_mb': section.getint('MAX_SIZE_MB', fallback=256),
+            'language_ttl_seconds': section.getint('LANGUAGE_TTL_SECONDS', fallback=604800),
+            'negative_ttls': {
+                'NoTranscriptFound': section.getint('NEGATIVE_TTL_NO_TRANSCRIPT_FOUND', fallback=3600),
+                'TranscriptsDisabled': section.getint('NEGATIVE_TTL_TRANSCRIPTS_DISABLED', fallback=21600),
+                'VideoUnavailable': section.getint('NEGATIVE_TTL_VIDEO_UNAVAILABLE', fallback=900)
+            }
+        }
+
+    def get_transcript_source_settings(self):
+        section = self._get_section('TRANSCRIPT_SOURCE')
+        return {
+            'source': section.get('SOURCE', 'youtube').strip().lower(),
+            'local_directory': section.get('LOCAL_DIRECTORY', 'captions')
+        }
+
+    def get_transcript_http_settings(self):
+        section = self._get_section('TRANSCRIPT_HTTP')
+        proxies = section.get('PROXIES', '')
+        return {
+            'pool_size': section.getint('POOL_SIZE', fallback=10),
+            'proxies': [proxy.strip() for proxy in proxies.split(',') if proxy.strip()],
+            'proxy_failure_threshold': section.getint('PROXY_FAILURE_THRESHOLD', fallback=3),
+            'proxy_cooldown_seconds': section.getfloat('PROXY_COOLDOWN_SECONDS', fallback=120.0)
+        }
+
+    def get_blog_settings(self):
+        section = self._get_section('BLOG')
+        return {
+            'mode': section.get('MODE', 'parallel').strip().lower()
+        }
+
+    def get_execution_settings(self):
+        section = self._get_section('EXECUTION')
+        return {
+            'async_enabled': section.getboolean('ASYNC', fallback=False)
+        }
+
+    def get_llm_client_settings(self):
+        section = self._get_section('LLM_CLIENTS')
+        return {
+            'max_clients': section.getint('MAX_CLIENTS', fallback=16)
+        }
+
+    def get_llm_cache_settings(self):
+        section = self._get_section('LLM_CACHE')
+        disabled_usecases = section.get('DISABLED_USECASES', '')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True),
+            'db_path': section.get('DB_PATH', '.cache/llm_responses.sqlite3'),
+            'memory_max_entries': section.getint('MEMORY_MAX_ENTRIES', fallback=256),
+            'ttl_seconds': section.getint('TTL_SECONDS', fallback=604800),
+            'max_size_mb': section.getint('MAX_SIZE_MB', fallback=256),
+            'disabled_usecases': [usecase.strip() for usecase in disabled_usecases.split(',') if usecase.strip()]
+        }
+
+    def get_map_reduce_settings(self):
+        section = self._get_section('MAP_REDUCE')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True),
+            'token_threshold': section.getint('TOKEN_THRESHOLD', fallback=6000),
+            'chunk_tokens': section.getint('CHUNK_TOKENS', fallback=4000),
+            'overlap_tokens': section.getint('CHUNK_OVERLAP_TOKENS', fallback=200),
+            'max_concurrency': section.getint('MAX_CONCURRENCY', fallback=4)
+        }
+
+    def get_digest_settings(self):
+        section = self._get_section('DIGEST')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True),
+            'db_path': section.get('DB_PATH', '.cache/digests.sqlite3'),
+            'token_threshold': section.getint('TOKEN_THRESHOLD', fallback=6000),
+            'chunks_per_section': section.getint('CHUNKS_PER_SECTION', fallback=4),
+            'ttl_seconds': section.getint('TTL_SECONDS', fallback=2592000),
+            'max_size_mb': section.getint('MAX_SIZE_MB', fallback=64)
+        }
+
+    def get_single_flight_settings(self):
+        section = self._get_section('SINGLE_FLIGHT')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True)
+        }
+
+    def get_graph_cache_settings(self):
+        section = self._get_section('GRAPH_CACHE')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True),
+            'max_graphs': section.getint('MAX_GRAPHS', fallback=32)
+        }
+
+    def get_checkpoint_settings(self):
+        section = self._get_section('CHECKPOINT')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=False),
+            'db_path': section.get('DB_PATH', '.cache/checkpoints.sqlite3')
+        }
+
+    def get_profiler_settings(self):
+        section = self._get_section('PROFILER')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=False),
+            'trace_memory': section.getboolean('TRACE_MEMORY', fallback=True),
+            'trace_dir': section.get('TRACE_DIR', '.profiles')
+        }
+
+    def get_streaming_settings(self):
+        section = self._get_section('STREAMING')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True)
+        }
+
+    def get_prompt_cache_settings(self):
+        section = self._get_section('PROMPT_CACHE')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=True)
+        }
+
+    def get_hedging_settings(self):
+        section = self._get_section('HEDGING')
+        fallbacks = []
+        for fallback in section.get('FALLBACKS', '').split(','):
+            provider, _, model = fallback.partition(':')
+            if provider.strip() and model.strip():
+                fallbacks.append((provider.strip(), model.strip()))
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=False),
+            'hedge_after_seconds': section.getfloat('HEDGE_AFTER_SECONDS', fallback=10.0),
+            'fallbacks': fallbacks
+        }
+
+    def get_telemetry_settings(self):
+        section = self._get_section('TELEMETRY')
+        return {
+            'enabled': section.getboolean('ENABLED', fallback=False),
+            'jsonl_path': section.get('JSONL_PATH', '.telemetry/llm_calls.jsonl')
+        }
+
+    def get_llm_price(self, model):
+        # USD per million input, output and optionally cached input and cache write tokens,
+        # e.g. "gpt-4o-mini-2024-07-18 = 0.15, 0.60, 0.075"
+        if 'LLM_PRICING' not in self.config:
+            return None
+        value = self.config['LLM_PRICING'].get(model.strip().lower(), '')
+        try:
+            prices = [float(price) for price in value.split(',')]
+        except ValueError:
+            return None
+        if len(prices) == 2:
+            # Cached input tokens are billed like uncached ones unless priced
+            prices.append(prices[0])
+        if len(prices) == 3:
+            # So are input tokens written to the prompt cache
+            prices.append(prices[0])
+        return tuple(prices) if len(prices) == 4 else None
+
+    def get_replay_settings(self):
+        section = self._get_section('REPLAY')
+        return {
+            'recordings_path': section.get('RECORDINGS_PATH', '.cache/llm_recordings.jsonl'),
+            'record': section.getboolean('RECORD', fallback=False),
+            'seed': section.getint('SEED', fallback=0),
+            'ttft_seconds': section.getfloat('TTFT_SECONDS', fallback=0.5),
+            'ttft_jitter_seconds': section.getfloat('TTFT_JITTER_SECONDS', fallback=0.1),
+            'tokens_per_second': section.getfloat('TOKENS_PER_SECOND', fallback=80.0),
+            'tokens_per_second_jitter': section.getfloat('TOKENS_PER_SECOND_JITTER', fallback=10.0),
+            'output_tokens': section.getint('OUTPUT_TOKENS', fallback=800),
+            'output_tokens_jitter': section.getint('OUTPUT_TOKENS_JITTER', fallback=200)
+        }
+
+    def get_rate_limit_settings(self, provider):
+        section = self._get_section('RATE_LIMITS')
+        prefix = provider.strip().upper()
+        return {
+            'requests_per_minute': section.getfloat(f'{prefix}_RPM', fallback=0),
+            'tokens_per_minute': section.getfloat(f'{prefix}_TPM', fallback=0)
+        }
+
+    def get_admission_settings(self, provider):
+        section = self._get_section('ADMISSION')
+        prefix = provider.strip().upper()
+        return {
+            'max_concurrency': section.getint(f'{prefix}_MAX_CONCURRENCY', fallback=0),
+            'max_queue_wait_seconds': section.getfloat('MAX_QUEUE_WAIT_SECONDS', fallback=60.0),
+            'expected_call_seconds': section.getfloat('EXPECTED_CALL_SECONDS', fallback=10.0)
+        }
+
+    def get_retry_settings(self):
+        section = self._get_section('RATE_LIMITS')
+        return {
+            'max_attempts': section.getint('RETRY_MAX_ATTEMPTS', fallback=5),
+            'base_delay': section.getfloat('RETRY_BASE_DELAY_SECONDS', fallback=1.0),
+            'max_delay': section.getfloat('RETRY_MAX_DELAY_SECONDS', fallback=30.0)
+        }
     
 if __name__ == "__main__":
     config = Config()
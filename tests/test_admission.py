@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.youtube_assistant.runtime.admission import AdmissionController, AdmissionRejected
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_concurrent_slot_callers_are_served_in_arrival_order():
+    controller = AdmissionController("Test", max_concurrency=1, max_queue_wait_seconds=30, expected_call_seconds=0.1)
+    release_holder = threading.Event()
+    served = []
+    lock = threading.Lock()
+
+    def hold():
+        with controller.slot():
+            release_holder.wait(timeout=5)
+
+    def call(index):
+        with controller.slot():
+            with lock:
+                served.append(index)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    _wait_for(lambda: controller.stats()["in_use"] == 1)
+
+    callers = []
+    for index in range(8):
+        caller = threading.Thread(target=call, args=(index,))
+        caller.start()
+        callers.append(caller)
+        # Each caller joins the queue before the next one arrives
+        _wait_for(lambda: controller.stats()["queue_length"] == index + 1)
+
+    release_holder.set()
+    for thread in [holder, *callers]:
+        thread.join(timeout=5)
+
+    assert served == list(range(8))
+    stats = controller.stats()
+    assert stats["in_use"] == 0
+    assert stats["queue_length"] == 0
+    assert stats["queued"] == 8
+
+
+def test_caller_is_rejected_when_the_estimated_wait_exceeds_the_deadline():
+    controller = AdmissionController("Test", max_concurrency=1, max_queue_wait_seconds=5, expected_call_seconds=10)
+
+    with controller.slot():
+        with pytest.raises(AdmissionRejected):
+            with controller.slot():
+                pass
+
+    assert controller.stats()["rejected"] == 1
+    assert controller.stats()["in_use"] == 0
+
+
+def test_queued_caller_gives_up_at_the_deadline():
+    controller = AdmissionController("Test", max_concurrency=1, max_queue_wait_seconds=0.2, expected_call_seconds=0.1)
+
+    with controller.slot():
+        started = time.monotonic()
+        with pytest.raises(AdmissionRejected):
+            with controller.slot():
+                pass
+        assert time.monotonic() - started >= 0.2
+
+    stats = controller.stats()
+    assert stats["queue_length"] == 0
+    assert stats["in_use"] == 0
+
+
+def test_cancelled_aslot_waiter_does_not_strand_a_slot():
+    controller = AdmissionController("Test", max_concurrency=1, max_queue_wait_seconds=30, expected_call_seconds=0.1)
+
+    async def waiter(entered):
+        async with controller.aslot():
+            entered.append(True)
+
+    async def scenario():
+        # Cancelled while still queued
+        holder = controller.slot()
+        holder.__enter__()
+        entered = []
+        task = asyncio.ensure_future(waiter(entered))
+        await asyncio.sleep(0.05)
+        assert controller.stats()["queue_length"] == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        holder.__exit__(None, None, None)
+        assert controller.stats()["in_use"] == 0
+
+        # Cancelled after the slot was handed over, before the waiter woke up
+        holder = controller.slot()
+        holder.__enter__()
+        task = asyncio.ensure_future(waiter(entered))
+        await asyncio.sleep(0.05)
+        holder.__exit__(None, None, None)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert entered == []
+        assert controller.stats()["in_use"] == 0
+
+        # The slot is free for the next caller
+        async with controller.aslot():
+            assert controller.stats()["in_use"] == 1
+
+    asyncio.run(scenario())
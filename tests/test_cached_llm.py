@@ -0,0 +1,25 @@
+import tempfile
+from langchain_core.messages import HumanMessage
+from langchain_groq import ChatGroq
+from src.youtube_assistant.llm.cached_llm import CachedChatModel
+from src.youtube_assistant.llm.response_cache import LLMResponseCache
+
+
+def _cached_groq(response_cache, model, temperature):
+    inner = ChatGroq(api_key="test-key", model=model, temperature=temperature, max_tokens=10_000)
+    return CachedChatModel(inner=inner, response_cache=response_cache, provider="Groq")
+
+
+def test_groq_models_get_different_cache_keys():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        response_cache = LLMResponseCache(db_path=f"{cache_dir}/responses.sqlite3")
+        messages = [HumanMessage(content="Summarize the video.")]
+
+        small = _cached_groq(response_cache, "llama3-8b-8192", 0.7)
+        large = _cached_groq(response_cache, "llama3-70b-8192", 0.7)
+        colder = _cached_groq(response_cache, "llama3-8b-8192", 0.2)
+
+        keys = {model._cache_key(messages, None, {}) for model in (small, large, colder)}
+        assert len(keys) == 3
+        assert small._cache_key(messages, None, {}) == _cached_groq(response_cache, "llama3-8b-8192", 0.7)._cache_key(
+            messages, None, {})
@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+import pytest
+from src.youtube_assistant.transcript import TranscriptSegments, caption_parsers
+from src.youtube_assistant.transcript.caption_parsers import (
+    iter_json_segments,
+    iter_srt_segments,
+    iter_vtt_segments
+)
+
+
+VTT = """WEBVTT
+Kind: captions
+Language: en
+
+NOTE This note spans
+two lines --> and has an arrow
+
+STYLE
+::cue { color: yellow }
+
+1
+00:00:00.000 --> 00:00:02.500 align:start position:0%
+<c.colorE5E5E5>Hello</c><00:00:01.000> <c>café</c>
+
+00:00:02.500 --> 00:00:02.500
+
+00:01:02.500 --> 00:01:05.000
+Tom &amp; Jerry
+日本語 &lt;3
+
+1:00:00.000 --> 1:00:01.25
+last cue
+"""
+
+VTT_SEGMENTS = [
+    {'text': "Hello café", 'start': 0.0, 'duration': 2.5},
+    {'text': "Tom & Jerry 日本語 <3", 'start': 62.5, 'duration': 2.5},
+    {'text': "last cue", 'start': 3600.0, 'duration': 1.25}
+]
+
+SRT = """1
+00:00:01,000 --> 00:00:03,000
+<i>Hello</i>
+world
+
+2
+00:00:03,000 --> 00:00:02,000
+reversed timing
+
+3
+00:00:04,000 --> 00:00:05,000
+
+4
+00:00:05,000 --> 00:00:06,500
+naïve — ok"""
+
+SRT_SEGMENTS = [
+    {'text': "Hello world", 'start': 1.0, 'duration': 2.0},
+    {'text': "reversed timing", 'start': 3.0, 'duration': 0.0},
+    {'text': "naïve — ok", 'start': 5.0, 'duration': 1.5}
+]
+
+JSON_SEGMENTS = [
+    {'text': "first", 'start': 0.0, 'duration': 1.5},
+    {'text': "", 'start': 1.5, 'duration': 0.5},
+    {'text': "ünïcödé 🎉 [Music]", 'start': 2.0, 'duration': 2.0},
+    {'text': "x" * 100, 'start': 4, 'duration': 1}
+]
+
+
+def _write(directory, name, content, encoding="utf-8", newline=None):
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding=encoding, newline=newline) as f:
+        f.write(content)
+    return path
+
+
+def test_vtt_skips_headers_notes_styles_and_empty_cues():
+    with tempfile.TemporaryDirectory() as tmp:
+        assert list(iter_vtt_segments(_write(tmp, "a.vtt", VTT))) == VTT_SEGMENTS
+
+
+def test_srt_strips_tags_and_joins_lines():
+    with tempfile.TemporaryDirectory() as tmp:
+        assert list(iter_srt_segments(_write(tmp, "a.srt", SRT))) == SRT_SEGMENTS
+
+
+@pytest.mark.parametrize("parse, content, expected", [
+    (iter_vtt_segments, VTT, VTT_SEGMENTS),
+    (iter_srt_segments, SRT, SRT_SEGMENTS)
+])
+def test_crlf_and_byte_order_mark_give_the_same_segments(parse, content, expected):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "a.txt", content, encoding="utf-8-sig", newline="\r\n")
+        assert list(parse(path)) == expected
+
+
+@pytest.mark.parametrize("parse, content", [(iter_vtt_segments, VTT), (iter_srt_segments, SRT)])
+def test_mapped_cues_match_cues_of_the_whole_text(parse, content):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "a.txt", content)
+        with open(path, encoding="utf-8") as f:
+            expected = list(caption_parsers._iter_cues(iter(f.read().splitlines())))
+        assert list(parse(path)) == expected
+
+
+def test_json_matches_json_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "a.json", json.dumps(JSON_SEGMENTS, ensure_ascii=False, indent=2))
+
+        with open(path, encoding="utf-8") as f:
+            expected = [{'text': segment['text'], 'start': float(segment['start']),
+                         'duration': float(segment['duration'])}
+                        for segment in json.load(f)]
+        assert list(iter_json_segments(path)) == expected
+
+
+def test_json_objects_and_characters_split_across_reads(monkeypatch):
+    # Tiny reads split objects and multi-byte characters between chunks
+    monkeypatch.setattr(caption_parsers, "_JSON_READ_SIZE", 3)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "a.json", json.dumps(JSON_SEGMENTS, ensure_ascii=False), encoding="utf-8-sig")
+
+        segments = list(iter_json_segments(path))
+        assert [segment['text'] for segment in segments] == [segment['text'] for segment in JSON_SEGMENTS]
+        assert segments[3]['start'] == 4.0
+
+
+@pytest.mark.parametrize("content", ['{"text": "not an array"}', '[1, 2]', '[{"text": "a"}', '[{"text": }]'])
+def test_invalid_json_raises_value_error(content):
+    with tempfile.TemporaryDirectory() as tmp:
+        with pytest.raises(ValueError):
+            list(iter_json_segments(_write(tmp, "a.json", content)))
+
+
+@pytest.mark.parametrize("parse", [iter_vtt_segments, iter_srt_segments, iter_json_segments])
+def test_empty_files_have_no_segments(parse):
+    with tempfile.TemporaryDirectory() as tmp:
+        assert list(parse(_write(tmp, "empty", ""))) == []
+
+
+def test_parsed_segments_feed_the_segment_store():
+    with tempfile.TemporaryDirectory() as tmp:
+        segments = TranscriptSegments.from_raw_segments(iter_vtt_segments(_write(tmp, "a.vtt", VTT)))
+
+        assert segments.text == "Hello café Tom Jerry 日本語 3 last cue"
+        assert segments.text_at_time(63.0) == "Tom Jerry 日本語 3"
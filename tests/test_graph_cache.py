@@ -0,0 +1,152 @@
+import os
+import tempfile
+import threading
+import pytest
+from src.youtube_assistant.graph import graph_cache
+from src.youtube_assistant.graph.graph_cache import CompiledGraphCache
+
+
+class _FakeGraphBuilder:
+    """Counts builds and blocks each one until released; state lives on per-test subclasses."""
+
+    def __init__(self, user_input):
+        self.user_input = user_input
+
+    def setup_graph(self):
+        cls = type(self)
+        with cls.lock:
+            cls.builds += 1
+            fail = cls.fail_next
+            cls.fail_next = False
+        cls.started.set()
+        cls.release.wait(timeout=5)
+        if fail:
+            raise RuntimeError("build failed")
+        return object()
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    class Builder(_FakeGraphBuilder):
+        builds = 0
+        started = threading.Event()
+        release = threading.Event()
+        fail_next = False
+        lock = threading.Lock()
+
+    monkeypatch.setattr(graph_cache, "GraphBuilder", Builder)
+    return Builder
+
+
+def _user_input(usecase="Blog Generation"):
+    return {'selected_usecase': usecase, 'selected_llm': "Groq", 'selected_groq_model': "model",
+            'GROQ_API_KEY': "key"}
+
+
+def _config_file(directory):
+    path = os.path.join(directory, "uiconfigfile.ini")
+    with open(path, "w") as f:
+        f.write("[DEFAULT]\n")
+    return path
+
+
+def _run_concurrently(cache, count, user_input):
+    graphs = [None] * count
+
+    def get(index):
+        graphs[index] = cache.get_or_build(user_input)
+
+    threads = [threading.Thread(target=get, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, graphs
+
+
+def test_two_threads_build_a_graph_once(builder):
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompiledGraphCache(config_file_path=_config_file(tmp))
+
+        threads, graphs = _run_concurrently(cache, 2, _user_input())
+        builder.started.wait(timeout=5)
+        builder.release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert builder.builds == 1
+        assert graphs[0] is not None
+        assert graphs[0] is graphs[1]
+        assert cache.get_or_build(_user_input()) is graphs[0]
+        assert cache.stats() == {'graphs': 1, 'hits': 2, 'misses': 1, 'invalidations': 0}
+
+
+def test_different_settings_get_different_graphs(builder):
+    builder.release.set()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompiledGraphCache(config_file_path=_config_file(tmp))
+
+        blog = cache.get_or_build(_user_input("Blog Generation"))
+        notes = cache.get_or_build(_user_input("Notes"))
+
+        assert blog is not notes
+        assert builder.builds == 2
+
+
+def test_config_change_invalidates_cached_graphs(builder):
+    builder.release.set()
+    with tempfile.TemporaryDirectory() as tmp:
+        config_file_path = _config_file(tmp)
+        cache = CompiledGraphCache(config_file_path=config_file_path)
+
+        first = cache.get_or_build(_user_input())
+        assert cache.get_or_build(_user_input()) is first
+
+        stat = os.stat(config_file_path)
+        os.utime(config_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cache.get_or_build(_user_input())
+        assert second is not first
+        assert builder.builds == 2
+        assert cache.stats()['invalidations'] == 1
+        assert cache.get_or_build(_user_input()) is second
+
+
+def test_waiter_builds_when_the_leader_build_fails(builder):
+    builder.fail_next = True
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompiledGraphCache(config_file_path=_config_file(tmp))
+        errors = []
+
+        def leader():
+            try:
+                cache.get_or_build(_user_input())
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader_thread = threading.Thread(target=leader)
+        leader_thread.start()
+        builder.started.wait(timeout=5)
+
+        threads, graphs = _run_concurrently(cache, 1, _user_input())
+        builder.release.set()
+        for thread in [leader_thread, *threads]:
+            thread.join(timeout=5)
+
+        assert len(errors) == 1
+        assert graphs[0] is not None
+        assert builder.builds == 2
+        assert cache.stats()['graphs'] == 1
+
+
+def test_least_recently_used_graph_is_evicted(builder):
+    builder.release.set()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompiledGraphCache(max_graphs=2, config_file_path=_config_file(tmp))
+
+        blog = cache.get_or_build(_user_input("Blog Generation"))
+        cache.get_or_build(_user_input("Notes"))
+        assert cache.get_or_build(_user_input("Blog Generation")) is blog
+        cache.get_or_build(_user_input("Digest"))
+
+        assert cache.stats()['graphs'] == 2
+        assert cache.get_or_build(_user_input("Blog Generation")) is blog
+        assert builder.builds == 3
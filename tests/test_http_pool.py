@@ -0,0 +1,65 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.youtube_assistant.transcript.http_pool import PooledHttpClient
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        time.sleep(0.02)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.client_ports = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_concurrent_requests_never_share_a_session():
+    server = _start_stub_server()
+    client = PooledHttpClient(pool_size=4)
+    url = f"http://127.0.0.1:{server.server_port}/"
+    in_use = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def fetch(_):
+        with client.checkout() as (proxy, session):
+            with lock:
+                overlaps.append(id(session) in in_use)
+                in_use.add(id(session))
+            try:
+                response = session.get(url, timeout=5)
+                client.report_success(proxy)
+                return response.text
+            finally:
+                with lock:
+                    in_use.discard(id(session))
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(fetch, range(64)))
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert results == ["ok"] * 64
+    assert not any(overlaps)
+    # The sessions share the route's connection pool, so connections are reused
+    assert len(server.client_ports) <= 4
+    assert client.stats()["direct"]["successes"] == 64
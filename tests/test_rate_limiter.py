@@ -0,0 +1,151 @@
+import pytest
+from src.youtube_assistant.runtime import rate_limiter
+from src.youtube_assistant.runtime.rate_limiter import ProviderRateLimiter, RetryPolicy, TokenBucket
+
+
+class _FakeClock:
+    """Stands in for the time module, so waits are recorded instead of slept."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+class IpBlocked(Exception):
+    pass
+
+
+class _ProxyIpBlocked(IpBlocked):
+    pass
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _ResponseError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = _Response(status_code)
+
+
+def test_bucket_serves_its_capacity_then_makes_callers_wait(clock):
+    bucket = TokenBucket(per_minute=60)
+
+    assert [bucket.reserve(1) for _ in range(60)] == [0.0] * 60
+    # Each reservation in debt waits one more refill interval
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    assert bucket.reserve(1) == pytest.approx(2.0)
+
+
+def test_bucket_refills_over_time_up_to_its_capacity(clock):
+    bucket = TokenBucket(per_minute=60)
+    bucket.reserve(60)
+
+    clock.now += 30
+    assert bucket.reserve(30) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+    clock.now += 3600
+    bucket.reserve(0)
+    assert bucket.tokens == bucket.capacity
+
+
+def test_request_larger_than_the_bucket_waits_for_a_full_bucket(clock):
+    bucket = TokenBucket(per_minute=600)
+    bucket.reserve(600)
+
+    assert bucket.reserve(6000) == pytest.approx(60.0)
+
+
+def test_reconcile_returns_overestimated_tokens(clock):
+    limiter = ProviderRateLimiter("Test", tokens_per_minute=1000)
+
+    assert limiter.acquire(tokens=1000) == 0.0
+    limiter.reconcile(estimated_tokens=1000, actual_tokens=400)
+    assert limiter.acquire(tokens=600) == 0.0
+    assert limiter.acquire(tokens=60) == pytest.approx(3.6)
+    assert clock.sleeps == [pytest.approx(3.6)]
+
+
+def test_unlimited_budgets_never_wait(clock):
+    limiter = ProviderRateLimiter("Test")
+
+    assert [limiter.acquire(tokens=10_000) for _ in range(100)] == [0.0] * 100
+    assert clock.sleeps == []
+
+
+def test_retry_classification():
+    assert RetryPolicy.is_retryable(_ProxyIpBlocked("blocked"))
+    assert RetryPolicy.is_retryable(_StatusError(429))
+    assert RetryPolicy.is_retryable(_ResponseError(503))
+    assert RetryPolicy.is_retryable(TimeoutError("timed out"))
+
+    assert not RetryPolicy.is_retryable(_StatusError(400))
+    assert not RetryPolicy.is_retryable(_ResponseError(404))
+    assert not RetryPolicy.is_retryable(ValueError("bad input"))
+
+
+def test_call_retries_transient_errors_with_bounded_backoff(clock):
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=1.5)
+    attempts = []
+
+    def flaky():
+        attempts.append(len(attempts))
+        if len(attempts) < 4:
+            raise _StatusError(429)
+        return "ok"
+
+    assert policy.call(flaky) == "ok"
+    assert len(attempts) == 4
+    assert len(clock.sleeps) == 3
+    assert all(0 <= delay <= 1.5 for delay in clock.sleeps)
+
+
+def test_call_raises_non_retryable_errors_immediately(clock):
+    policy = RetryPolicy(max_attempts=5)
+    attempts = []
+
+    def invalid():
+        attempts.append(1)
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError):
+        policy.call(invalid)
+    assert attempts == [1]
+    assert clock.sleeps == []
+
+
+def test_call_gives_up_after_max_attempts(clock):
+    policy = RetryPolicy(max_attempts=3)
+    attempts = []
+
+    def blocked():
+        attempts.append(1)
+        raise _ProxyIpBlocked("blocked")
+
+    with pytest.raises(IpBlocked):
+        policy.call(blocked)
+    assert len(attempts) == 3
+    assert len(clock.sleeps) == 2
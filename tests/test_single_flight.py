@@ -0,0 +1,113 @@
+import threading
+import pytest
+from src.youtube_assistant.runtime.single_flight import SingleFlight
+
+
+def _gated_producer(gate, started, items, error=None):
+    def producer():
+        started.set()
+        gate.wait(timeout=5)
+        yield from items
+        if error is not None:
+            raise error
+    return producer
+
+
+def _consume(iterator, results, index):
+    received = []
+    try:
+        for item in iterator:
+            received.append(item)
+    except Exception as e:
+        results[index] = (received, e)
+    else:
+        results[index] = (received, None)
+
+
+def test_leader_and_followers_receive_every_item():
+    group = SingleFlight()
+    gate, started = threading.Event(), threading.Event()
+
+    leader = group.stream("key", _gated_producer(gate, started, [1, 2, 3]))
+    started.wait(timeout=5)
+    followers = [group.stream("key", lambda: pytest.fail("a follower started a computation")) for _ in range(3)]
+
+    results = {}
+    threads = [threading.Thread(target=_consume, args=(iterator, results, index))
+               for index, iterator in enumerate([leader, *followers])]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {index: ([1, 2, 3], None) for index in range(4)}
+    assert group.stats() == {'in_flight': 0, 'started': 1, 'coalesced': 3}
+
+
+def test_followers_receive_the_leader_exception():
+    group = SingleFlight()
+    gate, started = threading.Event(), threading.Event()
+    error = ValueError("upstream failed")
+
+    leader = group.stream("key", _gated_producer(gate, started, ["partial"], error))
+    started.wait(timeout=5)
+    follower = group.stream("key", lambda: [])
+
+    results = {}
+    threads = [threading.Thread(target=_consume, args=(iterator, results, index))
+               for index, iterator in enumerate([leader, follower])]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results[0] == (["partial"], error)
+    assert results[1] == (["partial"], error)
+
+
+def test_follower_attaching_late_still_sees_earlier_items():
+    group = SingleFlight()
+    first_produced, gate = threading.Event(), threading.Event()
+
+    def producer():
+        yield "a"
+        first_produced.set()
+        gate.wait(timeout=5)
+        yield "b"
+
+    leader = group.stream("key", producer)
+    first_produced.wait(timeout=5)
+    follower = group.stream("key", lambda: [])
+    gate.set()
+
+    assert list(leader) == ["a", "b"]
+    assert list(follower) == ["a", "b"]
+
+
+def test_key_is_free_again_after_completion():
+    group = SingleFlight()
+
+    assert group.run("key", lambda: 1) == 1
+    assert group.run("key", lambda: 2) == 2
+
+    with pytest.raises(KeyError):
+        group.run("key", lambda: {}["missing"])
+    assert group.run("key", lambda: 3) == 3
+
+    assert group.stats() == {'in_flight': 0, 'started': 4, 'coalesced': 0}
+
+
+def test_different_keys_do_not_coalesce():
+    group = SingleFlight()
+    gate, started = threading.Event(), threading.Event()
+
+    first = group.stream("first", _gated_producer(gate, started, [1]))
+    started.wait(timeout=5)
+    second = group.stream("second", lambda: [2])
+    gate.set()
+
+    assert list(first) == [1]
+    assert list(second) == [2]
+    assert group.stats()['started'] == 2
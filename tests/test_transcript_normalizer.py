@@ -0,0 +1,59 @@
+import re
+import pytest
+from src.youtube_assistant.transcript import normalize_segments, normalize_text
+from src.youtube_assistant.transcript.normalizer import strip_special_characters
+
+
+def _baseline_clean(segments):
+    # The transcript node's cleaner before the translate-based normalizer
+    text = "\n".join(subtitle.get('text', '').strip()
+                     for subtitle in segments
+                     if subtitle.get('text'))
+    if not text:
+        return ""
+
+    text = re.sub(r'\n\s*\n', '\n', text)
+    text = re.sub(r'[^\w\s.,!?-]', '', text)
+    return ' '.join(text.split())
+
+
+def _segments(*texts):
+    return [{'text': text, 'start': float(index), 'duration': 1.0} for index, text in enumerate(texts)]
+
+
+CASES = {
+    "tags": _segments("<i>hello</i> <b>world</b>", "<c.colorE5E5E5>we're</c> <00:00:01.000>back", "[Music]"),
+    "note blocks": _segments("NOTE this is a comment", "NOTE\nspanning lines", "STYLE ::cue { color: red }"),
+    "empty cues": _segments("", "   ", "\n\n", "text", "\t", "more text") + [{'start': 9.0}, {'text': None}],
+    "multi-byte": _segments("café naïve — über", "日本語のテキスト", "emoji 🎉 here", "é combining",
+                            "Ελληνικά, русский!", " non-breaking space　ideographic"),
+    "punctuation": _segments("100% of $5 e.g. Q&A", "state-of-the-art... ok?!", "quote's \"here\" (laughs) >>"),
+    "control whitespace": _segments("a\x1cb\x1dc\x1ed\x1fe", "tab\there\vvertical\fform", "cr\r\nlf"),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_normalize_segments_matches_the_baseline_cleaner(name):
+    assert normalize_segments(CASES[name]) == _baseline_clean(CASES[name])
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_normalize_text_matches_the_baseline_cleaner(name):
+    text = "\n".join(segment['text'] for segment in CASES[name] if segment.get('text'))
+    assert normalize_text(text) == _baseline_clean([{'text': text}])
+
+
+def test_normalize_text_of_empty_input():
+    assert normalize_text("") == ""
+    assert normalize_text("<>[]{}") == ""
+    assert normalize_segments([]) == ""
+
+
+def test_strip_special_characters_keeps_whitespace():
+    assert strip_special_characters("a <b>\n\tc") == "a b\n\tc"
+    assert strip_special_characters("naïve — ok") == "naïve  ok"
+
+
+def test_lone_surrogates_match_the_baseline_cleaner():
+    text = "broken \ud83c pair"
+    assert normalize_text(text) == _baseline_clean([{'text': text}])
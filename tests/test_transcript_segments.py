@@ -0,0 +1,112 @@
+from array import array
+import pytest
+from src.youtube_assistant.transcript import TranscriptSegments, normalize_segments
+
+
+def _segments(*timed_texts):
+    return [{'text': text, 'start': start, 'duration': duration} for start, duration, text in timed_texts]
+
+
+def _sample():
+    return TranscriptSegments.from_raw_segments(_segments(
+        (0.0, 2.0, ">> Hello there"),
+        (2.0, 1.5, "♪ ♪"),
+        (3.5, 2.5, "café — naïve"),
+        (6.0, 1.0, "   "),
+        (7.0, 3.0, "last  segment!")
+    ))
+
+
+def test_text_matches_normalize_segments():
+    raw = _segments((0.0, 1.0, "a <b>"), (1.0, 1.0, ""), (2.0, 1.0, "日本語 ♪"), (3.0, 1.0, "x\x1ey"))
+    assert TranscriptSegments.from_raw_segments(raw).text == normalize_segments(raw)
+
+
+def test_segments_empty_after_normalization_are_dropped():
+    segments = _sample()
+
+    assert segments.text == "Hello there café naïve last segment!"
+    assert len(segments) == 3
+    assert [segments.segment(index) for index in range(len(segments))] == [
+        (0.0, 2.0, "Hello there"),
+        (3.5, 2.5, "café naïve"),
+        (7.0, 3.0, "last segment!")
+    ]
+
+
+def test_out_of_order_segments_are_sorted_by_start():
+    segments = TranscriptSegments.from_raw_segments(_segments((5.0, 1.0, "second"), (1.0, 1.0, "first")))
+
+    assert segments.text == "first second"
+    assert list(segments.starts) == [1.0, 5.0]
+
+
+def test_empty_input():
+    segments = TranscriptSegments.from_raw_segments([])
+
+    assert segments.text == ""
+    assert len(segments) == 0
+    assert segments.index_at_time(10.0) == -1
+    assert segments.text_at_time(10.0) == ""
+    assert segments.time_at_offset(0) == 0.0
+    assert segments.text_between(0.0, 10.0) == ""
+
+
+def test_asdict_round_trip():
+    segments = _sample()
+    state = segments._asdict()
+
+    assert all(isinstance(state[column], bytes) for column in ("starts", "durations", "offsets"))
+
+    restored = TranscriptSegments(**state)
+    assert restored.text == segments.text
+    assert restored.starts == segments.starts
+    assert restored.durations == segments.durations
+    assert restored.offsets == segments.offsets
+    assert isinstance(restored.offsets, array) and restored.offsets.typecode == 'q'
+    assert TranscriptSegments(**restored._asdict())._asdict() == state
+
+
+@pytest.mark.parametrize("seconds, index, text", [
+    (-1.0, -1, ""),
+    (0.0, 0, "Hello there"),
+    (3.4999, 0, "Hello there"),
+    (3.5, 1, "café naïve"),
+    (6.9999, 1, "café naïve"),
+    (7.0, 2, "last segment!"),
+    (1e9, 2, "last segment!")
+])
+def test_lookup_by_time_at_boundaries(seconds, index, text):
+    segments = _sample()
+
+    assert segments.index_at_time(seconds) == index
+    assert segments.text_at_time(seconds) == text
+
+
+def test_lookup_by_offset_at_boundaries():
+    segments = _sample()
+    second_start = segments.text.index("café")
+    third_start = segments.text.index("last")
+
+    assert segments.index_at_offset(-1) == -1
+    assert segments.index_at_offset(0) == 0
+    # The space joining two segments belongs to the earlier one
+    assert segments.index_at_offset(second_start - 1) == 0
+    assert segments.index_at_offset(second_start) == 1
+    assert segments.index_at_offset(third_start) == 2
+    assert segments.index_at_offset(len(segments.text) - 1) == 2
+
+    assert segments.time_at_offset(-1) == 0.0
+    assert segments.time_at_offset(second_start) == 3.5
+    assert segments.time_at_offset(third_start) == 7.0
+
+
+def test_text_between_takes_segments_starting_in_the_window():
+    segments = _sample()
+
+    assert segments.text_between(0.0, 10.0) == segments.text
+    assert segments.text_between(0.0, 3.5) == "Hello there"
+    assert segments.text_between(3.5, 7.0) == "café naïve"
+    assert segments.text_between(3.5, 7.0001) == "café naïve last segment!"
+    assert segments.text_between(0.1, 3.5) == ""
+    assert segments.text_between(7.0, 7.0) == ""